@@ -9,9 +9,22 @@ from src.db.checkpointer import setup_checkpointer
 from src.db.connection import init_db, get_connection
 from src.db.session_store import SessionStore
 from src.db.channel_context_store import ChannelContextStore
+from src.db.approval_store import ApprovalStore
+from src.db.jira_operations import JiraOperationStore
+from src.db.llm_cache_store import LLMCacheStore
+from src.db.dedup_store import SlackDedupStore
+from src.db.message_archive_store import MessageArchiveStore
+from src.db.token_usage_store import TokenUsageStore
+from src.db.checkpoint_retention import run_retention_forever
 from src.health import start_health_server
-from src.slack.app import get_slack_app, start_socket_mode
-from src.slack.router import register_handlers
+from src.slack.app import (
+    get_slack_app,
+    start_socket_mode,
+    get_async_slack_app,
+    start_async_socket_mode,
+)
+from src.slack.router import register_handlers, register_async_handlers
+from src.slack.scheduler import get_background_loop
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,8 +47,30 @@ async def init_database() -> None:
         context_store = ChannelContextStore(conn)
         await context_store.create_tables()
 
+        await ApprovalStore(conn).create_tables()
+        await JiraOperationStore(conn).create_tables()
+        await MessageArchiveStore(conn).create_tables()
+
+        if get_settings().llm_cache_postgres:
+            await LLMCacheStore(conn).create_tables()
+
+        if get_settings().dedup_postgres:
+            await SlackDedupStore(conn).create_tables()
+
+        if get_settings().token_accounting_enabled:
+            await TokenUsageStore(conn).create_tables()
+
     logger.info("Database initialized")
 
+    # Compile the graph now rather than on the first turn (/ready waits for it)
+    from src.graph.graph import get_compiled_graph
+    await get_compiled_graph()
+
+    # Build shared LLM adapters on this loop (where turns will use them)
+    if get_settings().llm_adapter_warmup:
+        from src.llm.adapter_registry import warm_adapters
+        warm_adapters()
+
 
 def main() -> None:
     """Main entry point."""
@@ -45,12 +80,36 @@ def main() -> None:
     settings = get_settings()
     logger.info("Settings loaded")
 
-    # Initialize database
-    asyncio.run(init_database())
+    # Initialize database on the background loop that serves Slack events -
+    # the connection pool is bound to the event loop it was opened on
+    asyncio.run_coroutine_threadsafe(init_database(), get_background_loop()).result()
+
+    # Prune old checkpoints periodically (throttled batches, same loop/pool)
+    if settings.checkpoint_retention_enabled:
+        asyncio.run_coroutine_threadsafe(run_retention_forever(), get_background_loop())
+
+    # Flush LLM token usage rollups periodically (same loop/pool)
+    if settings.token_accounting_enabled:
+        from src.llm.accounting import run_token_accounting_forever
+        asyncio.run_coroutine_threadsafe(run_token_accounting_forever(), get_background_loop())
 
     # Start health server for Docker healthcheck
     start_health_server(port=8000)
 
+    if settings.slack_async_mode:
+        # AsyncApp runs on the background loop alongside the graph,
+        # connection pool and checkpointer
+        app = get_async_slack_app()
+        register_async_handlers(app)
+
+        logger.info("MARO bot ready (async Slack mode)")
+
+        # Start async Socket Mode (blocks until the handler stops)
+        asyncio.run_coroutine_threadsafe(
+            start_async_socket_mode(), get_background_loop()
+        ).result()
+        return
+
     # Initialize Slack app and register handlers
     app = get_slack_app()
     register_handlers(app)
@@ -60,6 +119,5 @@ def main() -> None:
     # Start Socket Mode (blocking)
     start_socket_mode()
 
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,23 @@
+"""Offline replay benchmark for end-to-end turn performance.
+
+Plays scripted conversations through the graph runner and skill
+dispatcher with a deterministic LLM, fake Slack/Jira clients and a local
+Postgres checkpointer, and reports latency percentiles, throughput, LLM
+calls per turn and checkpoint bytes per turn as JSON.
+
+Usage:
+    python -m src.benchmark --sessions 20 --output bench.json
+
+    from src.benchmark import BenchmarkConfig, run_benchmark
+    results = await run_benchmark(BenchmarkConfig(sessions=20))
+"""
+from src.benchmark.harness import BenchmarkConfig, compare_results, run_benchmark
+from src.benchmark.scenarios import DEFAULT_CONVERSATIONS, load_conversations
+
+__all__ = [
+    "BenchmarkConfig",
+    "run_benchmark",
+    "compare_results",
+    "DEFAULT_CONVERSATIONS",
+    "load_conversations",
+]
@@ -0,0 +1,61 @@
+"""Command line entry point for the turn benchmark.
+
+Usage:
+    python -m src.benchmark --sessions 20 --output bench.json
+    python -m src.benchmark --sessions 50 --llm-latency-ms 300 \\
+        --baseline bench-main.json --output bench-branch.json
+
+Needs DATABASE_URL pointing at a disposable local Postgres; everything
+else (LLM, Slack, Jira) is faked.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from src.benchmark.harness import BenchmarkConfig, compare_results, run_benchmark
+from src.benchmark.scenarios import DEFAULT_CONVERSATIONS, load_conversations
+
+
+def main() -> int:
+    """Run the benchmark and write/print JSON results."""
+    parser = argparse.ArgumentParser(description="Offline end-to-end turn benchmark")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--conversations", help="JSON file with scripted conversations")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated LLM latency")
+    parser.add_argument("--llm-cache", action="store_true", help="Keep the LLM response cache on")
+    parser.add_argument("--keep-data", action="store_true", help="Keep benchmark checkpoints")
+    parser.add_argument("--label", default="", help="Tag stored with the results")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    config = BenchmarkConfig(
+        sessions=args.sessions,
+        conversations=(
+            load_conversations(args.conversations) if args.conversations else DEFAULT_CONVERSATIONS
+        ),
+        llm_latency_ms=args.llm_latency_ms,
+        llm_cache=args.llm_cache,
+        keep_data=args.keep_data,
+        label=args.label,
+    )
+    results = asyncio.run(run_benchmark(config))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        results["comparison"] = compare_results(baseline, results)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
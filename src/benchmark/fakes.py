@@ -0,0 +1,267 @@
+"""Deterministic stand-ins for the LLM, Slack and Jira in benchmark runs.
+
+- ScriptedLLMAdapter answers the extraction and validation prompts from
+  the prompt text itself (so drafts fill up the same way on every run)
+  and returns "{}" / minimal structured objects for everything else
+- FakeSlackClient accepts any Web API call and returns an ok response
+- FakeJiraService returns no duplicate matches
+
+install_fakes() swaps them in for the duration of a run.
+"""
+import asyncio
+import itertools
+import json
+import re
+import types
+import typing
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterator, Literal, Union
+
+from pydantic import BaseModel
+
+from src.llm.adapters.base import BaseAdapter, ToolDefinition
+from src.llm.types import LLMConfig, LLMResult, Message, TokenUsage
+
+
+@dataclass
+class LLMCallStats:
+    """Calls made to the scripted LLM (shared by all adapter instances)."""
+
+    calls: int = 0
+    by_prompt: dict[str, int] = field(default_factory=dict)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def record(self, kind: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self.calls += 1
+        self.by_prompt[kind] = self.by_prompt.get(kind, 0) + 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+
+def _between(text: str, start: str, end: str) -> str:
+    """Text between two markers ("" if not found)."""
+    match = re.search(re.escape(start) + r"(.*?)" + re.escape(end), text, re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def _extract_reply(prompt: str) -> str:
+    """Answer EXTRACTION_PROMPT from 'Title:', 'Problem:', 'AC:', 'Risk:' lines."""
+    try:
+        draft = json.loads(_between(prompt, "Current draft state:", "New message to process:"))
+    except ValueError:
+        draft = {}
+    message = _between(prompt, "New message to process:", "JSON response:")
+
+    fields: dict[str, Any] = {}
+    for line in message.splitlines():
+        key, _, value = line.partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if not value:
+            continue
+        if key == "title":
+            fields["title"] = value
+        elif key == "problem":
+            fields["problem"] = value
+        elif key == "solution":
+            fields["proposed_solution"] = value
+        elif key == "ac":
+            fields.setdefault("acceptance_criteria", []).append(value)
+        elif key == "risk":
+            fields.setdefault("risks", []).append(value)
+
+    # Unstructured first message: use it as the problem statement
+    if not fields and not draft.get("problem") and len(message) > 20:
+        fields["problem"] = message
+    return json.dumps(fields)
+
+
+def _validate_reply(prompt: str) -> str:
+    """Answer VALIDATION_PROMPT with the same checks as rule-based validation."""
+    try:
+        draft = json.loads(_between(prompt, "Draft:", "JSON response:"))
+    except ValueError:
+        draft = {}
+    missing = [
+        name for name in ("title", "problem", "acceptance_criteria") if not draft.get(name)
+    ]
+    return json.dumps({
+        "is_valid": not missing,
+        "missing_fields": missing,
+        "conflicts": [],
+        "suggestions": [],
+        "quality_score": 100 - 30 * len(missing),
+    })
+
+
+# (marker in prompt, kind, responder)
+_RESPONDERS = (
+    ("extracting requirements from a conversation", "extraction", _extract_reply),
+    ("validating a Jira ticket draft", "validation", _validate_reply),
+)
+
+
+def _minimal_value(annotation: Any) -> Any:
+    """Smallest valid value for a type annotation."""
+    origin = typing.get_origin(annotation)
+    if origin in (list, set, tuple):
+        return []
+    if origin is dict:
+        return {}
+    if origin is Literal:
+        return typing.get_args(annotation)[0]
+    if origin in (Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _minimal_value(args[0]) if args else None
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return minimal_instance(annotation).model_dump()
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return False
+        if issubclass(annotation, (int, float)):
+            return annotation(0)
+        if issubclass(annotation, str):
+            return ""
+    return None
+
+
+def minimal_instance(schema: type[BaseModel]) -> BaseModel:
+    """Build a schema instance with only required fields, minimally filled."""
+    data = {
+        name: _minimal_value(info.annotation)
+        for name, info in schema.model_fields.items()
+        if info.is_required()
+    }
+    return schema.model_validate(data)
+
+
+class ScriptedLLMAdapter(BaseAdapter):
+    """In-process deterministic adapter with optional simulated latency."""
+
+    def __init__(self, config: LLMConfig, stats: LLMCallStats, latency_ms: float = 0.0):
+        super().__init__(config)
+        self.stats = stats
+        self.latency_ms = latency_ms
+
+    async def invoke(
+        self,
+        messages: list[Message],
+        tools: list[ToolDefinition] | None = None,
+        response_schema: type[BaseModel] | None = None,
+    ) -> LLMResult:
+        prompt = "\n".join(m.content for m in messages)
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        raw = None
+        kind = "other"
+        text = "{}"
+        if response_schema is not None:
+            kind = f"schema:{response_schema.__name__}"
+            raw = minimal_instance(response_schema)
+            text = ""
+        else:
+            for marker, name, responder in _RESPONDERS:
+                if marker in prompt:
+                    kind, text = name, responder(prompt)
+                    break
+
+        usage = TokenUsage(
+            prompt_tokens=len(prompt) // 4,
+            completion_tokens=len(text) // 4,
+            total_tokens=(len(prompt) + len(text)) // 4,
+        )
+        self.stats.record(kind, usage.prompt_tokens, usage.completion_tokens)
+        result = self.parse_response(text, self.latency_ms)
+        result.usage = usage
+        result.raw = raw
+        return result
+
+    def convert_messages(self, messages: list[Message]) -> Any:
+        return messages
+
+    def parse_response(self, response: Any, latency_ms: float) -> LLMResult:
+        return LLMResult(
+            text=response,
+            provider=self.config.provider,
+            model=self.config.model,
+            latency_ms=latency_ms,
+        )
+
+
+class FakeSlackClient:
+    """Async Slack client that accepts every Web API call.
+
+    Returns {"ok": True, "ts": ..., "channel": ...}; calls are counted by
+    method name.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self._ts = itertools.count(1)
+
+    def __getattr__(self, method: str):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        async def call(**kwargs: Any) -> dict[str, Any]:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            return {
+                "ok": True,
+                "ts": f"{next(self._ts)}.000100",
+                "channel": kwargs.get("channel"),
+                "permalink": "https://slack.invalid/archives/bench",
+            }
+
+        return call
+
+
+class FakeJiraService:
+    """JiraService stand-in: searches find nothing, nothing is created."""
+
+    def __init__(self, settings: Any = None) -> None:
+        self.settings = settings
+
+    async def search_issues(self, jql: str, limit: int = 5) -> list:
+        return []
+
+    async def close(self) -> None:
+        pass
+
+
+@contextmanager
+def install_fakes(
+    stats: LLMCallStats,
+    llm_latency_ms: float = 0.0,
+    llm_cache: bool = False,
+) -> Iterator[None]:
+    """Route LLM and Jira calls to the fakes for the duration of the block.
+
+    Args:
+        stats: Collects LLM call counts
+        llm_latency_ms: Simulated latency per LLM call
+        llm_cache: Keep the LLM response cache on (off by default, so
+            repeated scripts measure real work)
+    """
+    import src.jira.client as jira_client
+    import src.llm.adapter_registry as adapter_registry
+    from src.config import get_settings
+
+    settings = get_settings()
+    saved = (adapter_registry.create_adapter, jira_client.JiraService, settings.llm_cache_enabled)
+
+    adapter_registry.create_adapter = lambda config: ScriptedLLMAdapter(
+        config, stats, llm_latency_ms
+    )
+    adapter_registry.clear_adapters()
+    jira_client.JiraService = FakeJiraService
+    settings.llm_cache_enabled = llm_cache
+    try:
+        yield
+    finally:
+        adapter_registry.create_adapter, jira_client.JiraService, settings.llm_cache_enabled = saved
+        adapter_registry.clear_adapters()
@@ -0,0 +1,256 @@
+"""Offline end-to-end turn benchmark.
+
+Drives GraphRunner.run_with_message and SkillDispatcher.dispatch (the
+same steps as the Slack message handlers) over scripted conversations,
+with N sessions running concurrently against a local Postgres
+checkpointer. LLM, Slack and Jira are replaced by deterministic fakes,
+so results are comparable between versions.
+
+Reports turn latency percentiles, throughput, LLM calls per turn and
+checkpoint bytes per turn as a JSON-serializable dict.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from src.benchmark.fakes import FakeSlackClient, LLMCallStats, install_fakes
+from src.benchmark.scenarios import DEFAULT_CONVERSATIONS
+
+logger = logging.getLogger(__name__)
+
+BENCH_TEAM_ID = "bench"
+
+# Metrics compared by compare_results() (lower is better for all)
+COMPARED_METRICS = (
+    ("latency_ms", "p50"),
+    ("latency_ms", "p95"),
+    ("latency_ms", "p99"),
+    ("llm_calls_per_turn",),
+    ("checkpoint_bytes_per_turn",),
+)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark run parameters."""
+
+    sessions: int = 10  # Concurrent sessions (threads)
+    conversations: list[list[str]] = field(default_factory=lambda: DEFAULT_CONVERSATIONS)
+    llm_latency_ms: float = 0.0  # Simulated latency per LLM call
+    llm_cache: bool = False  # Keep the LLM response cache on
+    keep_data: bool = False  # Leave benchmark checkpoints in the database
+    label: str = ""  # Free-form tag stored with the results (e.g., git sha)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _dispatch(result: dict[str, Any], runner, client: FakeSlackClient) -> None:
+    """Dispatch a runner result like the Slack handlers do."""
+    from src.graph.nodes.decision import DecisionResult
+    from src.skills.dispatcher import SkillDispatcher
+
+    action = result.get("action")
+    dispatcher = SkillDispatcher(client, runner.identity)
+    if action == "ask":
+        pending = result.get("pending_questions") or {}
+        decision = DecisionResult(
+            action="ask",
+            questions=result.get("questions", []),
+            reason=result.get("reason", ""),
+            is_reask=pending.get("re_ask_count", 0) > 0,
+            reask_count=pending.get("re_ask_count", 0),
+        )
+        skill_result = await dispatcher.dispatch(decision, result.get("draft"))
+        if skill_result.get("success") and skill_result.get("pending_questions"):
+            await runner.store_pending_questions(skill_result["pending_questions"])
+    elif action == "preview" and result.get("draft"):
+        decision = DecisionResult(action="preview", reason=result.get("reason", ""))
+        await dispatcher.dispatch(decision, result["draft"])
+
+
+async def _run_session(
+    identity,
+    conversation: list[str],
+    client: FakeSlackClient,
+    latencies: list[float],
+    actions: dict[str, int],
+) -> None:
+    """Play one conversation, turn by turn."""
+    from src.graph.runner import GraphRunner
+
+    runner = GraphRunner(identity)
+    for text in conversation:
+        start = time.perf_counter()
+        result = await runner.run_with_message(text, "UBENCH")
+        await _dispatch(result, runner, client)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        action = result.get("action", "continue")
+        actions[action] = actions.get(action, 0) + 1
+
+
+async def _checkpoint_bytes(thread_prefix: str) -> int:
+    """Bytes stored in checkpoint tables for the benchmark threads."""
+    from src.db.connection import get_connection
+
+    total = 0
+    async with get_connection() as conn:
+        async with conn.cursor() as cur:
+            for table in ("checkpoints", "checkpoint_blobs", "checkpoint_writes"):
+                await cur.execute(
+                    f"SELECT COALESCE(SUM(pg_column_size(t.*)), 0) FROM {table} t "
+                    f"WHERE t.thread_id LIKE %s",
+                    (thread_prefix + "%",),
+                )
+                row = await cur.fetchone()
+                total += int(row[0]) if row else 0
+    return total
+
+
+async def _setup_database() -> None:
+    """Open the pool and create the tables a turn touches."""
+    from src.db import (
+        ApprovalStore,
+        ChannelContextStore,
+        JiraOperationStore,
+        MessageArchiveStore,
+        get_connection,
+        init_db,
+        setup_checkpointer,
+    )
+
+    await init_db()
+    await setup_checkpointer()
+    async with get_connection() as conn:
+        await ChannelContextStore(conn).create_tables()
+        await ApprovalStore(conn).create_tables()
+        await JiraOperationStore(conn).create_tables()
+        await MessageArchiveStore(conn).create_tables()
+
+
+async def _cleanup(session_ids: list[str]) -> None:
+    """Delete the benchmark sessions' checkpoints and archived messages."""
+    from src.db.checkpoint_retention import CheckpointRetentionStore
+    from src.db.connection import get_connection
+
+    async with get_connection() as conn:
+        store = CheckpointRetentionStore(conn)
+        for session_id in session_ids:
+            await store.drop_thread(session_id)
+
+
+async def run_benchmark(config: Optional[BenchmarkConfig] = None) -> dict[str, Any]:
+    """Run the benchmark and return results.
+
+    Requires DATABASE_URL to point at a local (disposable) Postgres.
+
+    Args:
+        config: Run parameters (defaults if None)
+
+    Returns:
+        Results dict (see module docstring), JSON-serializable
+    """
+    from src.db import close_db
+    from src.slack.session import SessionIdentity
+
+    config = config or BenchmarkConfig()
+    run_id = uuid.uuid4().hex[:8]
+    channel_id = f"CBENCH{run_id}"
+    identities = [
+        SessionIdentity(team_id=BENCH_TEAM_ID, channel_id=channel_id, thread_ts=f"{i}.{run_id}")
+        for i in range(config.sessions)
+    ]
+
+    stats = LLMCallStats()
+    client = FakeSlackClient()
+    latencies: list[float] = []
+    actions: dict[str, int] = {}
+
+    await _setup_database()
+    try:
+        with install_fakes(stats, config.llm_latency_ms, config.llm_cache):
+            start = time.perf_counter()
+            outcomes = await asyncio.gather(
+                *(
+                    _run_session(
+                        identity,
+                        config.conversations[i % len(config.conversations)],
+                        client,
+                        latencies,
+                        actions,
+                    )
+                    for i, identity in enumerate(identities)
+                ),
+                return_exceptions=True,
+            )
+            wall_s = time.perf_counter() - start
+
+        errors = [repr(o) for o in outcomes if isinstance(o, BaseException)]
+        checkpoint_bytes = await _checkpoint_bytes(f"{BENCH_TEAM_ID}:{channel_id}:")
+        if not config.keep_data:
+            await _cleanup([identity.session_id for identity in identities])
+    finally:
+        await close_db()
+
+    turns = len(latencies)
+    ordered = sorted(latencies)
+    config_data = asdict(config)
+    config_data["conversations"] = len(config.conversations)
+    return {
+        "label": config.label,
+        "run_id": run_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": config_data,
+        "turns": turns,
+        "wall_time_s": round(wall_s, 3),
+        "throughput_turns_per_s": round(turns / wall_s, 2) if wall_s else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50), 2),
+            "p95": round(percentile(ordered, 95), 2),
+            "p99": round(percentile(ordered, 99), 2),
+            "mean": round(sum(ordered) / turns, 2) if turns else 0.0,
+            "max": round(ordered[-1], 2) if ordered else 0.0,
+        },
+        "llm_calls_per_turn": round(stats.calls / turns, 3) if turns else 0.0,
+        "llm_calls_by_prompt": stats.by_prompt,
+        "llm_tokens": {"prompt": stats.prompt_tokens, "completion": stats.completion_tokens},
+        "checkpoint_bytes_per_turn": round(checkpoint_bytes / turns) if turns else 0,
+        "slack_calls": client.calls,
+        "actions": actions,
+        "errors": errors,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+) -> dict[str, dict[str, float]]:
+    """Compare two result dicts on the tracked metrics.
+
+    Returns:
+        {metric: {"baseline", "current", "change_pct"}}; positive change
+        means slower / more expensive.
+    """
+    comparison = {}
+    for path in COMPARED_METRICS:
+        before, after = baseline, current
+        for key in path:
+            before = before.get(key, 0) if isinstance(before, dict) else 0
+            after = after.get(key, 0) if isinstance(after, dict) else 0
+        change = ((after - before) / before * 100) if before else 0.0
+        comparison[".".join(path)] = {
+            "baseline": before,
+            "current": after,
+            "change_pct": round(change, 1),
+        }
+    return comparison
@@ -0,0 +1,59 @@
+"""Scripted conversations for benchmark runs.
+
+Each conversation is a list of user messages sent to one thread in order.
+The scripted LLM reads 'Title:', 'Problem:', 'Solution:', 'AC:' and
+'Risk:' lines (see fakes.ScriptedLLMAdapter), so these scripts walk
+drafts through intro/ask/preview the same way on every run.
+
+Custom scripts can be loaded from a JSON file: a list of conversations,
+each a list of message strings.
+"""
+import json
+from pathlib import Path
+
+DEFAULT_CONVERSATIONS: list[list[str]] = [
+    # Structured, reaches preview quickly
+    [
+        "Title: Export audit log as CSV\n"
+        "Problem: Compliance needs the audit log offline every month",
+        "AC: Admins can download the last 90 days as CSV\n"
+        "AC: Export includes actor, action and timestamp",
+        "Solution: Add an export endpoint that streams rows from the audit table",
+        "Risk: Large tenants may time out on export",
+    ],
+    # Vague start, converges and gets asked for details
+    [
+        "hey",
+        "We keep losing track of which customers asked for SSO and it is getting messy",
+        "not sure yet",
+        "Title: Track SSO requests per customer",
+        "AC: Sales can tag an account as requesting SSO\nAC: A report lists tagged accounts",
+    ],
+    # Long thread with chit-chat (exercises the message window)
+    [
+        "Problem: Mobile push notifications arrive minutes late on Android",
+        "Title: Fix delayed Android push notifications",
+        "it mostly happens on Samsung devices",
+        "also when battery saver is on",
+        "AC: 95% of pushes arrive within 10 seconds",
+        "ok",
+        "thanks",
+        "Risk: Changing the FCM priority may increase battery drain",
+        "any update?",
+        "AC: No regression on iOS delivery times",
+    ],
+]
+
+
+def load_conversations(path: str | Path) -> list[list[str]]:
+    """Load conversations from a JSON file.
+
+    Raises:
+        ValueError: If the file is not a list of lists of strings.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, list) or not all(
+        isinstance(conv, list) and all(isinstance(m, str) for m in conv) for conv in data
+    ):
+        raise ValueError(f"{path}: expected a list of conversations (lists of strings)")
+    return data
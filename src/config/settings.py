@@ -1,6 +1,6 @@
 """Settings configuration using pydantic-settings."""
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Any, Optional
 
 
 class Settings(BaseSettings):
@@ -18,11 +18,16 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql://localhost:5432/jira_analyst"
+    db_pool_min_size: int = 2  # Connections kept open at all times
+    db_pool_max_size: int = 20  # Upper bound, shared by stores and checkpointer
+    db_pool_max_idle: float = 300.0  # Seconds before an idle extra connection is closed
+    db_pool_timeout: float = 10.0  # Seconds to wait for a free connection
 
     # Slack
     slack_bot_token: str
     slack_app_token: str  # For Socket Mode
     slack_signing_secret: Optional[str] = None
+    slack_async_mode: bool = False  # AsyncApp on the shared loop (False: sync App + threads)
 
     # Jira
     jira_url: str
@@ -39,11 +44,109 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = None  # For OpenAI (optional)
     anthropic_api_key: Optional[str] = None  # For Anthropic (optional)
     default_llm_model: str = "gemini-3-flash-preview"
+    llm_adapter_warmup: bool = True  # Build the shared adapters for every routed task at startup
+    fused_turn_mode: bool = False  # One structured call for extraction, validation, answer matching
+
+    # LLM response cache
+    llm_cache_enabled: bool = True  # Master switch (temperature 0 calls cached by default)
+    llm_cache_max_entries: int = 1000  # In-memory LRU size
+    llm_cache_ttl_seconds: float = 3600.0  # Entry lifetime (both tiers)
+    llm_cache_postgres: bool = False  # Share cached responses across workers via Postgres
+
+    # Provider prompt-prefix caching (static system prompts)
+    llm_prompt_caching: bool = True  # Anthropic cache_control breakpoints on cache_prefix messages
+    llm_gemini_cached_contents: bool = True  # Explicit cached contents for long system prompts
+    llm_gemini_cache_min_tokens: int = 4096  # Shorter prompts rely on Gemini implicit caching
+    llm_gemini_cache_ttl_seconds: int = 3600  # Cached content lifetime (recreated before expiry)
+    llm_gemini_cache_max_entries: int = 16  # Cached contents kept per API key (LRU, billed storage)
+
+    # Client-side LLM rate limiting (per provider/model)
+    llm_rate_limit_enabled: bool = True  # Token buckets + AIMD concurrency in front of adapters
+    llm_rate_limit_rpm: float = 0.0  # Default requests per minute (0 = unlimited)
+    llm_rate_limit_tpm: float = 0.0  # Default tokens per minute (0 = unlimited)
+    llm_max_concurrency: int = 16  # Starting/max in-flight calls (halved on 429s)
+    llm_rate_limits: dict[str, dict[str, float]] = {}  # By provider/model: rpm, tpm, concurrency
+    llm_rate_limit_max_wait_seconds: float = 20.0  # Queueing deadline per call
+    llm_rate_limit_max_retries: int = 2  # Retries after a 429 (within the deadline)
+
+    # Task-based model routing (see src.llm.routing.DEFAULT_ROUTES)
+    llm_routes: dict[str, dict[str, Any]] = {}  # Per task: model, temperature, max_tokens, ...
+    llm_model_prices: dict[str, dict[str, float]] = {}  # USD/1M tokens: {model: {input, output}}
+
+    # Token accounting and prompt-size guardrails
+    token_accounting_enabled: bool = True  # Usage per team/session/task/model (llm_token_usage)
+    token_accounting_flush_seconds: float = 60.0  # How often usage rollups are written to Postgres
+    prompt_guardrails_enabled: bool = True  # Truncate inputs over the task's prompt_budget_tokens
+
+    # Fallback / hedged requests across providers
+    llm_fallback_models: list[str] = []  # Backup models in order, e.g. ["gpt-4o-mini"]
+    llm_resilience_default: str = "fallback"  # off | fallback | hedge (call sites may override)
+    llm_hedge_percentile: float = 0.9  # Hedge once the primary is slower than this percentile
+    llm_hedge_min_samples: int = 20  # Observed calls needed before the percentile is used
+    llm_hedge_default_delay_ms: float = 3000.0  # Hedge delay until then
+    llm_hedge_min_delay_ms: float = 500.0  # Never hedge sooner than this
+
+    # Record/replay LLM adapter (load testing without provider calls)
+    llm_replay_mode: Optional[str] = None  # record | replay (None = call providers normally)
+    llm_replay_dir: str = "llm_recordings"  # One JSON file per recorded request
+    llm_replay_latency_ms: Optional[float] = None  # Simulated base latency (None = recorded)
+    llm_replay_jitter: str = "none"  # none | uniform | normal | exponential
+    llm_replay_jitter_ms: float = 0.0  # Spread: uniform +/-, normal stddev, exponential mean
+    llm_replay_error_rate: float = 0.0  # Fraction of replayed calls that fail
+    llm_replay_seed: Optional[int] = None  # Fixed seed for reproducible jitter/errors
+
+    # Per-session registries (graph runners, session locks)
+    session_registry_max_size: int = 10000  # LRU limit per registry
+    session_registry_idle_ttl_seconds: float = 86400.0  # Evict sessions idle this long
+    session_presence_cache_seconds: float = 60.0  # Cache "thread has a checkpoint" lookups
+
+    # Distributed session lock (Postgres advisory lock, for multiple replicas)
+    session_lock_distributed: bool = False  # One turn per thread across all replicas
+    session_lock_wait_timeout_seconds: float = 30.0  # Max wait for another replica's turn
+    session_lock_lease_seconds: float = 30.0  # Lock dropped this long after renewals stop
+    session_lock_max_hold_seconds: float = 300.0  # Stop renewing after this (hung turn)
+    session_lock_pool_size: int = 16  # Dedicated lock connections (>= scheduler_max_concurrency)
+
+    # Rolling message window (older messages move to message_archive)
+    message_window_size: int = 20  # Messages kept inline in graph state (0 = unbounded)
+    message_summary_max_chars: int = 2000  # Rolling summary of archived messages
+
+    # Checkpoint retention (LangGraph checkpoint tables)
+    checkpoint_retention_enabled: bool = True  # Run the retention job in the background
+    checkpoint_retention_interval_hours: float = 6.0  # Time between runs
+    checkpoint_keep_latest: int = 5  # Checkpoints kept per thread
+    checkpoint_ticket_retention_days: int = 30  # Drop sessions whose ticket is older (0 = never)
+    checkpoint_retention_batch_size: int = 100  # Threads per batch
+    checkpoint_retention_batch_pause_seconds: float = 1.0  # Pause between batches
+
+    # Slack event/button dedup
+    dedup_max_entries: int = 10000  # Hard cap per in-memory store (oldest dropped)
+    dedup_postgres: bool = False  # Share dedup keys across replicas (UNLOGGED table)
+
+    # Persona validators (run concurrently)
+    validator_timeout_seconds: float = 5.0  # Per validator
+    validator_deadline_seconds: float = 10.0  # All validators; partial findings after this
+    validator_llm_concurrency: int = 3  # Max LLM-backed validators running at once
 
     # Zep (semantic memory)
     zep_api_url: str = "http://localhost:8000"
     zep_api_key: Optional[str] = None  # Optional for local dev
 
+    # Work scheduler (Slack event processing)
+    scheduler_max_queue_size: int = 200  # Admitted but not yet running
+    scheduler_max_concurrency: int = 16  # Running at once, all teams
+    scheduler_per_team_concurrency: int = 4  # Running at once, one team
+    scheduler_action_reserve: int = 20  # Queue slots reserved for button clicks
+
+    # Health server
+    ready_cache_seconds: float = 5.0  # Reuse /ready results this long
+    ready_check_timeout_seconds: float = 3.0  # Postgres/checkpointer check timeout
+
+    # Turn tracing (src.tracing)
+    tracing_enabled: bool = True  # Per-turn span trees (nodes, LLM, DB, checkpoints, Jira)
+    tracing_slowest_turns: int = 50  # Slowest turns kept in memory
+    tracing_export_path: Optional[str] = None  # Append finished turns as JSONL (None = off)
+
     # Logging
     log_level: str = "INFO"
 
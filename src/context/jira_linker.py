@@ -7,6 +7,7 @@ from slack_sdk import WebClient
 
 from src.jira.client import JiraService
 from src.config.settings import get_settings
+from src.slack.api import call_slack
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,7 @@ class JiraLinker:
         epic_url = f"{settings.jira_url}/browse/{epic_key}"
 
         # Post summary message
-        result = self._slack.chat_postMessage(
+        result = await call_slack(self._slack.chat_postMessage,
             channel=channel_id,
             thread_ts=thread_ts,
             text=f":dart: *Epic:* <{epic_url}|{epic_key}> - {epic_summary}",
@@ -67,7 +68,7 @@ class JiraLinker:
 
         # Pin the message
         try:
-            self._slack.pins_add(channel=channel_id, timestamp=message_ts)
+            await call_slack(self._slack.pins_add, channel=channel_id, timestamp=message_ts)
         except Exception as e:
             logger.warning(f"Failed to pin epic message: {e}")
 
@@ -103,7 +104,7 @@ class JiraLinker:
         if existing_pin_ts:
             # Update existing message
             try:
-                self._slack.chat_update(
+                await call_slack(self._slack.chat_update,
                     channel=channel_id,
                     ts=existing_pin_ts,
                     text=f":white_check_mark: *Ticket Created:* <{ticket_url}|{ticket_key}>",
@@ -114,7 +115,7 @@ class JiraLinker:
 
         if not existing_pin_ts:
             # Post new pinned message
-            result = self._slack.chat_postMessage(
+            result = await call_slack(self._slack.chat_postMessage,
                 channel=channel_id,
                 thread_ts=thread_ts,
                 text=f":white_check_mark: *Ticket Created:* <{ticket_url}|{ticket_key}>",
@@ -122,7 +123,7 @@ class JiraLinker:
             message_ts = result["ts"]
 
             try:
-                self._slack.pins_add(channel=channel_id, timestamp=message_ts)
+                await call_slack(self._slack.pins_add, channel=channel_id, timestamp=message_ts)
             except Exception as e:
                 logger.warning(f"Failed to pin ticket message: {e}")
 
@@ -135,13 +136,13 @@ class JiraLinker:
             pin_ts=existing_pin_ts,
         )
 
-    def get_thread_permalink(self, channel_id: str, thread_ts: str) -> str:
+    async def get_thread_permalink(self, channel_id: str, thread_ts: str) -> str:
         """Get Slack permalink for a thread.
 
         Used when creating Jira ticket to store link back to Slack.
         """
         try:
-            result = self._slack.chat_getPermalink(
+            result = await call_slack(self._slack.chat_getPermalink,
                 channel=channel_id,
                 message_ts=thread_ts,
             )
@@ -1,6 +1,7 @@
 """Pin content extraction and processing for Channel Knowledge layer."""
 
 import hashlib
+import json
 import logging
 from dataclasses import dataclass
 from typing import Optional
@@ -9,6 +10,7 @@ from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from src.db.models import ChannelKnowledge
+from src.slack.api import call_slack
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,27 @@ class PinInfo:
     pinned_at: Optional[str] = None
 
 
+def _parse_knowledge_json(text: str) -> dict:
+    """Parse the extraction JSON answer (optionally in a markdown code block).
+
+    Raises:
+        json.JSONDecodeError: If the answer is not valid JSON.
+    """
+    response_text = text.strip()
+    if response_text.startswith("```"):
+        # Remove markdown code blocks
+        lines = response_text.split("\n")
+        # Find first and last ``` and extract content between
+        start_idx = 1 if lines[0].startswith("```") else 0
+        end_idx = len(lines) - 1
+        for i in range(len(lines) - 1, -1, -1):
+            if lines[i].strip() == "```":
+                end_idx = i
+                break
+        response_text = "\n".join(lines[start_idx:end_idx])
+    return json.loads(response_text)
+
+
 class PinExtractor:
     """Extracts and processes pinned messages for channel knowledge.
 
@@ -59,7 +82,7 @@ class PinExtractor:
 
         try:
             # pins.list returns all pins (no pagination needed, typically < 100)
-            response = self._client.pins_list(channel=channel_id)
+            response = await call_slack(self._client.pins_list, channel=channel_id)
 
             items = response.get("items", [])
 
@@ -134,31 +157,26 @@ class PinExtractor:
             for i, p in enumerate(pins[:10])  # Max 10 pins
         )
 
-        from src.llm.client import get_llm
+        from src.llm.cache import cache_if_parses
+        from src.llm.guardrails import PromptBudget
+        from src.llm.routing import get_llm_for_task
 
         try:
-            llm = get_llm()
+            llm = get_llm_for_task("pin_extraction")
+            budget = PromptBudget.for_task(
+                "pin_extraction", EXTRACTION_SYSTEM_PROMPT + EXTRACTION_PROMPT
+            )
+            pin_content = budget.fit_text("pin_content", pin_content)
             prompt = EXTRACTION_PROMPT.format(pin_content=pin_content)
-            result = await llm.chat(prompt)
-
-            # Parse JSON response
-            import json
-
-            # Handle potential markdown code blocks in response
-            response_text = result.strip()
-            if response_text.startswith("```"):
-                # Remove markdown code blocks
-                lines = response_text.split("\n")
-                # Find first and last ``` and extract content between
-                start_idx = 1 if lines[0].startswith("```") else 0
-                end_idx = len(lines) - 1
-                for i in range(len(lines) - 1, -1, -1):
-                    if lines[i].strip() == "```":
-                        end_idx = i
-                        break
-                response_text = "\n".join(lines[start_idx:end_idx])
-
-            data = json.loads(response_text)
+            # Deterministic route, so cached (same pins across workers);
+            # only answers that parse are stored
+            result = await llm.chat(
+                prompt,
+                system_message=EXTRACTION_SYSTEM_PROMPT,
+                resilience="fallback",  # Background work: no hedging
+                cache_if=cache_if_parses(_parse_knowledge_json),
+            )
+            data = _parse_knowledge_json(result)
 
             return ChannelKnowledge(
                 naming_convention=data.get("naming_convention"),
@@ -173,11 +191,10 @@ class PinExtractor:
             return ChannelKnowledge(source_pin_ids=[p.pin_id for p in pins])
 
 
-# LLM prompt for knowledge extraction
-EXTRACTION_PROMPT = """Analyze these pinned messages from a Slack channel and extract any team rules or conventions.
-
-PINNED MESSAGES:
-{pin_content}
+# LLM prompt for knowledge extraction: static instructions first (provider
+# prompt-cache prefix), pin content last
+EXTRACTION_SYSTEM_PROMPT = """Analyze the pinned messages from a Slack channel you are given
+and extract any team rules or conventions.
 
 Extract the following if present (leave null if not found):
 - naming_convention: How the team names things (tickets, branches, PRs)
@@ -186,11 +203,14 @@ Extract the following if present (leave null if not found):
 - custom_rules: Any other rules or conventions mentioned
 
 Respond in JSON format:
-{{
+{
   "naming_convention": "string or null",
   "definition_of_done": "string or null",
   "api_format_rules": "string or null",
-  "custom_rules": {{"rule_name": "rule_description"}}
-}}
+  "custom_rules": {"rule_name": "rule_description"}
+}
 
 Only extract explicit rules. Don't infer or guess."""
+
+EXTRACTION_PROMPT = """PINNED MESSAGES:
+{pin_content}"""
@@ -1,6 +1,6 @@
 """Database module for PostgreSQL connectivity and LangGraph state persistence.
 
-Provides async database connection utilities using psycopg v3,
+Provides a pooled async database connection via psycopg v3 / psycopg_pool,
 LangGraph checkpointer for agent state persistence, session storage
 for thread-to-ticket mapping, and approval records for idempotency.
 
@@ -38,7 +38,7 @@ Usage:
     await close_db()
 """
 from src.db.checkpointer import get_checkpointer, setup_checkpointer
-from src.db.connection import close_db, get_connection, init_db
+from src.db.connection import close_db, get_connection, get_pool, get_pool_stats, init_db
 from src.db.models import (
     ChannelActivitySnapshot,
     ChannelConfig,
@@ -52,12 +52,31 @@ from src.db.approval_store import ApprovalStore, ApprovalRecord
 from src.db.jira_operations import JiraOperationStore, JiraOperationRecord
 from src.db.channel_context_store import ChannelContextStore
 from src.db.root_index_store import RootIndexStore
+from src.db.llm_cache_store import LLMCacheStore
+from src.db.dedup_store import SlackDedupStore
+from src.db.message_archive_store import MessageArchiveStore
+from src.db.session_lock import (
+    SessionLease,
+    SessionLockLost,
+    SessionLockTimeout,
+    advisory_session_lock,
+    check_current_lease,
+    get_advisory_lock_stats,
+)
+from src.db.token_usage_store import TokenUsageStore, TokenUsageRollup
+from src.db.checkpoint_retention import (
+    CheckpointRetentionStore,
+    RetentionReport,
+    run_checkpoint_retention,
+)
 
 __all__ = [
     # Connection (02-01)
     "get_connection",
     "init_db",
     "close_db",
+    "get_pool",
+    "get_pool_stats",
     # Checkpointer (02-02)
     "get_checkpointer",
     "setup_checkpointer",
@@ -80,4 +99,24 @@ __all__ = [
     "ChannelContextStore",
     # Root Index Store (08-03)
     "RootIndexStore",
+    # LLM response cache
+    "LLMCacheStore",
+    # Slack dedup (shared tier)
+    "SlackDedupStore",
+    # Message archive (rolling message window)
+    "MessageArchiveStore",
+    # Distributed session lock
+    "SessionLease",
+    "SessionLockLost",
+    "SessionLockTimeout",
+    "advisory_session_lock",
+    "check_current_lease",
+    "get_advisory_lock_stats",
+    # LLM token usage rollups
+    "TokenUsageStore",
+    "TokenUsageRollup",
+    # Checkpoint retention
+    "CheckpointRetentionStore",
+    "RetentionReport",
+    "run_checkpoint_retention",
 ]
@@ -0,0 +1,336 @@
+"""Checkpoint retention and compaction for the LangGraph Postgres tables.
+
+AsyncPostgresSaver writes a checkpoint after every node (extraction,
+validation, decision) on every turn and never deletes any of them. Only
+the latest checkpoint is read by aget_state, so this job:
+- Keeps the latest K checkpoints per thread and namespace (older ones,
+  their pending writes and channel blob versions older than any the kept
+  checkpoints reference are deleted)
+- Drops everything for sessions whose Jira ticket was created more than
+  N days ago (per jira_operations), including archived messages
+- Works in small batches with a pause in between, each batch on its own
+  pooled connection, so it never monopolises the database
+- Reports rows and bytes reclaimed
+
+Checkpoint ids are uuid6 (time ordered), so ordering by checkpoint_id
+gives the newest checkpoints.
+
+Usage:
+    from src.db.checkpoint_retention import run_checkpoint_retention
+
+    report = await run_checkpoint_retention()
+    logger.info("Retention done", extra=report.to_dict())
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from psycopg import AsyncConnection
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Tables owned by AsyncPostgresSaver
+CHECKPOINT_TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention run."""
+
+    threads_compacted: int = 0
+    sessions_dropped: int = 0
+    rows_deleted: dict[str, int] = field(default_factory=dict)
+    bytes_reclaimed: int = 0
+    batches: int = 0
+    duration_ms: float = 0.0
+
+    def add(self, table: str, rows: int, size: int) -> None:
+        """Account rows/bytes deleted from a table."""
+        self.rows_deleted[table] = self.rows_deleted.get(table, 0) + rows
+        self.bytes_reclaimed += size
+
+    @property
+    def total_rows(self) -> int:
+        """Rows deleted across all tables."""
+        return sum(self.rows_deleted.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Report as a dict (for logs and metrics)."""
+        return {
+            "threads_compacted": self.threads_compacted,
+            "sessions_dropped": self.sessions_dropped,
+            "rows_deleted": dict(self.rows_deleted),
+            "total_rows": self.total_rows,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "batches": self.batches,
+            "duration_ms": round(self.duration_ms, 1),
+        }
+
+
+class CheckpointRetentionStore:
+    """Retention queries against the LangGraph checkpoint tables.
+
+    Deletes return (rows, bytes), with bytes measured by pg_column_size of
+    the deleted rows (the space VACUUM can reuse).
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def _delete(self, sql: str, params: tuple) -> tuple[int, int]:
+        """Run a 'WITH deleted AS (DELETE ... RETURNING size)' statement."""
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, params)
+            row = await cur.fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    async def list_threads_over_limit(
+        self,
+        keep_latest: int,
+        limit: int,
+        after: str = "",
+    ) -> list[str]:
+        """Find threads with more than keep_latest checkpoints in a namespace.
+
+        Keyset-paged by thread_id: the scan walks the checkpoints primary
+        key (thread_id, checkpoint_ns, checkpoint_id) in order from
+        `after` and stops once `limit` namespaces over the limit are found,
+        so a full pass reads the table once.
+
+        Args:
+            keep_latest: Checkpoints to keep per thread and namespace
+            limit: Max namespaces to find (batch size)
+            after: Only threads sorting after this thread ID (cursor)
+
+        Returns:
+            Thread IDs in thread_id order
+        """
+        sql = """
+        SELECT thread_id FROM checkpoints
+        WHERE thread_id > %s
+        GROUP BY thread_id, checkpoint_ns
+        HAVING COUNT(*) > %s
+        ORDER BY thread_id
+        LIMIT %s;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (after, keep_latest, limit))
+            rows = await cur.fetchall()
+        # A thread with several namespaces over the limit appears once per namespace
+        return list(dict.fromkeys(row[0] for row in rows))
+
+    async def list_expired_sessions(self, older_than_days: int, limit: int) -> list[str]:
+        """Find sessions whose ticket was created more than N days ago.
+
+        Only sessions that still have checkpoints are returned.
+
+        Args:
+            older_than_days: Ticket age threshold
+            limit: Max sessions to return (batch size)
+
+        Returns:
+            Session IDs (= checkpoint thread IDs)
+        """
+        sql = """
+        SELECT DISTINCT j.session_id FROM jira_operations j
+        WHERE j.operation = 'jira_create'
+          AND j.status = 'success'
+          AND j.created_at < NOW() - make_interval(days => %s)
+          AND EXISTS (SELECT 1 FROM checkpoints c WHERE c.thread_id = j.session_id)
+        LIMIT %s;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (older_than_days, limit))
+            rows = await cur.fetchall()
+        return [row[0] for row in rows]
+
+    async def prune_thread(self, thread_id: str, keep_latest: int) -> dict[str, tuple[int, int]]:
+        """Delete all but the latest keep_latest checkpoints of a thread.
+
+        Args:
+            thread_id: Checkpoint thread ID
+            keep_latest: Checkpoints to keep (per namespace)
+
+        Returns:
+            {table: (rows, bytes)}
+        """
+        stale = """
+        SELECT checkpoint_ns, checkpoint_id FROM (
+            SELECT checkpoint_ns, checkpoint_id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY checkpoint_ns ORDER BY checkpoint_id DESC
+                   ) AS rn
+            FROM checkpoints WHERE thread_id = %s
+        ) ranked WHERE rn > %s
+        """
+        result = {
+            "checkpoint_writes": await self._delete(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM checkpoint_writes w
+                    WHERE w.thread_id = %s
+                      AND (w.checkpoint_ns, w.checkpoint_id) IN ({stale})
+                    RETURNING pg_column_size(w.*) AS size
+                )
+                SELECT COUNT(*), COALESCE(SUM(size), 0) FROM deleted;
+                """,
+                (thread_id, thread_id, keep_latest),
+            ),
+            "checkpoints": await self._delete(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM checkpoints c
+                    WHERE c.thread_id = %s
+                      AND (c.checkpoint_ns, c.checkpoint_id) IN ({stale})
+                    RETURNING pg_column_size(c.*) AS size
+                )
+                SELECT COUNT(*), COALESCE(SUM(size), 0) FROM deleted;
+                """,
+                (thread_id, thread_id, keep_latest),
+            ),
+            # Only blob versions older than every version the kept
+            # checkpoints reference. aput commits a new checkpoint's blobs
+            # before its checkpoints row, so "referenced by no checkpoint"
+            # would also match blobs of a checkpoint being written. Versions
+            # are zero-padded ("<counter>.<hash>"), so they sort as text;
+            # channels no kept checkpoint references (MIN is NULL) are kept.
+            "checkpoint_blobs": await self._delete(
+                """
+                WITH deleted AS (
+                    DELETE FROM checkpoint_blobs b
+                    WHERE b.thread_id = %s
+                      AND b.version < (
+                          SELECT MIN(c.checkpoint -> 'channel_versions' ->> b.channel)
+                          FROM checkpoints c
+                          WHERE c.thread_id = b.thread_id
+                            AND c.checkpoint_ns = b.checkpoint_ns
+                      )
+                    RETURNING pg_column_size(b.*) AS size
+                )
+                SELECT COUNT(*), COALESCE(SUM(size), 0) FROM deleted;
+                """,
+                (thread_id,),
+            ),
+        }
+        await self.conn.commit()
+        return result
+
+    async def drop_thread(self, thread_id: str) -> dict[str, tuple[int, int]]:
+        """Delete every checkpoint row and archived message of a session.
+
+        Args:
+            thread_id: Checkpoint thread ID (session ID)
+
+        Returns:
+            {table: (rows, bytes)}
+        """
+        result = {}
+        for table in CHECKPOINT_TABLES + ("message_archive",):
+            key_column = "session_id" if table == "message_archive" else "thread_id"
+            result[table] = await self._delete(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM {table} t WHERE t.{key_column} = %s
+                    RETURNING pg_column_size(t.*) AS size
+                )
+                SELECT COUNT(*), COALESCE(SUM(size), 0) FROM deleted;
+                """,
+                (thread_id,),
+            )
+        await self.conn.commit()
+        return result
+
+
+async def run_checkpoint_retention(
+    keep_latest: Optional[int] = None,
+    ticket_retention_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    batch_pause_seconds: Optional[float] = None,
+) -> RetentionReport:
+    """Run one retention pass (defaults from settings).
+
+    Args:
+        keep_latest: Checkpoints kept per thread
+        ticket_retention_days: Drop sessions whose ticket is older than this
+            (0 disables dropping)
+        batch_size: Threads handled per batch
+        batch_pause_seconds: Pause between batches (throttling)
+
+    Returns:
+        RetentionReport with rows and bytes reclaimed
+    """
+    from src.db.connection import get_connection
+
+    settings = get_settings()
+    keep_latest = keep_latest if keep_latest is not None else settings.checkpoint_keep_latest
+    ticket_retention_days = (
+        ticket_retention_days if ticket_retention_days is not None
+        else settings.checkpoint_ticket_retention_days
+    )
+    batch_size = batch_size or settings.checkpoint_retention_batch_size
+    batch_pause_seconds = (
+        batch_pause_seconds if batch_pause_seconds is not None
+        else settings.checkpoint_retention_batch_pause_seconds
+    )
+
+    report = RetentionReport()
+    start = time.perf_counter()
+
+    # 1. Drop sessions with long-created tickets (dropped first so they are
+    #    not compacted just before being deleted)
+    while ticket_retention_days > 0:
+        async with get_connection() as conn:
+            store = CheckpointRetentionStore(conn)
+            sessions = await store.list_expired_sessions(ticket_retention_days, batch_size)
+            for session_id in sessions:
+                for table, (rows, size) in (await store.drop_thread(session_id)).items():
+                    report.add(table, rows, size)
+        report.sessions_dropped += len(sessions)
+        report.batches += 1
+        if len(sessions) < batch_size:
+            break
+        await asyncio.sleep(batch_pause_seconds)
+
+    # 2. Compact the remaining threads to their latest K checkpoints (one
+    #    keyset-paged pass over thread_ids)
+    cursor = ""
+    while True:
+        async with get_connection() as conn:
+            store = CheckpointRetentionStore(conn)
+            threads = await store.list_threads_over_limit(keep_latest, batch_size, after=cursor)
+            for thread_id in threads:
+                pruned = await store.prune_thread(thread_id, keep_latest)
+                for table, (rows, size) in pruned.items():
+                    report.add(table, rows, size)
+        report.threads_compacted += len(threads)
+        report.batches += 1
+        if not threads:
+            break
+        cursor = threads[-1]
+        await asyncio.sleep(batch_pause_seconds)
+
+    report.duration_ms = (time.perf_counter() - start) * 1000
+    logger.info(
+        f"Checkpoint retention reclaimed {report.total_rows} rows, {report.bytes_reclaimed} bytes",
+        extra=report.to_dict(),
+    )
+    return report
+
+
+async def run_retention_forever() -> None:
+    """Run retention every settings.checkpoint_retention_interval_hours.
+
+    Started on the background loop at startup; failures are logged and the
+    next run is attempted on schedule.
+    """
+    interval = get_settings().checkpoint_retention_interval_hours * 3600
+    while True:
+        try:
+            await run_checkpoint_retention()
+        except Exception as e:
+            logger.error(f"Checkpoint retention failed: {e}", exc_info=True)
+        await asyncio.sleep(interval)
@@ -1,12 +1,14 @@
 """LangGraph PostgreSQL checkpointer for agent state persistence.
 
 Provides AsyncPostgresSaver configuration for resumable agent sessions.
-Uses langgraph-checkpoint-postgres with psycopg v3 async connections.
+The checkpointer draws connections from the shared application pool
+(src.db.connection), so concurrent threads advance in parallel instead of
+serialising on a single connection.
 
 Usage:
     from src.db import get_checkpointer, setup_checkpointer
 
-    # Once at startup: create checkpointer tables
+    # Once at startup (after init_db): create checkpointer tables
     await setup_checkpointer()
 
     # When compiling graph: pass checkpointer instance
@@ -20,37 +22,62 @@ from typing import AsyncIterator, Optional
 
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
-from src.config import get_settings
+from src.db.connection import get_connection, get_pool
+from src.db.session_lock import check_current_lease
+from src.tracing import span
 
 logger = logging.getLogger(__name__)
 
+
+class TracedPostgresSaver(AsyncPostgresSaver):
+    """AsyncPostgresSaver whose reads and writes show up as tracing spans.
+
+    Checkpoint writes happen between graph nodes, outside the node spans,
+    so without this they are invisible in turn traces. Writes are refused
+    (SessionLockLost) once the turn's distributed session lock lease is
+    lost or past max hold, since another replica may own the thread.
+    """
+
+    async def aget_tuple(self, *args, **kwargs):
+        with span("checkpoint.get", kind="checkpoint"):
+            return await super().aget_tuple(*args, **kwargs)
+
+    async def aput(self, *args, **kwargs):
+        check_current_lease()
+        with span("checkpoint.put", kind="checkpoint"):
+            return await super().aput(*args, **kwargs)
+
+    async def aput_writes(self, *args, **kwargs):
+        check_current_lease()
+        with span("checkpoint.put_writes", kind="checkpoint"):
+            return await super().aput_writes(*args, **kwargs)
+
 # Module-level singleton checkpointer for long-running app
 _checkpointer: Optional[AsyncPostgresSaver] = None
-_checkpointer_cm = None  # Keep context manager alive
 _lock = asyncio.Lock()
 
 
 async def get_checkpointer() -> AsyncPostgresSaver:
     """Get the singleton AsyncPostgresSaver checkpointer instance.
 
-    Creates a persistent checkpointer on first call that stays alive
-    for the lifetime of the application. This is required for long-running
-    apps like Slack bots using async graph streaming.
+    Creates the checkpointer on first call, backed by the shared connection
+    pool. Each aget_state/aupdate_state checks out its own connection, so
+    the checkpointer is safe to use from many sessions at once.
 
     Returns:
         AsyncPostgresSaver: Configured checkpointer for LangGraph state persistence.
+
+    Raises:
+        RuntimeError: If database not initialized (call init_db() first).
     """
-    global _checkpointer, _checkpointer_cm
+    global _checkpointer
 
     if _checkpointer is None:
         async with _lock:
             # Double-check after acquiring lock
             if _checkpointer is None:
-                settings = get_settings()
-                # Create async context manager and enter it - keep both alive
-                _checkpointer_cm = AsyncPostgresSaver.from_conn_string(settings.database_url)
-                _checkpointer = await _checkpointer_cm.__aenter__()
-                logger.info("AsyncPostgresSaver checkpointer initialized")
+                _checkpointer = TracedPostgresSaver(get_pool())
+                logger.info("AsyncPostgresSaver checkpointer initialized on shared pool")
 
     return _checkpointer
 
@@ -60,23 +87,37 @@ async def get_checkpointer_cm() -> AsyncIterator[AsyncPostgresSaver]:
     """Get a checkpointer as async context manager (for short-lived operations).
 
     Use this for one-off operations like setup. For graph compilation,
-    use get_checkpointer() instead.
+    use get_checkpointer() instead. Shares the application pool, so there
+    is nothing to close on exit.
 
     Yields:
         AsyncPostgresSaver: Configured checkpointer for LangGraph state persistence.
     """
-    settings = get_settings()
-    async with AsyncPostgresSaver.from_conn_string(settings.database_url) as checkpointer:
-        yield checkpointer
+    yield AsyncPostgresSaver(get_pool())
 
 
 async def setup_checkpointer() -> None:
     """Initialize checkpointer database tables.
 
-    Call once at application startup or during database migrations.
-    Creates the necessary tables for LangGraph state persistence.
+    Call once at application startup (after init_db) or during database
+    migrations. Creates the necessary tables for LangGraph state persistence.
 
     This is idempotent - safe to call multiple times.
     """
     async with get_checkpointer_cm() as checkpointer:
         await checkpointer.setup()
+
+
+async def thread_has_checkpoint(thread_id: str) -> bool:
+    """True if the thread has any checkpoint (the bot has state for it).
+
+    An index-only lookup on the checkpoints primary key; does not load the
+    checkpoint itself.
+    """
+    async with get_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "SELECT 1 FROM checkpoints WHERE thread_id = %s LIMIT 1;",
+                (thread_id,),
+            )
+            return await cur.fetchone() is not None
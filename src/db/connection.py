@@ -1,56 +1,118 @@
-"""Async database connection utilities using psycopg v3."""
+"""Async database connection pool using psycopg v3 and psycopg_pool.
+
+One process-wide pool is shared by the application stores (via get_connection)
+and the LangGraph checkpointer (via get_pool). Pooled connections are in
+autocommit mode without server-side prepared statements, which is what
+AsyncPostgresSaver requires. get_connection() switches autocommit off for
+the duration of a checkout, so stores keep transactional semantics: the
+block is one transaction (plus any explicit commit() points), committed on
+exit and rolled back if it raised.
+"""
+import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional
 
 from psycopg import AsyncConnection
+from psycopg.pq import TransactionStatus
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
 
 from src.config import get_settings
+from src.tracing import span
 
+logger = logging.getLogger(__name__)
 
-# Module-level connection string (used for direct connections)
-_conninfo: Optional[str] = None
+# Module-level pool (bound to the event loop that called init_db)
+_pool: Optional[AsyncConnectionPool] = None
 _initialized: bool = False
 
+# Checkout wait metrics (time spent waiting for a pooled connection)
+_checkout_count: int = 0
+_checkout_wait_total_ms: float = 0.0
+_checkout_wait_max_ms: float = 0.0
+_checkout_timeouts: int = 0
+
 
 async def init_db() -> None:
-    """Initialize database connection.
+    """Initialize the database connection pool.
 
-    Call once at application startup. Tests connection and stores conninfo.
+    Call once at application startup, on the event loop that will serve
+    requests. Opens the pool and waits until min_size connections are ready.
 
     Raises:
         RuntimeError: If already initialized.
-        psycopg.OperationalError: If connection to database fails.
+        psycopg_pool.PoolTimeout: If the pool cannot fill min_size connections.
     """
-    global _conninfo, _initialized
+    global _pool, _initialized
     if _initialized:
         raise RuntimeError("Database already initialized. Call close_db() first.")
 
     settings = get_settings()
-    _conninfo = settings.database_url
-
-    # Test connection
-    async with await AsyncConnection.connect(_conninfo) as conn:
-        await conn.execute("SELECT 1")
+    _pool = AsyncConnectionPool(
+        conninfo=settings.database_url,
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+        max_idle=settings.db_pool_max_idle,
+        timeout=settings.db_pool_timeout,
+        check=AsyncConnectionPool.check_connection,  # Health check on checkout
+        kwargs={"autocommit": True, "prepare_threshold": 0},
+        name="maro",
+        open=False,
+    )
+    await _pool.open(wait=True, timeout=settings.db_pool_timeout)
 
     _initialized = True
+    logger.info(
+        "Database pool opened",
+        extra={
+            "min_size": settings.db_pool_min_size,
+            "max_size": settings.db_pool_max_size,
+        },
+    )
 
 
 async def close_db() -> None:
-    """Reset database initialization state.
+    """Close the connection pool and reset initialization state.
 
     Call at application shutdown. Safe to call even if never initialized.
     """
-    global _conninfo, _initialized
-    _conninfo = None
+    global _pool, _initialized
+    from src.db.session_lock import close_lock_pool
+    await close_lock_pool()
+
+    if _pool is not None:
+        await _pool.close()
+        logger.info("Database pool closed")
+    _pool = None
     _initialized = False
 
 
+def get_pool() -> AsyncConnectionPool:
+    """Get the shared connection pool.
+
+    Used by components that manage their own checkouts, such as
+    AsyncPostgresSaver. Application code should prefer get_connection().
+
+    Raises:
+        RuntimeError: If database not initialized (call init_db() first).
+    """
+    if not _initialized or _pool is None:
+        raise RuntimeError(
+            "Database not initialized. Call init_db() at application startup."
+        )
+    return _pool
+
+
 @asynccontextmanager
 async def get_connection() -> AsyncGenerator[AsyncConnection, None]:
-    """Get a database connection.
+    """Get a pooled database connection.
 
-    Async context manager that yields a connection.
-    Connection is automatically closed when context exits.
+    Async context manager that yields a connection from the pool, with
+    autocommit off: statements run in a transaction that is committed when
+    the block exits, or rolled back if it raised (explicit commit() calls
+    inside the block still commit early). The connection goes back to the
+    pool in autocommit mode; one left mid-transaction (e.g. the commit
+    itself failed) is closed instead, so the pool replaces it.
 
     Usage:
         async with get_connection() as conn:
@@ -63,12 +125,81 @@ async def get_connection() -> AsyncGenerator[AsyncConnection, None]:
 
     Raises:
         RuntimeError: If database not initialized (call init_db() first).
-        psycopg.OperationalError: If connection cannot be obtained.
+        psycopg_pool.PoolTimeout: If no connection frees up within db_pool_timeout.
     """
-    if not _initialized or _conninfo is None:
+    global _checkout_timeouts
+
+    if not _initialized or _pool is None:
         raise RuntimeError(
             "Database not initialized. Call init_db() at application startup."
         )
 
-    async with await AsyncConnection.connect(_conninfo) as conn:
-        yield conn
+    start = time.perf_counter()
+    acquired = False
+    try:
+        with span("db.connection", kind="db") as db_span:
+            async with _pool.connection() as conn:
+                acquired = True
+                wait_ms = (time.perf_counter() - start) * 1000
+                _record_checkout(wait_ms)
+                if db_span:
+                    db_span.set(checkout_wait_ms=round(wait_ms, 2))
+                await conn.set_autocommit(False)
+                try:
+                    yield conn
+                except BaseException:
+                    if not conn.closed:
+                        await conn.rollback()
+                    raise
+                else:
+                    await conn.commit()
+                finally:
+                    if conn.info.transaction_status == TransactionStatus.IDLE:
+                        await conn.set_autocommit(True)
+                    elif not conn.closed:
+                        await conn.close()
+    except PoolTimeout:
+        if not acquired:
+            _checkout_timeouts += 1
+            logger.warning(
+                "Timed out waiting for pooled connection",
+                extra={"pool_stats": _pool.get_stats() if _pool else {}},
+            )
+        raise
+
+
+def _record_checkout(wait_ms: float) -> None:
+    """Record time spent waiting for a pooled connection."""
+    global _checkout_count, _checkout_wait_total_ms, _checkout_wait_max_ms
+    _checkout_count += 1
+    _checkout_wait_total_ms += wait_ms
+    _checkout_wait_max_ms = max(_checkout_wait_max_ms, wait_ms)
+
+
+def get_pool_stats() -> dict[str, Any]:
+    """Get connection pool statistics.
+
+    Combines psycopg_pool's own counters (size, available, waiting requests)
+    with utilisation and checkout wait metrics measured by get_connection().
+    Checkpointer checkouts are included in the pool counters but not in the
+    checkout_* metrics.
+
+    Returns:
+        Dict of pool metrics. Empty dict if the pool is not initialized.
+    """
+    if _pool is None:
+        return {}
+
+    stats: dict[str, Any] = dict(_pool.get_stats())
+    in_use = stats.get("pool_size", 0) - stats.get("pool_available", 0)
+    stats.update({
+        "in_use": in_use,
+        "utilisation": round(in_use / _pool.max_size, 3) if _pool.max_size else 0.0,
+        "checkout_count": _checkout_count,
+        "checkout_wait_avg_ms": (
+            round(_checkout_wait_total_ms / _checkout_count, 2) if _checkout_count else 0.0
+        ),
+        "checkout_wait_max_ms": round(_checkout_wait_max_ms, 2),
+        "checkout_timeouts": _checkout_timeouts,
+    })
+    return stats
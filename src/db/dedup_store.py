@@ -0,0 +1,77 @@
+"""Shared dedup storage for Slack event and button click deduplication.
+
+Backs the in-memory dedup store (src.slack.dedup) when several bot
+replicas receive the same Socket Mode retries. Uses an UNLOGGED table:
+dedup keys are short-lived, so WAL durability is not worth paying for.
+"""
+import logging
+
+from psycopg import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+
+class SlackDedupStore:
+    """PostgreSQL store for short-lived dedup keys.
+
+    claim() is an atomic check-and-set: exactly one replica wins a key
+    until it expires.
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def create_tables(self) -> None:
+        """Create slack_dedup table if not exists."""
+        sql = """
+        CREATE UNLOGGED TABLE IF NOT EXISTS slack_dedup (
+            dedup_key TEXT PRIMARY KEY,
+            expires_at TIMESTAMPTZ NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_slack_dedup_expires
+            ON slack_dedup(expires_at);
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+        await self.conn.commit()
+        logger.debug("Created slack_dedup table")
+
+    async def claim(self, dedup_key: str, ttl_seconds: float) -> bool:
+        """Claim a key. Returns True if new (first wins), False if duplicate.
+
+        An expired key can be claimed again.
+
+        Args:
+            dedup_key: Event or button key
+            ttl_seconds: How long the claim holds
+
+        Returns:
+            True if this caller claimed the key
+        """
+        sql = """
+        INSERT INTO slack_dedup (dedup_key, expires_at)
+        VALUES (%s, NOW() + make_interval(secs => %s))
+        ON CONFLICT (dedup_key) DO UPDATE SET expires_at = EXCLUDED.expires_at
+            WHERE slack_dedup.expires_at <= NOW()
+        RETURNING dedup_key;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (dedup_key, ttl_seconds))
+            result = await cur.fetchone()
+        await self.conn.commit()
+        return result is not None
+
+    async def delete_expired(self) -> int:
+        """Delete expired keys.
+
+        Returns:
+            Number of rows deleted
+        """
+        sql = "DELETE FROM slack_dedup WHERE expires_at <= NOW();"
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+            deleted = cur.rowcount
+        await self.conn.commit()
+        logger.debug(f"Deleted {deleted} expired dedup keys")
+        return deleted
@@ -0,0 +1,94 @@
+"""LLM response cache storage (shared tier behind the in-memory cache).
+
+Stores serialized LLMResults keyed by a content hash of the request, so
+identical deterministic prompts are answered once across workers.
+Entries expire after a TTL; expired rows are ignored on read and removed
+by delete_expired().
+"""
+import json
+import logging
+from typing import Any, Optional
+
+from psycopg import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheStore:
+    """PostgreSQL store for cached LLM responses."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def create_tables(self) -> None:
+        """Create llm_response_cache table if not exists."""
+        sql = """
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            result JSONB NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            expires_at TIMESTAMPTZ NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires
+            ON llm_response_cache(expires_at);
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+        await self.conn.commit()
+        logger.debug("Created llm_response_cache table")
+
+    async def get(self, cache_key: str) -> Optional[dict[str, Any]]:
+        """Get a cached result if present and not expired.
+
+        Args:
+            cache_key: Request content hash
+
+        Returns:
+            Serialized LLMResult dict, or None on miss
+        """
+        sql = """
+        SELECT result FROM llm_response_cache
+        WHERE cache_key = %s AND expires_at > NOW();
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (cache_key,))
+            row = await cur.fetchone()
+        if row is None:
+            return None
+        result = row[0]
+        return json.loads(result) if isinstance(result, str) else result
+
+    async def put(self, cache_key: str, result: dict[str, Any], ttl_seconds: float) -> None:
+        """Store (or refresh) a cached result.
+
+        Args:
+            cache_key: Request content hash
+            result: Serialized LLMResult
+            ttl_seconds: Time to live
+        """
+        sql = """
+        INSERT INTO llm_response_cache (cache_key, result, expires_at)
+        VALUES (%s, %s, NOW() + make_interval(secs => %s))
+        ON CONFLICT (cache_key) DO UPDATE SET
+            result = EXCLUDED.result,
+            created_at = NOW(),
+            expires_at = EXCLUDED.expires_at;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (cache_key, json.dumps(result), ttl_seconds))
+        await self.conn.commit()
+
+    async def delete_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of rows deleted
+        """
+        sql = "DELETE FROM llm_response_cache WHERE expires_at <= NOW();"
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+            deleted = cur.rowcount
+        await self.conn.commit()
+        logger.info(f"Deleted {deleted} expired LLM cache entries")
+        return deleted
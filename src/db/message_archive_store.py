@@ -0,0 +1,129 @@
+"""Archive of conversation messages moved out of the graph state.
+
+AgentState.messages only keeps a rolling window of recent messages (see
+src.graph.message_window); older messages are stored here, keyed by
+session, so the checkpoint stays small on long threads while the full
+history remains available.
+"""
+import logging
+from typing import Any, Optional
+
+from psycopg import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+
+class MessageArchiveStore:
+    """PostgreSQL store for archived conversation messages.
+
+    Inserts are idempotent on (session_id, message_id), so re-archiving
+    the same messages after a failed checkpoint write is harmless.
+    """
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def create_tables(self) -> None:
+        """Create message_archive table if not exists."""
+        sql = """
+        CREATE TABLE IF NOT EXISTS message_archive (
+            id BIGSERIAL PRIMARY KEY,
+            session_id TEXT NOT NULL,
+            message_id TEXT NOT NULL,
+            role TEXT NOT NULL,
+            content TEXT NOT NULL,
+            archived_at TIMESTAMPTZ DEFAULT NOW(),
+            UNIQUE(session_id, message_id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_message_archive_session
+            ON message_archive(session_id, id);
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+        await self.conn.commit()
+        logger.debug("Created message_archive table")
+
+    async def archive_messages(
+        self,
+        session_id: str,
+        messages: list[dict[str, Any]],
+    ) -> int:
+        """Archive messages in order.
+
+        Args:
+            session_id: Session the messages belong to
+            messages: Dicts with message_id, role and content (oldest first)
+
+        Returns:
+            Number of newly archived messages
+        """
+        if not messages:
+            return 0
+
+        sql = """
+        INSERT INTO message_archive (session_id, message_id, role, content)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (session_id, message_id) DO NOTHING;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.executemany(
+                sql,
+                [
+                    (session_id, m["message_id"], m["role"], m["content"])
+                    for m in messages
+                ],
+            )
+            inserted = cur.rowcount
+        await self.conn.commit()
+        logger.debug(
+            f"Archived {inserted} messages",
+            extra={"session_id": session_id, "count": inserted},
+        )
+        return inserted
+
+    async def get_messages(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Get archived messages for a session, oldest first.
+
+        Args:
+            session_id: Session ID
+            limit: Return only the most recent N archived messages
+
+        Returns:
+            List of dicts with message_id, role, content, archived_at
+        """
+        sql = """
+        SELECT message_id, role, content, archived_at FROM (
+            SELECT id, message_id, role, content, archived_at
+            FROM message_archive
+            WHERE session_id = %s
+            ORDER BY id DESC
+            LIMIT %s
+        ) recent
+        ORDER BY id ASC;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (session_id, limit))
+            rows = await cur.fetchall()
+
+        return [
+            {
+                "message_id": row[0],
+                "role": row[1],
+                "content": row[2],
+                "archived_at": row[3],
+            }
+            for row in rows
+        ]
+
+    async def count_messages(self, session_id: str) -> int:
+        """Count archived messages for a session."""
+        sql = "SELECT COUNT(*) FROM message_archive WHERE session_id = %s;"
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (session_id,))
+            row = await cur.fetchone()
+        return row[0] if row else 0
@@ -0,0 +1,285 @@
+"""Distributed session locks on Postgres advisory locks.
+
+With several bot replicas, the in-process session lock only serializes
+turns within one process. advisory_session_lock() additionally takes a
+session-level pg_advisory_lock keyed on a hash of the session ID, so a
+thread runs one turn at a time across all replicas.
+
+The advisory lock lives as long as the connection holding it, so each
+held lock pins one connection from a small dedicated pool (never the
+shared pool: a turn needs shared connections for its checkpoints while
+holding the lock). Lease semantics come from the server:
+- idle_session_timeout (PostgreSQL 14+) drops a lock connection that
+  has been idle for session_lock_lease_seconds. It is set only while a
+  lock is held and cleared on release, so idle pooled connections are not
+  killed between turns
+- the holder renews the lease (SELECT 1) every third of the lease while
+  the turn runs, and stops renewing after session_lock_max_hold_seconds,
+  so a dead or hung holder loses the lock instead of blocking the thread
+- lock_timeout bounds the wait for another replica's turn
+- a holder whose lease was lost or ran past max hold must not write: the
+  yielded SessionLease reports it, and lease.check() raises
+  SessionLockLost. The lease is also published to the turn's context, so
+  the checkpointer checks it before every LangGraph checkpoint write
+  (check_current_lease) and GraphRunner before the graph run and the
+  turn-state flush
+
+Callers take the in-process lock first (see src.slack.session.session_lock),
+so turns queued in the same process wait locally without touching the
+database.
+
+Usage:
+    from src.db.session_lock import advisory_session_lock
+
+    async with advisory_session_lock(session_id) as lease:
+        ...  # one turn, cluster-wide
+        lease.check()  # before writing
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+import psycopg
+from psycopg import AsyncConnection
+from psycopg.errors import LockNotAvailable
+from psycopg_pool import AsyncConnectionPool
+
+from src.config import get_settings
+from src.metrics import SESSION_LOCK_ACQUIRES, SESSION_LOCK_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Dedicated pool for lock connections (opened on first use)
+_lock_pool: Optional[AsyncConnectionPool] = None
+
+# Metrics
+_held: int = 0
+_acquired: int = 0
+_timeouts: int = 0
+_leases_lost: int = 0
+_wait_max_ms: float = 0.0
+
+# False once the server rejected idle_session_timeout (PostgreSQL < 14)
+_idle_timeout_supported: bool = True
+
+
+class SessionLockTimeout(Exception):
+    """Another replica held the session lock past the wait timeout."""
+
+
+class SessionLockLost(Exception):
+    """The session lock lease was lost or expired while the turn ran."""
+
+
+class SessionLease:
+    """Validity of a held advisory session lock."""
+
+    def __init__(self, session_id: str, max_hold_seconds: float):
+        self.session_id = session_id
+        self.deadline = time.monotonic() + max_hold_seconds
+        self.lost = False  # Set when lease renewal failed
+
+    @property
+    def valid(self) -> bool:
+        """True while the lock is still held and within max hold."""
+        return not self.lost and time.monotonic() <= self.deadline
+
+    def check(self) -> None:
+        """Raise if the lock can no longer be trusted.
+
+        Raises:
+            SessionLockLost: If the lease was lost or max hold has passed
+                (another replica may hold the session now).
+        """
+        if self.lost:
+            raise SessionLockLost(f"Session {self.session_id} lock lease was lost")
+        if time.monotonic() > self.deadline:
+            raise SessionLockLost(f"Session {self.session_id} lock held past max hold")
+
+
+# Lease held by the current turn (read by the checkpointer before writes)
+_current_lease: ContextVar[Optional[SessionLease]] = ContextVar("session_lease", default=None)
+
+
+def check_current_lease() -> None:
+    """Raise if the current turn holds a session lease that is no longer valid.
+
+    No-op outside a distributed session lock.
+
+    Raises:
+        SessionLockLost: If the lease was lost or max hold has passed.
+    """
+    lease = _current_lease.get()
+    if lease is not None:
+        lease.check()
+
+
+def advisory_key(session_id: str) -> int:
+    """Stable signed 64-bit advisory lock key for a session ID."""
+    digest = hashlib.blake2b(session_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+async def _configure(conn: AsyncConnection) -> None:
+    """Set the lock wait timeout on a new lock connection."""
+    settings = get_settings()
+    await conn.execute(
+        "SELECT set_config('lock_timeout', %s, false)",
+        (f"{int(settings.session_lock_wait_timeout_seconds * 1000)}ms",),
+    )
+
+
+async def _set_idle_timeout(conn: AsyncConnection, seconds: float) -> None:
+    """Set the server-side lease on a lock connection (0 clears it)."""
+    global _idle_timeout_supported
+    if not _idle_timeout_supported:
+        return
+    try:
+        await conn.execute(
+            "SELECT set_config('idle_session_timeout', %s, false)",
+            (f"{int(seconds * 1000)}ms",),
+        )
+    except psycopg.errors.UndefinedObject as e:
+        # PostgreSQL < 14: locks are still released when the connection dies
+        _idle_timeout_supported = False
+        logger.warning(f"idle_session_timeout unavailable, no server-side lease: {e}")
+
+
+def _get_lock_pool() -> AsyncConnectionPool:
+    """Get or create the lock connection pool (fills in the background)."""
+    global _lock_pool
+    if _lock_pool is None:
+        settings = get_settings()
+        _lock_pool = AsyncConnectionPool(
+            conninfo=settings.database_url,
+            min_size=1,
+            max_size=settings.session_lock_pool_size,
+            timeout=settings.session_lock_wait_timeout_seconds,
+            check=AsyncConnectionPool.check_connection,  # Holder's lease may have expired
+            configure=_configure,
+            kwargs={"autocommit": True, "prepare_threshold": 0},
+            name="maro-session-locks",
+            open=False,
+        )
+    return _lock_pool
+
+
+async def close_lock_pool() -> None:
+    """Close the lock pool (held locks are released by the server)."""
+    global _lock_pool
+    if _lock_pool is not None:
+        await _lock_pool.close()
+        logger.info("Session lock pool closed")
+    _lock_pool = None
+
+
+async def _renew_lease(conn: AsyncConnection, lease: SessionLease, stop: asyncio.Event) -> None:
+    """Keep the lock connection active until stop is set or max hold passes."""
+    global _leases_lost
+    interval = get_settings().session_lock_lease_seconds / 3
+
+    while True:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        if time.monotonic() > lease.deadline:
+            logger.warning(
+                "Session lock held past max hold, lease renewal stopped",
+                extra={"session_id": lease.session_id},
+            )
+            return
+        try:
+            await conn.execute("SELECT 1")
+        except psycopg.Error as e:
+            lease.lost = True
+            _leases_lost += 1
+            SESSION_LOCK_ACQUIRES.inc(outcome="lease_lost")
+            logger.error(
+                f"Session lock lease lost: {e}",
+                extra={"session_id": lease.session_id},
+            )
+            return
+
+
+@asynccontextmanager
+async def advisory_session_lock(session_id: str) -> AsyncIterator[SessionLease]:
+    """Hold the cluster-wide lock for a session.
+
+    Args:
+        session_id: Canonical session ID (team:channel:thread_ts)
+
+    Yields:
+        SessionLease; call lease.check() before writing session state
+
+    Raises:
+        SessionLockTimeout: If the lock is not acquired within
+            session_lock_wait_timeout_seconds.
+        psycopg_pool.PoolTimeout: If no lock connection frees up in time.
+    """
+    global _held, _acquired, _timeouts, _wait_max_ms
+
+    pool = _get_lock_pool()
+    await pool.open(wait=False)
+    key = advisory_key(session_id)
+
+    start = time.perf_counter()
+    async with pool.connection() as conn:
+        try:
+            await conn.execute("SELECT pg_advisory_lock(%s)", (key,))
+        except LockNotAvailable as e:
+            _timeouts += 1
+            SESSION_LOCK_ACQUIRES.inc(outcome="timeout")
+            raise SessionLockTimeout(f"Session {session_id} is busy on another replica") from e
+
+        wait_s = time.perf_counter() - start
+        SESSION_LOCK_WAIT_SECONDS.observe(wait_s, scope="distributed")
+        SESSION_LOCK_ACQUIRES.inc(outcome="ok")
+        _acquired += 1
+        _held += 1
+        _wait_max_ms = max(_wait_max_ms, wait_s * 1000)
+
+        settings = get_settings()
+        lease = SessionLease(session_id, settings.session_lock_max_hold_seconds)
+        stop = asyncio.Event()
+        renewal = None
+        token = _current_lease.set(lease)
+        try:
+            await _set_idle_timeout(conn, settings.session_lock_lease_seconds)
+            renewal = asyncio.create_task(_renew_lease(conn, lease, stop))
+            yield lease
+        finally:
+            _current_lease.reset(token)
+            stop.set()
+            if renewal is not None:
+                await renewal
+            _held -= 1
+            try:
+                await conn.execute("SELECT pg_advisory_unlock(%s)", (key,))
+                await _set_idle_timeout(conn, 0)
+            except psycopg.Error as e:
+                # Connection is gone, and the lock with it
+                logger.warning(
+                    f"Session lock release failed: {e}",
+                    extra={"session_id": session_id},
+                )
+
+
+def get_advisory_lock_stats() -> dict[str, Any]:
+    """Get distributed lock metrics (held, acquired, timeouts, leases lost)."""
+    stats: dict[str, Any] = {
+        "held": _held,
+        "acquired": _acquired,
+        "timeouts": _timeouts,
+        "leases_lost": _leases_lost,
+        "wait_max_ms": round(_wait_max_ms, 2),
+    }
+    if _lock_pool is not None:
+        stats["pool"] = dict(_lock_pool.get_stats())
+    return stats
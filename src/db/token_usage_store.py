@@ -0,0 +1,144 @@
+"""LLM token usage rollups.
+
+One row per (day, team, session, task, model) with call count, prompt
+and completion tokens and estimated cost. Rows are incremented in
+batches by the token accountant (src.llm.accounting), so per-team,
+per-task and per-model totals are plain GROUP BY queries.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+from psycopg import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+# Columns usage can be grouped by
+USAGE_DIMENSIONS = ("team_id", "session_id", "task", "model", "day")
+
+
+@dataclass
+class TokenUsageRollup:
+    """Usage increment for one (day, team, session, task, model)."""
+
+    day: date
+    team_id: str
+    session_id: str
+    task: str
+    model: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class TokenUsageStore:
+    """PostgreSQL store for LLM token usage rollups."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def create_tables(self) -> None:
+        """Create llm_token_usage table if not exists."""
+        sql = """
+        CREATE TABLE IF NOT EXISTS llm_token_usage (
+            day DATE NOT NULL,
+            team_id TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            task TEXT NOT NULL,
+            model TEXT NOT NULL,
+            calls BIGINT NOT NULL DEFAULT 0,
+            prompt_tokens BIGINT NOT NULL DEFAULT 0,
+            completion_tokens BIGINT NOT NULL DEFAULT 0,
+            cost_usd NUMERIC(14, 6) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ DEFAULT NOW(),
+            PRIMARY KEY (day, team_id, session_id, task, model)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_llm_token_usage_team_day
+            ON llm_token_usage(team_id, day);
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql)
+        await self.conn.commit()
+        logger.debug("Created llm_token_usage table")
+
+    async def add_rollups(self, rollups: list[TokenUsageRollup]) -> None:
+        """Add usage increments (upsert, counters are summed).
+
+        Args:
+            rollups: Increments to apply
+        """
+        if not rollups:
+            return
+        sql = """
+        INSERT INTO llm_token_usage
+            (day, team_id, session_id, task, model,
+             calls, prompt_tokens, completion_tokens, cost_usd)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (day, team_id, session_id, task, model) DO UPDATE SET
+            calls = llm_token_usage.calls + EXCLUDED.calls,
+            prompt_tokens = llm_token_usage.prompt_tokens + EXCLUDED.prompt_tokens,
+            completion_tokens = llm_token_usage.completion_tokens + EXCLUDED.completion_tokens,
+            cost_usd = llm_token_usage.cost_usd + EXCLUDED.cost_usd,
+            updated_at = NOW();
+        """
+        async with self.conn.cursor() as cur:
+            await cur.executemany(
+                sql,
+                [
+                    (
+                        r.day, r.team_id, r.session_id, r.task, r.model,
+                        r.calls, r.prompt_tokens, r.completion_tokens, r.cost_usd,
+                    )
+                    for r in rollups
+                ],
+            )
+        await self.conn.commit()
+
+    async def get_usage(
+        self,
+        group_by: str,
+        since: date,
+        team_id: Optional[str] = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Usage totals grouped by one dimension, largest first.
+
+        Args:
+            group_by: One of USAGE_DIMENSIONS
+            since: First day included
+            team_id: Restrict to one team
+            limit: Max rows
+
+        Returns:
+            List of {<group_by>, calls, prompt_tokens, completion_tokens, cost_usd}
+
+        Raises:
+            ValueError: If group_by is not a known dimension
+        """
+        if group_by not in USAGE_DIMENSIONS:
+            raise ValueError(f"Unknown usage dimension: {group_by}")
+
+        sql = f"""
+        SELECT {group_by}, SUM(calls), SUM(prompt_tokens), SUM(completion_tokens), SUM(cost_usd)
+        FROM llm_token_usage
+        WHERE day >= %s AND (%s::text IS NULL OR team_id = %s)
+        GROUP BY {group_by}
+        ORDER BY SUM(prompt_tokens) + SUM(completion_tokens) DESC
+        LIMIT %s;
+        """
+        async with self.conn.cursor() as cur:
+            await cur.execute(sql, (since, team_id, team_id, limit))
+            rows = await cur.fetchall()
+        return [
+            {
+                group_by: row[0] if not isinstance(row[0], date) else row[0].isoformat(),
+                "calls": int(row[1]),
+                "prompt_tokens": int(row[2]),
+                "completion_tokens": int(row[3]),
+                "cost_usd": float(row[4]),
+            }
+            for row in rows
+        ]
@@ -2,6 +2,6 @@
 
 Custom graph with extraction -> validation -> decision pipeline.
 """
-from src.graph.graph import create_graph, get_compiled_graph
+from src.graph.graph import create_graph, get_compiled_graph, is_graph_compiled
 
-__all__ = ["create_graph", "get_compiled_graph"]
+__all__ = ["create_graph", "get_compiled_graph", "is_graph_compiled"]
@@ -9,6 +9,8 @@ Graph structure:
 Loop protection:
 - max_steps=10 enforced via step_count
 - Stops if step_count >= MAX_STEPS
+- Stops as soon as a pass over the same message patches nothing
+  (convergence, see state["extraction_loop"]) and validates what we have
 """
 import logging
 from typing import Literal
@@ -16,13 +18,12 @@ from typing import Literal
 from langgraph.graph import StateGraph, END
 
 from src.schemas.state import AgentState, AgentPhase
-from src.graph.nodes.extraction import extraction_node
+from src.graph.nodes.extraction import extraction_node, MAX_STEPS, STOP_CONVERGED
 from src.graph.nodes.validation import validation_node
 from src.graph.nodes.decision import decision_node, get_decision_action
+from src.tracing import traced
 logger = logging.getLogger(__name__)
 
-MAX_STEPS = 10
-
 
 def should_continue(state: AgentState) -> Literal["extraction", "validation", "end"]:
     """Router: decide next step based on state.
@@ -31,11 +32,14 @@ def should_continue(state: AgentState) -> Literal["extraction", "validation", "e
     - "end" if intro/nudge set (empty draft response)
     - "end" if max_steps reached (loop protection)
     - "validation" if draft exists and has content
+    - "validation" if extraction converged (validation/decision then ask
+      for the missing title/problem)
     - "extraction" to continue collecting
     """
     step_count = state.get("step_count", 0)
     draft = state.get("draft")
     decision_result = state.get("decision_result", {})
+    stop_reason = (state.get("extraction_loop") or {}).get("stop_reason")
 
     # If extraction set intro/nudge, stop and send response
     if decision_result.get("action") in ["intro", "nudge"]:
@@ -51,6 +55,10 @@ def should_continue(state: AgentState) -> Literal["extraction", "validation", "e
     if draft and (draft.title or draft.problem):
         return "validation"
 
+    # Nothing new can be learned from this message - ask instead of looping
+    if stop_reason == STOP_CONVERGED:
+        return "validation"
+
     # Continue collecting
     return "extraction"
 
@@ -72,10 +80,10 @@ def create_graph() -> StateGraph:
     # Create graph with AgentState
     workflow = StateGraph(AgentState)
 
-    # Add nodes
-    workflow.add_node("extraction", extraction_node)
-    workflow.add_node("validation", validation_node)
-    workflow.add_node("decision", decision_node)
+    # Add nodes (each runs in a tracing span)
+    workflow.add_node("extraction", traced("node", "extraction")(extraction_node))
+    workflow.add_node("validation", traced("node", "validation")(validation_node))
+    workflow.add_node("decision", traced("node", "decision")(decision_node))
 
     # Set entry point
     workflow.set_entry_point("extraction")
@@ -131,6 +139,11 @@ async def get_compiled_graph():
     return _compiled_graph
 
 
+def is_graph_compiled() -> bool:
+    """True once get_compiled_graph() has compiled the graph."""
+    return _compiled_graph is not None
+
+
 # Convenience: graph without checkpointer for testing
 def get_graph_for_testing():
     """Get compiled graph without checkpointer.
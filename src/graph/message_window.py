@@ -0,0 +1,152 @@
+"""Rolling message window for AgentState.messages.
+
+Every checkpoint write serializes the whole message list, so long threads
+made each write and each aget_state grow linearly. The state now keeps
+only the last N messages inline; older ones are moved to the
+message_archive table and folded into a short rolling summary kept in
+state["message_summary"].
+
+The summary is built without an LLM call (one clipped line per archived
+message, oldest lines dropped past the character budget): the draft is
+already the distilled record of the conversation, the summary only keeps
+some conversational context. The extraction and fused turn prompts lead
+with it (summary_context()) so references to earlier messages still
+resolve once those messages have left the window.
+
+Usage:
+    from src.graph.message_window import apply_message_window
+
+    state = await apply_message_window(session_id, state)
+"""
+import logging
+from typing import Any
+
+from langchain_core.messages import BaseMessage, RemoveMessage
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Per archived message, in the rolling summary
+SUMMARY_LINE_CHARS = 200
+
+
+def split_window(
+    messages: list[BaseMessage],
+    window_size: int,
+) -> tuple[list[BaseMessage], list[BaseMessage]]:
+    """Split messages into (to archive, to keep inline).
+
+    Args:
+        messages: Messages, oldest first
+        window_size: Number of most recent messages to keep
+
+    Returns:
+        Tuple of (archived, kept)
+    """
+    if window_size <= 0 or len(messages) <= window_size:
+        return [], list(messages)
+    return list(messages[:-window_size]), list(messages[-window_size:])
+
+
+def _message_text(message: BaseMessage) -> str:
+    """Message content as plain text."""
+    content = message.content
+    return content if isinstance(content, str) else str(content)
+
+
+def update_summary(
+    summary: str | None,
+    archived: list[BaseMessage],
+    max_chars: int,
+) -> str:
+    """Fold archived messages into the rolling summary.
+
+    Args:
+        summary: Previous summary (or None)
+        archived: Messages just moved out of the window
+        max_chars: Summary budget; oldest lines are dropped past it
+
+    Returns:
+        Updated summary
+    """
+    lines = summary.splitlines() if summary else []
+    for message in archived:
+        text = " ".join(_message_text(message).split())
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[: SUMMARY_LINE_CHARS - 3] + "..."
+        lines.append(f"{message.type}: {text}")
+
+    while lines and sum(len(line) + 1 for line in lines) > max_chars:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+async def apply_message_window(session_id: str, state: dict[str, Any]) -> dict[str, Any]:
+    """Move messages beyond the window to the archive.
+
+    Returns a state whose "messages" holds RemoveMessage markers for the
+    archived messages followed by the kept ones, ready to be used as graph
+    input (the add_messages reducer drops the archived ones from the
+    checkpoint). If archiving fails, the state is returned unchanged so
+    no history is lost.
+
+    Args:
+        session_id: Session the messages belong to
+        state: Graph input state, with the new message already appended
+
+    Returns:
+        Updated state (same object if nothing was archived)
+    """
+    settings = get_settings()
+    archived, kept = split_window(state.get("messages", []), settings.message_window_size)
+    if not archived or any(m.id is None for m in archived):
+        # Nothing to do, or messages not yet through the reducer (no ids)
+        return state
+
+    from src.db.connection import get_connection
+    from src.db.message_archive_store import MessageArchiveStore
+
+    try:
+        async with get_connection() as conn:
+            await MessageArchiveStore(conn).archive_messages(
+                session_id,
+                [
+                    {
+                        "message_id": m.id,
+                        "role": m.type,
+                        "content": _message_text(m),
+                    }
+                    for m in archived
+                ],
+            )
+    except Exception as e:
+        logger.warning(f"Message archive failed, keeping history inline: {e}")
+        return state
+
+    logger.info(
+        f"Archived {len(archived)} messages out of the window",
+        extra={"session_id": session_id, "archived": len(archived), "kept": len(kept)},
+    )
+
+    state = dict(state)
+    state["messages"] = [RemoveMessage(id=m.id) for m in archived] + kept
+    state["message_summary"] = update_summary(
+        state.get("message_summary"),
+        archived,
+        settings.message_summary_max_chars,
+    )
+    state["archived_message_count"] = state.get("archived_message_count", 0) + len(archived)
+    return state
+
+
+def summary_context(summary: str | None) -> str:
+    """Leading prompt block for the rolling summary ("" if there is none)."""
+    if not summary:
+        return ""
+    return f"Earlier conversation (summary, oldest first):\n{summary}\n\n"
+
+
+def visible_messages(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Drop RemoveMessage markers left over from the graph input."""
+    return [m for m in messages if not isinstance(m, RemoveMessage)]
@@ -2,6 +2,7 @@
 from src.graph.nodes.extraction import extraction_node
 from src.graph.nodes.validation import validation_node, ValidationReport
 from src.graph.nodes.decision import decision_node, DecisionResult, get_decision_action
+from src.graph.nodes.fused_turn import run_fused_turn, FusedTurnResult
 
 __all__ = [
     "extraction_node",
@@ -10,4 +11,6 @@ __all__ = [
     "decision_node",
     "DecisionResult",
     "get_decision_action",
+    "run_fused_turn",
+    "FusedTurnResult",
 ]
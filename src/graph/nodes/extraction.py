@@ -11,37 +11,128 @@ from langchain_core.messages import HumanMessage, AIMessage
 
 from src.schemas.state import AgentState, AgentPhase
 from src.schemas.draft import TicketDraft, DraftConstraint, ConstraintStatus
-from src.llm import get_llm
-from src.skills.answer_matcher import match_answers
+from src.config.settings import get_settings
+from src.llm import get_llm_for_task
+from src.llm.guardrails import PromptBudget
+from src.skills.answer_matcher import match_answers, build_match_result
+from src.graph.message_window import summary_context
+from src.graph.nodes.fused_turn import run_fused_turn
+from src.graph.nodes.validation import draft_fingerprint
 
 logger = logging.getLogger(__name__)
 
-EXTRACTION_PROMPT = '''You are extracting requirements from a conversation to build a Jira ticket draft.
+# Loop protection: max extraction passes per graph run
+MAX_STEPS = 10
 
-Current draft state:
-{draft_json}
+# Why the extraction loop ended (state["extraction_loop"]["stop_reason"])
+STOP_READY = "ready"  # Draft has title or problem - go validate
+STOP_EMPTY = "empty_draft"  # Nothing extracted at all - intro/nudge
+STOP_CONVERGED = "converged"  # Same message, nothing new - go validate
+STOP_MAX_STEPS = "max_steps"  # Loop protection hit
 
-New message to process:
-{message}
+# Static instructions first (provider prompt-cache prefix), per-call data last
+EXTRACTION_SYSTEM_PROMPT = '''You are extracting requirements from a conversation to build a
+Jira ticket draft.
 
-Extract any new information that should update the draft. Return a JSON object with ONLY the fields that have new information. Do not repeat existing values.
+You will be given the current draft state and a new message. Extract any new information
+that should update the draft. Return a JSON object with ONLY the fields that have new
+information. Do not repeat existing values.
+
+A summary of earlier conversation may come first: use it to resolve references
+in the new message, but extract only what the new message states.
 
 Fields you can update:
 - title: Clear, concise ticket title
 - problem: What problem we're solving
 - proposed_solution: How we'll solve it
 - acceptance_criteria: List of testable criteria (append new ones)
-- constraints: List of {{"key", "value"}} technical decisions
+- constraints: List of {"key", "value"} technical decisions
 - dependencies: List of external dependencies
 - risks: List of potential risks
 
-Return empty object {{}} if no new information to extract.
+Return empty object {} if no new information to extract.
+
+IMPORTANT: Only extract factual information stated in the message. Do not invent or assume.'''
 
-IMPORTANT: Only extract factual information stated in the message. Do not invent or assume.
+EXTRACTION_PROMPT = '''{summary}Current draft state:
+{draft_json}
+
+New message to process:
+{message}
 
 JSON response:'''
 
 
+async def _llm_extract(
+    draft: TicketDraft,
+    message_text: str,
+    summary: str | None = None,
+) -> dict[str, Any]:
+    """Ask the LLM for new draft fields in a message.
+
+    Args:
+        draft: Current draft
+        message_text: Latest human message
+        summary: Rolling summary of messages outside the window, if any
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON.
+    """
+    # Prepare prompt (message first: it is what the call is about)
+    budget = PromptBudget.for_task("extraction", EXTRACTION_SYSTEM_PROMPT + EXTRACTION_PROMPT)
+    message_text = budget.fit_text("message", message_text, share=0.5)
+    summary = budget.fit_text("summary", summary or "", share=0.1)
+    draft_json = budget.fit_draft(
+        "draft", draft, exclude={"evidence_links", "created_at", "updated_at"}
+    )
+    prompt = EXTRACTION_PROMPT.format(
+        summary=summary_context(summary),
+        draft_json=draft_json,
+        message=message_text,
+    )
+
+    llm = get_llm_for_task("extraction")
+    response_text = await llm.chat(
+        prompt,
+        system_message=EXTRACTION_SYSTEM_PROMPT,
+        resilience="hedge",  # On the turn's critical path
+    )
+    response_text = response_text.strip()
+
+    # Parse JSON response
+    # Handle markdown code blocks
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+        response_text = response_text.strip()
+
+    return json.loads(response_text) if response_text and response_text != "{}" else {}
+
+
+def _loop_stop_reason(draft: TicketDraft, patched: bool, steps: int) -> str | None:
+    """Decide whether another extraction pass could learn anything.
+
+    Args:
+        draft: Draft after this pass
+        patched: Whether this pass changed the draft
+        steps: step_count after this pass
+
+    Returns:
+        Stop reason, or None to run another pass
+    """
+    if draft.title or draft.problem:
+        return STOP_READY
+    if draft.is_empty():
+        return STOP_EMPTY
+    if not patched:
+        # Re-reading the same message with the same draft gives the same answer
+        return STOP_CONVERGED
+    if steps >= MAX_STEPS:
+        return STOP_MAX_STEPS
+    return None
+
+
 async def extraction_node(state: AgentState) -> dict[str, Any]:
     """Extract requirements from latest message and patch draft.
 
@@ -49,9 +140,13 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
     - Processes only the most recent human message
     - Uses answer matcher if pending questions exist
     - Uses LLM to identify new information
+    - In fused turn mode, gets both from one structured call and passes
+      its validation report on to validation_node
     - Patches draft with extracted fields
     - Adds evidence link for traceability
     - Increments step_count
+    - Records convergence (extracted message id, whether the pass patched
+      the draft, stop reason) in state["extraction_loop"]
 
     Returns partial state update.
     """
@@ -61,6 +156,7 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
     thread_ts = state.get("thread_ts", "")
     channel_id = state.get("channel_id", "")
     pending_questions = state.get("pending_questions")
+    summary = state.get("message_summary")
 
     # Inject channel context if not already present (Phase 8 - Global State)
     channel_context = state.get("channel_context")
@@ -96,9 +192,25 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
 
     message_text = latest_human.content if isinstance(latest_human.content, str) else str(latest_human.content)
 
+    message_id = getattr(latest_human, "id", None)
+    loop = state.get("extraction_loop") or {}
+    same_message = message_id is not None and loop.get("message_id") == message_id
+
+    # Fused turn mode: one structured call for extraction, validation and
+    # answer matching (falls back to separate calls if it fails)
+    questions = pending_questions.get("questions") if pending_questions else None
+    fused = None
+    if get_settings().fused_turn_mode:
+        fused = await run_fused_turn(draft, message_text, questions, summary)
+
     # If we have pending questions, use answer matcher first
     answer_match_result = None
-    if pending_questions and pending_questions.get("questions"):
+    if questions and fused is not None:
+        answer_match_result = build_match_result(questions, {
+            "matches": [m.model_dump() for m in fused.answer_matches],
+            "unanswered": fused.unanswered,
+        })
+    elif questions:
         try:
             answer_match_result = await match_answers(
                 questions=pending_questions.get("questions", []),
@@ -116,28 +228,15 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
         except Exception as e:
             logger.warning(f"Answer matching failed, falling back to extraction: {e}")
 
-    # Prepare prompt
-    draft_json = draft.model_dump_json(exclude={"evidence_links", "created_at", "updated_at"})
-    prompt = EXTRACTION_PROMPT.format(
-        draft_json=draft_json,
-        message=message_text,
-    )
-
-    # Call LLM for extraction
+    # Call LLM for extraction (unless the fused call already did). The pass
+    # only counts as a patch if the draft content actually changed - a
+    # model repeating existing values must not keep the loop going.
+    fingerprint_before = draft_fingerprint(draft)
     try:
-        llm = get_llm()
-        response_text = await llm.chat(prompt)
-        response_text = response_text.strip()
-
-        # Parse JSON response
-        # Handle markdown code blocks
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-
-        extracted = json.loads(response_text) if response_text and response_text != "{}" else {}
+        if fused is not None:
+            extracted = fused.extracted_fields()
+        else:
+            extracted = await _llm_extract(draft, message_text, summary)
 
         if extracted:
             logger.info(
@@ -148,18 +247,26 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
                 }
             )
 
-            # Handle list fields (append, don't replace)
+            # Handle list fields (append new items, don't replace or repeat)
             list_fields = ["acceptance_criteria", "dependencies", "risks"]
             for field in list_fields:
                 if field in extracted and isinstance(extracted[field], list):
-                    existing = getattr(draft, field, [])
-                    extracted[field] = existing + extracted[field]
+                    merged = list(getattr(draft, field, []))
+                    for item in extracted[field]:
+                        if item not in merged:
+                            merged.append(item)
+                    extracted[field] = merged
 
             # Handle constraints specially (list of dicts)
             if "constraints" in extracted:
                 existing_constraints = draft.constraints
                 for c in extracted["constraints"]:
                     if isinstance(c, dict) and "key" in c and "value" in c:
+                        if any(
+                            e.key == c["key"] and e.value == c["value"]
+                            for e in existing_constraints
+                        ):
+                            continue
                         existing_constraints.append(DraftConstraint(
                             key=c["key"],
                             value=c["value"],
@@ -188,17 +295,40 @@ async def extraction_node(state: AgentState) -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
 
+    # Record convergence for should_continue
+    patched = draft_fingerprint(draft) != fingerprint_before
+    stop_reason = _loop_stop_reason(draft, patched, step_count + 1)
+    extraction_loop = {
+        "message_id": message_id,
+        "patched": patched,
+        "passes": loop.get("passes", 0) + 1 if same_message else 1,
+        "stop_reason": stop_reason,
+    }
+    if stop_reason:
+        logger.info(
+            f"Extraction loop stopping: {stop_reason}",
+            extra={"thread_ts": thread_ts, **extraction_loop},
+        )
+
     # Build state update
     state_update = {
         "draft": draft,
         "step_count": step_count + 1,
         "phase": AgentPhase.COLLECTING,  # Stay in collecting after extraction
+        "extraction_loop": extraction_loop,
     }
 
     # Include channel context if newly fetched
     if channel_context is not None and state.get("channel_context") is None:
         state_update["channel_context"] = channel_context
 
+    # Hand the fused validation report to validation_node
+    if fused is not None:
+        state_update["fused_validation"] = {
+            "draft_fingerprint": draft_fingerprint(draft),
+            "report": fused.validation.model_dump(),
+        }
+
     # Include answer match result for decision node
     if answer_match_result:
         state_update["answer_match_result"] = {
@@ -0,0 +1,183 @@
+"""Fused turn - one structured LLM call per user message.
+
+In fused turn mode (settings.fused_turn_mode) extraction, validation and
+answer matching share a single structured-output call instead of three
+separate chat round trips that each repeat the draft JSON. The result is
+fed into the existing nodes:
+- extraction_node applies the draft patch and the answer matches
+- validation_node reuses the report if the draft is unchanged since
+
+If the fused call fails, extraction_node falls back to the separate calls.
+"""
+import json
+import logging
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.graph.message_window import summary_context
+from src.graph.nodes.validation import ValidationReport
+from src.llm import FinishReason, Message, MessageRole, get_llm_for_task
+from src.llm.guardrails import PromptBudget
+from src.schemas.draft import TicketDraft
+
+logger = logging.getLogger(__name__)
+
+
+class FusedConstraint(BaseModel):
+    """Technical decision extracted from the message."""
+    key: str
+    value: str
+
+
+class DraftPatch(BaseModel):
+    """Fields with new information (None/empty = unchanged)."""
+    title: Optional[str] = None
+    problem: Optional[str] = None
+    proposed_solution: Optional[str] = None
+    acceptance_criteria: list[str] = Field(default_factory=list)  # New criteria only
+    constraints: list[FusedConstraint] = Field(default_factory=list)
+    dependencies: list[str] = Field(default_factory=list)
+    risks: list[str] = Field(default_factory=list)
+
+
+class FusedAnswerMatch(BaseModel):
+    """Answer to one pending question."""
+    question_index: int  # 1-based
+    answer: str
+    confidence: float = 0.5
+    source_text: str = ""
+
+
+class FusedTurnResult(BaseModel):
+    """Structured output of the fused turn call."""
+    draft_patch: DraftPatch = Field(default_factory=DraftPatch)
+    validation: ValidationReport = Field(default_factory=ValidationReport)
+    answer_matches: list[FusedAnswerMatch] = Field(default_factory=list)
+    unanswered: list[int] = Field(default_factory=list)  # 1-based question indices
+
+    def extracted_fields(self) -> dict:
+        """Patch as the dict extraction_node expects (only fields with new info)."""
+        extracted = {}
+        for field, value in self.draft_patch.model_dump().items():
+            if value:
+                extracted[field] = value
+        return extracted
+
+
+# Static instructions first (provider prompt-cache prefix), per-call data last
+FUSED_TURN_SYSTEM_PROMPT = '''You are building a Jira ticket draft from a conversation.
+Do three things in one response.
+
+You will be given the current draft state, the questions previously asked (numbered)
+and a new message. A summary of earlier conversation may come first: use it to
+resolve references in the new message, not as a source of new draft values.
+
+1. draft_patch: ONLY the fields with new information from the message.
+   Leave other fields null/empty. Do not repeat existing values.
+   - title: Clear, concise ticket title
+   - problem: What problem we're solving
+   - proposed_solution: How we'll solve it
+   - acceptance_criteria: NEW testable criteria to append
+   - constraints: new {"key", "value"} technical decisions
+   - dependencies: new external dependencies
+   - risks: new potential risks
+   Only extract factual information stated in the message. Do not invent or assume.
+
+2. validation: validate the draft AFTER applying your draft_patch.
+   - is_valid: ready for preview? Requires a title, a problem and at least 1 acceptance criterion
+   - missing_fields: required but empty/insufficient
+   - conflicts: contradictory information
+   - suggestions: optional improvements
+   - quality_score: 0-100 overall readiness
+
+3. answer_matches / unanswered: for each question previously asked, the answer if the
+   message clearly contains one (question_index is 1-based, confidence 0.8+ only if
+   explicit; "yes"/"sure" = yes, "no"/"nope" = no), otherwise list its index in
+   unanswered. Leave both empty if no questions were asked.
+'''
+
+FUSED_TURN_PROMPT = '''{summary}Current draft state:
+{draft_json}
+
+Questions previously asked (numbered):
+{questions}
+
+New message to process:
+{message}
+'''
+
+
+async def run_fused_turn(
+    draft: TicketDraft,
+    message_text: str,
+    questions: Optional[list[str]] = None,
+    summary: Optional[str] = None,
+) -> Optional[FusedTurnResult]:
+    """Run the fused extraction + validation + answer matching call.
+
+    Args:
+        draft: Current draft (before this message).
+        message_text: Latest human message.
+        questions: Pending questions, if any.
+        summary: Rolling summary of messages outside the window, if any.
+
+    Returns:
+        FusedTurnResult, or None if the call failed (caller falls back).
+    """
+    numbered_questions = "\n".join(
+        f"{i}. {q}" for i, q in enumerate(questions or [], 1)
+    ) or "(none)"
+
+    budget = PromptBudget.for_task("fused_turn", FUSED_TURN_SYSTEM_PROMPT + FUSED_TURN_PROMPT)
+    message_text = budget.fit_text("message", message_text, share=0.4)
+    numbered_questions = budget.fit_text("questions", numbered_questions, share=0.2)
+    summary = budget.fit_text("summary", summary or "", share=0.1)
+    prompt = FUSED_TURN_PROMPT.format(
+        summary=summary_context(summary),
+        draft_json=budget.fit_draft(
+            "draft", draft, exclude={"evidence_links", "created_at", "updated_at"}
+        ),
+        questions=numbered_questions,
+        message=message_text,
+    )
+
+    try:
+        llm = get_llm_for_task("fused_turn")
+        result = await llm.invoke(
+            [
+                Message(
+                    role=MessageRole.SYSTEM, content=FUSED_TURN_SYSTEM_PROMPT, cache_prefix=True
+                ),
+                Message(role=MessageRole.USER, content=prompt),
+            ],
+            response_schema=FusedTurnResult,
+            resilience="hedge",  # On the turn's critical path
+        )
+        if result.finish_reason == FinishReason.ERROR:
+            logger.warning("Fused turn call failed, falling back to separate calls")
+            return None
+
+        # Structured output comes back as the parsed model; some providers
+        # return JSON text instead
+        if isinstance(result.raw, FusedTurnResult):
+            fused = result.raw
+        elif isinstance(result.raw, dict):
+            fused = FusedTurnResult(**result.raw)
+        else:
+            fused = FusedTurnResult(**json.loads(result.text))
+
+        logger.info(
+            "Fused turn complete",
+            extra={
+                "fields": list(fused.extracted_fields().keys()),
+                "is_valid": fused.validation.is_valid,
+                "matched": len(fused.answer_matches),
+                "latency_ms": result.latency_ms,
+            }
+        )
+        return fused
+
+    except Exception as e:
+        logger.warning(f"Fused turn failed, falling back to separate calls: {e}")
+        return None
@@ -6,15 +6,21 @@ falls back to rule-based checks for structural requirements.
 Output: ValidationReport with missing_fields[], conflicts[], suggestions[]
 Also runs persona-specific validators (Phase 9).
 """
+import asyncio
+import hashlib
 import json
 import logging
+import time
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from src.schemas.state import AgentState, AgentPhase
 from src.schemas.draft import TicketDraft
-from src.llm import get_llm
-from src.personas.types import PersonaName, ValidationFindings
+from src.config.settings import get_settings
+from src.llm import cache_if_parses, get_llm_for_task
+from src.llm.guardrails import PromptBudget
+from src.personas.types import PersonaName, ValidationFindings, ValidatorFinding
+from src.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -28,20 +34,18 @@ class ValidationReport(BaseModel):
     quality_score: int = 0  # 0-100, for prioritization
 
 
-VALIDATION_PROMPT = '''You are validating a Jira ticket draft for completeness and quality.
+# Static instructions first (provider prompt-cache prefix), per-call data last
+VALIDATION_SYSTEM_PROMPT = '''You are validating a Jira ticket draft for completeness and quality.
 
-Draft:
-{draft_json}
-
-Analyze this draft and provide a validation report as JSON:
+Analyze the draft you are given and provide a validation report as JSON:
 
-{{
+{
   "is_valid": true/false,  // Ready for preview?
   "missing_fields": ["field1", "field2"],  // Required but empty/insufficient
   "conflicts": ["description of conflict"],  // Contradictory information
   "suggestions": ["improvement suggestion"],  // Optional improvements
   "quality_score": 0-100  // Overall readiness score
-}}
+}
 
 Minimum requirements for is_valid=true:
 - title: Clear, concise (not empty)
@@ -51,11 +55,37 @@ Minimum requirements for is_valid=true:
 Check for:
 - Logical conflicts between stated requirements
 - Ambiguous or vague descriptions
-- Missing context that would be needed
+- Missing context that would be needed'''
+
+VALIDATION_PROMPT = '''Draft:
+{draft_json}
 
 JSON response:'''
 
 
+# Draft metadata that does not affect validation
+VALIDATION_EXCLUDE = {"evidence_links", "created_at", "updated_at", "id", "version"}
+
+
+def draft_fingerprint(draft: TicketDraft) -> str:
+    """Hash of the draft content that validation looks at.
+
+    Used to check that a validation report (from the previous turn or the
+    fused turn call) describes the current draft.
+    """
+    draft_json = draft.model_dump_json(exclude=VALIDATION_EXCLUDE)
+    return hashlib.sha256(draft_json.encode()).hexdigest()
+
+
+def draft_field_hashes(draft: TicketDraft) -> dict[str, str]:
+    """Per-field content hashes, for finding which fields changed."""
+    data = draft.model_dump(mode="json", exclude=VALIDATION_EXCLUDE)
+    return {
+        field: hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()[:16]
+        for field, value in data.items()
+    }
+
+
 def rule_based_validation(draft: TicketDraft) -> ValidationReport:
     """Fallback rule-based validation.
 
@@ -93,19 +123,89 @@ def rule_based_validation(draft: TicketDraft) -> ValidationReport:
     return report
 
 
+# Process-wide cap on validators that call the LLM (created on first use)
+_llm_validator_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_llm_validator_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent LLM-backed validators."""
+    global _llm_validator_semaphore
+    if _llm_validator_semaphore is None:
+        _llm_validator_semaphore = asyncio.Semaphore(get_settings().validator_llm_concurrency)
+    return _llm_validator_semaphore
+
+
+async def _run_validator(
+    validator,
+    draft: TicketDraft,
+    context: Optional[dict],
+    timeout: float,
+) -> tuple[list[ValidatorFinding], float]:
+    """Run one validator under its timeout.
+
+    Returns:
+        Tuple of (findings, latency in ms).
+
+    Raises:
+        asyncio.TimeoutError: If the validator exceeds its timeout.
+    """
+    start = time.perf_counter()
+    with span(f"validator.{validator.name}", kind="validator", uses_llm=validator.uses_llm):
+        if validator.uses_llm:
+            async with _get_llm_validator_semaphore():
+                result = await asyncio.wait_for(validator.validate(draft, context), timeout)
+        else:
+            result = await asyncio.wait_for(validator.validate(draft, context), timeout)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _can_reuse(
+    validator,
+    changed_fields: Optional[set[str]],
+    previous: Optional[ValidationFindings],
+) -> bool:
+    """True if the validator's previous findings still hold.
+
+    Requires a previous run of the same validator that completed (did not
+    time out or fail). With no changed fields any completed run holds;
+    otherwise the validator's declared field dependencies must not have
+    been touched by the latest change.
+    """
+    if changed_fields is None or previous is None:
+        return False
+    if validator.name not in previous.validators_run or validator.name in previous.timed_out:
+        return False
+    if not changed_fields:
+        return True
+    if not validator.depends_on:
+        return False
+    return not changed_fields.intersection(validator.depends_on)
+
+
 async def run_persona_validators(
     draft: TicketDraft,
     persona: str,
     context: Optional[dict] = None,
+    changed_fields: Optional[set[str]] = None,
+    previous: Optional[ValidationFindings] = None,
 ) -> ValidationFindings:
     """Run validators for the current persona.
 
-    Also runs silent validators based on topic detection.
+    Also runs silent validators based on topic detection. When the fields
+    changed since the previous run are known, validators that do not
+    depend on any of them keep their previous findings instead of re-running.
+
+    Validators run concurrently, each under validator_timeout_seconds, with
+    LLM-backed validators capped at validator_llm_concurrency. Whatever has
+    finished by validator_deadline_seconds is returned; slower validators
+    are cancelled and listed in timed_out.
 
     Args:
         draft: Ticket draft to validate.
         persona: Current persona name.
         context: Optional context dict.
+        changed_fields: Draft fields changed since `previous` (None = unknown).
+        previous: Findings from the previous run for the same persona.
 
     Returns:
         ValidationFindings with all findings.
@@ -123,19 +223,11 @@ async def run_persona_validators(
     except ValueError:
         current_persona = PersonaName.PM
 
-    # Run mandatory validators for current persona
+    # Mandatory validators for current persona
     mandatory_names = PERSONA_VALIDATORS.get(current_persona, ())
-    mandatory_validators = registry.get_by_names(mandatory_names)
-
-    for validator in mandatory_validators:
-        try:
-            validator_findings = await validator.validate(draft, context)
-            for f in validator_findings:
-                findings.add(f)
-        except Exception as e:
-            logger.warning(f"Validator {validator.name} failed: {e}")
+    selected = list(registry.get_by_names(mandatory_names))
 
-    # Run silent validators based on topic detection
+    # Silent validators based on topic detection
     # Combine all text for detection
     draft_text = f"{draft.title} {draft.problem} {draft.proposed_solution}"
     detector = TopicDetector()
@@ -146,30 +238,61 @@ async def run_persona_validators(
         security_config = SILENT_VALIDATORS.get("security", {})
         if detection.security_score >= security_config.get("threshold", 0.75):
             silent_names = security_config.get("validators", ())
-            silent_validators = registry.get_by_names(silent_names)
-            for validator in silent_validators:
-                if validator not in mandatory_validators:  # Don't run twice
-                    try:
-                        validator_findings = await validator.validate(draft, context)
-                        for f in validator_findings:
-                            findings.add(f)
-                    except Exception as e:
-                        logger.warning(f"Silent validator {validator.name} failed: {e}")
+            selected.extend(v for v in registry.get_by_names(silent_names) if v not in selected)
 
     # Architect silent checks (if above threshold and not already Architect persona)
     if current_persona != PersonaName.ARCHITECT:
         architect_config = SILENT_VALIDATORS.get("architect", {})
         if detection.architect_score >= architect_config.get("threshold", 0.60):
             silent_names = architect_config.get("validators", ())
-            silent_validators = registry.get_by_names(silent_names)
-            for validator in silent_validators:
-                if validator not in mandatory_validators:
-                    try:
-                        validator_findings = await validator.validate(draft, context)
-                        for f in validator_findings:
-                            findings.add(f)
-                    except Exception as e:
-                        logger.warning(f"Silent validator {validator.name} failed: {e}")
+            selected.extend(v for v in registry.get_by_names(silent_names) if v not in selected)
+
+    settings = get_settings()
+    results: dict[str, list[ValidatorFinding]] = {}
+    tasks: dict[asyncio.Task, Any] = {}
+    reused = 0
+    for validator in selected:
+        if _can_reuse(validator, changed_fields, previous):
+            results[validator.name] = [
+                f for f in previous.findings if f.validator == validator.name
+            ]
+            reused += 1
+        else:
+            task = asyncio.ensure_future(
+                _run_validator(validator, draft, context, settings.validator_timeout_seconds)
+            )
+            tasks[task] = validator
+
+    if tasks:
+        done, pending = await asyncio.wait(
+            list(tasks), timeout=settings.validator_deadline_seconds
+        )
+
+        # Deadline hit: return partial findings
+        for task in pending:
+            task.cancel()
+            findings.timed_out.append(tasks[task].name)
+            logger.warning(f"Validator {tasks[task].name} missed the validation deadline")
+
+        for task in done:
+            validator = tasks[task]
+            try:
+                validator_findings, latency_ms = task.result()
+                results[validator.name] = validator_findings
+                findings.validator_latency_ms[validator.name] = round(latency_ms, 2)
+            except asyncio.TimeoutError:
+                findings.timed_out.append(validator.name)
+                logger.warning(f"Validator {validator.name} timed out")
+            except Exception as e:
+                findings.failed.append(validator.name)
+                logger.warning(f"Validator {validator.name} failed: {e}")
+
+    # Collect in selection order so output is stable across runs
+    for validator in selected:
+        if validator.name in results:
+            for f in results[validator.name]:
+                findings.add(f)
+            findings.validators_run.append(validator.name)
 
     logger.info(
         "Persona validation complete",
@@ -177,17 +300,79 @@ async def run_persona_validators(
             "persona": persona,
             "total_findings": len(findings.findings),
             "blocking": findings.has_blocking,
+            "validators": len(selected),
+            "reused": reused,
+            "timed_out": findings.timed_out,
+            "failed": findings.failed,
+            "latency_ms": findings.validator_latency_ms,
         }
     )
 
     return findings
 
 
+def _parse_validation_report(text: str) -> ValidationReport:
+    """Parse the validation JSON answer (optionally in a markdown code block).
+
+    Raises:
+        ValueError: If the answer is not a valid report (JSONDecodeError and
+            pydantic ValidationError are ValueErrors).
+    """
+    response_text = text.strip()
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+        response_text = response_text.strip()
+    return ValidationReport(**json.loads(response_text))
+
+
+async def _llm_validation(draft: TicketDraft) -> tuple[ValidationReport, bool]:
+    """Validate draft with the LLM, falling back to rule-based checks.
+
+    Returns:
+        Tuple of (report, True if the report came from the LLM).
+    """
+    try:
+        budget = PromptBudget.for_task("validation", VALIDATION_SYSTEM_PROMPT + VALIDATION_PROMPT)
+        draft_json = budget.fit_draft("draft", draft, exclude=VALIDATION_EXCLUDE)
+        prompt = VALIDATION_PROMPT.format(draft_json=draft_json)
+
+        llm = get_llm_for_task("validation")
+        # Deterministic route, so cached (the same draft is re-validated on
+        # chit-chat replies); only answers that parse into a report are stored
+        response_text = await llm.chat(
+            prompt,
+            system_message=VALIDATION_SYSTEM_PROMPT,
+            cache_if=cache_if_parses(_parse_validation_report),
+        )
+        report = _parse_validation_report(response_text)
+
+        logger.info(
+            "LLM validation complete",
+            extra={
+                "is_valid": report.is_valid,
+                "missing_count": len(report.missing_fields),
+                "quality_score": report.quality_score,
+            }
+        )
+
+    except Exception as e:
+        logger.warning(f"LLM validation failed, using rule-based: {e}")
+        return rule_based_validation(draft), False
+
+    return report, True
+
+
 async def validation_node(state: AgentState) -> dict[str, Any]:
     """Validate draft and produce detailed report.
 
-    - Uses LLM for semantic validation
+    - Skips entirely if the draft is unchanged since the last validation
+      and that run was complete (LLM report, every validator finished)
+    - Reuses the fused turn report when it matches the current draft
+    - Otherwise uses LLM for semantic validation
     - Falls back to rule-based if LLM fails
+    - Re-runs only persona validators that depend on changed fields
     - Stores report in state for decision node
 
     Returns partial state update.
@@ -205,50 +390,72 @@ async def validation_node(state: AgentState) -> dict[str, Any]:
             ).model_dump(),
         }
 
-    # Try LLM validation first
-    try:
-        draft_json = draft.model_dump_json(
-            exclude={"evidence_links", "created_at", "updated_at", "id"}
+    persona = state.get("persona", "pm")
+    fingerprint = draft_fingerprint(draft)
+    field_hashes = draft_field_hashes(draft)
+    validated = state.get("validated_draft") or {}
+    same_persona = validated.get("persona") == persona
+
+    # Unchanged draft (e.g., "thanks"/"ok" replies): keep previous report and
+    # findings, but only if that run was complete. A rule-based fallback
+    # report or timed out / failed validators are retried instead of being
+    # frozen until the draft changes.
+    unchanged = (
+        same_persona
+        and validated.get("fingerprint") == fingerprint
+        and bool(state.get("validation_report"))
+    )
+    if unchanged and validated.get("report_complete") and validated.get("validators_complete"):
+        report = ValidationReport(**state["validation_report"])
+        logger.info(
+            "Draft unchanged since last validation, reusing results",
+            extra={"is_valid": report.is_valid, "quality_score": report.quality_score},
         )
-        prompt = VALIDATION_PROMPT.format(draft_json=draft_json)
-
-        llm = get_llm()
-        response_text = await llm.chat(prompt)
-        response_text = response_text.strip()
-
-        # Parse JSON response
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-
-        report_data = json.loads(response_text)
-        report = ValidationReport(**report_data)
+        return {
+            "step_count": step_count + 1,
+            "phase": AgentPhase.VALIDATING if report.is_valid else AgentPhase.COLLECTING,
+            "fused_validation": None,
+        }
 
+    # Reuse the report from the fused turn call if it covers this draft
+    fused_validation = state.get("fused_validation")
+    if unchanged and validated.get("report_complete"):
+        report = ValidationReport(**state["validation_report"])
+        report_complete = True
+        logger.info("Draft unchanged, re-running incomplete persona validators only")
+    elif fused_validation and fused_validation.get("draft_fingerprint") == fingerprint:
+        report = ValidationReport(**fused_validation["report"])
+        report_complete = True
         logger.info(
-            "LLM validation complete",
+            "Using fused turn validation",
             extra={
                 "is_valid": report.is_valid,
                 "missing_count": len(report.missing_fields),
                 "quality_score": report.quality_score,
             }
         )
-
-    except Exception as e:
-        logger.warning(f"LLM validation failed, using rule-based: {e}")
-        report = rule_based_validation(draft)
+    else:
+        report, report_complete = await _llm_validation(draft)
 
     # Run persona-specific validators (Phase 9)
-    persona = state.get("persona", "pm")
     channel_context = state.get("channel_context")
 
+    # Fields changed since the last validation (same persona only)
+    changed_fields: Optional[set[str]] = None
+    previous_findings: Optional[ValidationFindings] = None
+    if same_persona and validated.get("field_hashes") and state.get("validator_findings"):
+        old_hashes = validated["field_hashes"]
+        changed_fields = {f for f, h in field_hashes.items() if old_hashes.get(f) != h}
+        previous_findings = ValidationFindings(**state["validator_findings"])
+
     persona_findings: Optional[ValidationFindings] = None
     try:
         persona_findings = await run_persona_validators(
             draft=draft,
             persona=persona,
             context=channel_context,
+            changed_fields=changed_fields,
+            previous=previous_findings,
         )
 
         # Merge blocking findings with is_valid
@@ -269,4 +476,12 @@ async def validation_node(state: AgentState) -> dict[str, Any]:
         "phase": next_phase,
         "validation_report": report.model_dump(),
         "validator_findings": persona_findings.model_dump() if persona_findings else None,
+        "fused_validation": None,  # Consumed
+        "validated_draft": {
+            "fingerprint": fingerprint,
+            "field_hashes": field_hashes,
+            "persona": persona,
+            "report_complete": report_complete,
+            "validators_complete": persona_findings is not None and persona_findings.complete,
+        },
     }
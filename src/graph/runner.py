@@ -5,10 +5,14 @@ Handles:
 - Interrupt at ASK/PREVIEW for human-in-the-loop
 - Resume with new messages
 - State persistence via checkpointer
+- Turn-scoped state sessions (one checkpoint read/write per turn)
 """
 import asyncio
 import logging
-from typing import Optional, Any, TYPE_CHECKING
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional, Any, TYPE_CHECKING
 from datetime import datetime
 
 from langchain_core.messages import HumanMessage
@@ -16,13 +20,168 @@ from langchain_core.messages import HumanMessage
 from src.schemas.state import AgentState, AgentPhase
 from src.schemas.draft import TicketDraft
 from src.graph.graph import get_compiled_graph
+from src.graph.message_window import apply_message_window, visible_messages
+from src.config import get_settings
+from src.registry import BoundedRegistry
+from src.tracing import span, trace_turn
+from src.metrics import TURN_SECONDS
 
 if TYPE_CHECKING:
+    from src.db.session_lock import SessionLease
     from src.slack.session import SessionIdentity
 
 logger = logging.getLogger(__name__)
 
 
+# Turns held by the current context, by session ID (see GraphRunner.turn)
+_active_turns: ContextVar[dict[str, "TurnSession"]] = ContextVar("active_turns", default={})
+
+
+class TurnSession:
+    """Turn-scoped view of a session's graph state.
+
+    Created by GraphRunner.turn(), which holds the session lock for the
+    whole turn. State is loaded once; mutations (persona switch, pending
+    questions, draft edits) are staged and written back as a single
+    checkpoint update when the turn ends. Mutations staged before
+    run_with_message() ride along in the graph input instead.
+
+    Turns are reentrant per task: the runner's own turn-taking methods
+    (store_pending_questions, handle_approval, ...) called inside a turn
+    join it, staging onto the same session, instead of waiting for the
+    session lock the task already holds.
+
+    With the distributed session lock, nothing is written once its lease
+    is lost or past max hold (another replica may own the session now):
+    the graph run and flush raise SessionLockLost instead, and checkpoint
+    writes in the middle of a graph run are refused by the checkpointer
+    (the run then returns an error result).
+    """
+
+    def __init__(
+        self,
+        runner: "GraphRunner",
+        state: dict[str, Any],
+        lease: Optional["SessionLease"] = None,
+    ):
+        self.runner = runner
+        self.state = state
+        self.lease = lease
+        self.owner = asyncio.current_task()
+        self._staged: dict[str, Any] = {}
+
+    @property
+    def dirty(self) -> bool:
+        """True if there are staged mutations not yet written."""
+        return bool(self._staged)
+
+    def update(self, **fields: Any) -> None:
+        """Stage state field updates.
+
+        Args:
+            **fields: State fields to set (e.g., persona="security")
+        """
+        self.state.update(fields)
+        self._staged.update(fields)
+
+    def set_draft(self, draft: TicketDraft) -> None:
+        """Stage an updated draft (e.g., after a modal edit)."""
+        self.update(draft=draft)
+
+    def set_pending_questions(self, question_set_dict: dict[str, Any]) -> None:
+        """Stage the QuestionSet ask_user returned.
+
+        Args:
+            question_set_dict: QuestionSet as dict (serialized for state)
+        """
+        self.update(pending_questions=question_set_dict)
+        logger.debug(f"Staged pending questions: {question_set_dict.get('question_id')}")
+
+    def clear_pending_questions(self) -> dict[str, Any] | None:
+        """Stage moving pending questions to question_history.
+
+        Returns:
+            The cleared QuestionSet dict, or None if no pending questions
+        """
+        pending = self.state.get("pending_questions")
+        if not pending:
+            return None
+
+        history = list(self.state.get("question_history") or [])
+        history.append(pending)
+        self.update(question_history=history, pending_questions=None)
+        logger.debug(f"Staged clearing pending questions: {pending.get('question_id')}")
+        return pending
+
+    async def run_with_message(self, message_text: str, user_id: str) -> dict[str, Any]:
+        """Run graph with new message on the loaded state.
+
+        The graph checkpoints its own result, including anything staged so
+        far, so staged mutations are not written again at the end of the turn.
+
+        Returns:
+            Result dict (see GraphRunner.run_with_message)
+
+        Raises:
+            SessionLockLost: If the distributed lock lease was lost before
+                the graph run.
+        """
+        if self.lease:
+            self.lease.check()  # The graph checkpoints as it runs
+        try:
+            state = dict(self.state)
+
+            # Add new message
+            new_message = HumanMessage(
+                content=message_text,
+                id=f"{self.runner.identity.thread_ts}:{datetime.utcnow().isoformat()}",
+            )
+            state["messages"] = state.get("messages", []) + [new_message]
+
+            # Update session context
+            state["thread_ts"] = self.runner.identity.thread_ts
+            state["channel_id"] = self.runner.identity.channel_id
+            state["user_id"] = user_id
+
+            # Keep only the recent messages inline; older ones go to the archive
+            state = await apply_message_window(self.runner.identity.session_id, state)
+
+            # Run graph
+            result_state = await self.runner._run_until_interrupt(state)
+            result_state["messages"] = visible_messages(result_state.get("messages", []))
+            self.state = result_state
+            self._staged.clear()
+
+            # Interpret result
+            return self.runner._interpret_result(result_state)
+
+        except Exception as e:
+            logger.error(f"Graph run failed: {e}", exc_info=True)
+            return {"action": "error", "error": str(e)}
+
+    async def flush(self) -> None:
+        """Write staged mutations as one checkpoint update (no-op if clean).
+
+        Raises:
+            SessionLockLost: If the distributed lock lease was lost or
+                expired during the turn (staged mutations are discarded).
+        """
+        if not self._staged:
+            return
+        if self.lease:
+            self.lease.check()
+        with span("checkpoint.update_state", kind="checkpoint", fields=sorted(self._staged)):
+            await self.runner.graph.aupdate_state(self.runner._config, self._staged)
+        logger.debug(
+            "Turn state flushed",
+            extra={
+                "session_id": self.runner.identity.session_id,
+                "fields": sorted(self._staged),
+            },
+        )
+        self._staged = {}
+
+
 class GraphRunner:
     """Manages graph execution for a session.
 
@@ -43,6 +202,45 @@ class GraphRunner:
         if self.graph is None:
             self.graph = await get_compiled_graph()
 
+    @asynccontextmanager
+    async def turn(self) -> AsyncIterator[TurnSession]:
+        """Open a turn-scoped state session.
+
+        Holds the session lock for the turn (cluster-wide when
+        session_lock_distributed is on), loads state once, and flushes
+        staged mutations as one checkpoint write on exit. If the block
+        raises, staged mutations are discarded. The turn is traced (see
+        src.tracing), lock wait included, and its LLM calls are attributed
+        to the team and session for token accounting.
+
+        Usage:
+            async with runner.turn() as turn:
+                turn.update(persona="security")
+                result = await turn.run_with_message(text, user_id)
+                turn.set_pending_questions(question_set)
+        """
+        session_id = self.identity.session_id
+        outer = _active_turns.get().get(session_id)
+        if outer is not None and outer.owner is asyncio.current_task():
+            yield outer
+            return
+
+        from src.llm.accounting import usage_scope
+        from src.slack.session import session_lock
+        start = time.perf_counter()
+        try:
+            with trace_turn(session_id), usage_scope(self.identity.team_id, session_id):
+                async with session_lock(session_id) as lease:
+                    session = TurnSession(self, await self._get_current_state(), lease)
+                    token = _active_turns.set({**_active_turns.get(), session_id: session})
+                    try:
+                        yield session
+                        await session.flush()
+                    finally:
+                        _active_turns.reset(token)
+        finally:
+            TURN_SECONDS.observe(time.perf_counter() - start)
+
     async def run_with_message(
         self,
         message_text: str,
@@ -59,40 +257,19 @@ class GraphRunner:
             - draft: TicketDraft (if action=preview)
             - error: str (if action=error)
         """
-        from src.slack.session import get_session_lock
-        lock = get_session_lock(self.identity.session_id)
-        async with lock:
-            try:
-                # Get current state or initialize
-                state = await self._get_current_state()
-
-                # Add new message
-                new_message = HumanMessage(
-                    content=message_text,
-                    id=f"{self.identity.thread_ts}:{datetime.utcnow().isoformat()}",
-                )
-                state["messages"] = state.get("messages", []) + [new_message]
-
-                # Update session context
-                state["thread_ts"] = self.identity.thread_ts
-                state["channel_id"] = self.identity.channel_id
-                state["user_id"] = user_id
-
-                # Run graph
-                result_state = await self._run_until_interrupt(state)
-
-                # Interpret result
-                return self._interpret_result(result_state)
-
-            except Exception as e:
-                logger.error(f"Graph run failed: {e}", exc_info=True)
-                return {"action": "error", "error": str(e)}
+        try:
+            async with self.turn() as turn:
+                return await turn.run_with_message(message_text, user_id)
+        except Exception as e:
+            logger.error(f"Graph run failed: {e}", exc_info=True)
+            return {"action": "error", "error": str(e)}
 
     async def _get_current_state(self) -> dict[str, Any]:
         """Get current state from checkpointer or initialize new."""
         await self._ensure_graph()
         try:
-            checkpoint = await self.graph.aget_state(self._config)
+            with span("checkpoint.get_state", kind="checkpoint"):
+                checkpoint = await self.graph.aget_state(self._config)
             if checkpoint and checkpoint.values:
                 return dict(checkpoint.values)
         except Exception as e:
@@ -114,6 +291,9 @@ class GraphRunner:
             "question_history": [],
             # First message tracking
             "is_first_message": True,
+            # Rolling message window
+            "message_summary": None,
+            "archived_message_count": 0,
         }
 
     async def _run_until_interrupt(self, state: dict[str, Any]) -> dict[str, Any]:
@@ -191,19 +371,12 @@ class GraphRunner:
         If approved, set phase to READY_TO_CREATE.
         If rejected, return to COLLECTING.
         """
-        from src.slack.session import get_session_lock
-        lock = get_session_lock(self.identity.session_id)
-        async with lock:
-            state = await self._get_current_state()
-
+        async with self.turn() as turn:
             if approved:
-                state["phase"] = AgentPhase.READY_TO_CREATE
-                # Save state
-                await self.graph.aupdate_state(self._config, state)
-                return {"action": "ready", "draft": state.get("draft")}
+                turn.update(phase=AgentPhase.READY_TO_CREATE)
+                return {"action": "ready", "draft": turn.state.get("draft")}
             else:
-                state["phase"] = AgentPhase.COLLECTING
-                await self.graph.aupdate_state(self._config, state)
+                turn.update(phase=AgentPhase.COLLECTING)
                 return {"action": "continue"}
 
     async def store_pending_questions(self, question_set_dict: dict[str, Any]) -> None:
@@ -212,13 +385,8 @@ class GraphRunner:
         Args:
             question_set_dict: QuestionSet as dict (serialized for state)
         """
-        from src.slack.session import get_session_lock
-        lock = get_session_lock(self.identity.session_id)
-        async with lock:
-            state = await self._get_current_state()
-            state["pending_questions"] = question_set_dict
-            await self.graph.aupdate_state(self._config, state)
-            logger.debug(f"Stored pending questions: {question_set_dict.get('question_id')}")
+        async with self.turn() as turn:
+            turn.set_pending_questions(question_set_dict)
 
     async def clear_pending_questions(self) -> dict[str, Any] | None:
         """Clear pending questions when user responds.
@@ -228,24 +396,8 @@ class GraphRunner:
         Returns:
             The cleared QuestionSet dict, or None if no pending questions
         """
-        from src.slack.session import get_session_lock
-        lock = get_session_lock(self.identity.session_id)
-        async with lock:
-            state = await self._get_current_state()
-            pending = state.get("pending_questions")
-
-            if pending:
-                # Move to history
-                history = state.get("question_history", [])
-                history.append(pending)
-                state["question_history"] = history
-                state["pending_questions"] = None
-
-                await self.graph.aupdate_state(self._config, state)
-                logger.debug(f"Cleared pending questions: {pending.get('question_id')}")
-                return pending
-
-            return None
+        async with self.turn() as turn:
+            return turn.clear_pending_questions()
 
     async def get_pending_questions(self) -> dict[str, Any] | None:
         """Get current pending questions.
@@ -265,9 +417,8 @@ class GraphRunner:
             draft: Updated TicketDraft
         """
         try:
-            state = await self._get_current_state()
-            state["draft"] = draft
-            await self.graph.aupdate_state(self._config, state)
+            async with self.turn() as turn:
+                turn.set_draft(draft)
             logger.debug(f"Updated draft version to {draft.version}")
         except Exception as e:
             logger.error(f"Failed to update draft: {e}", exc_info=True)
@@ -288,19 +439,95 @@ class GraphRunner:
             logger.error(f"Failed to update state: {e}", exc_info=True)
 
 
-# Session runner cache
-_runners: dict[str, "GraphRunner"] = {}
+# Session runner cache (bounded, created on first use)
+# Runners hold no state of their own (it lives in the checkpointer), so an
+# evicted runner (LRU cap or idle TTL) is simply recreated on the next
+# message: is_active_session() falls back to the persisted checkpoint.
+_runners: Optional[BoundedRegistry[GraphRunner]] = None
+
+
+def _get_runner_registry() -> BoundedRegistry[GraphRunner]:
+    """Get or create the runner registry (sized from settings)."""
+    global _runners
+    if _runners is None:
+        settings = get_settings()
+        _runners = BoundedRegistry(
+            name="graph_runners",
+            max_size=settings.session_registry_max_size,
+            idle_ttl_seconds=settings.session_registry_idle_ttl_seconds,
+        )
+    return _runners
 
 
 def get_runner(identity: "SessionIdentity") -> GraphRunner:
     """Get or create runner for session."""
-    if identity.session_id not in _runners:
-        _runners[identity.session_id] = GraphRunner(identity)
-    return _runners[identity.session_id]
+    return _get_runner_registry().get_or_create(
+        identity.session_id,
+        lambda: GraphRunner(identity),
+    )
+
+
+def has_runner(session_id: str) -> bool:
+    """True if the session has a live runner (fast path of is_active_session)."""
+    return session_id in _get_runner_registry()
+
+
+# Checkpoint-existence lookups for threads without a live runner:
+# session_id -> (has checkpoint, checked at monotonic). Thread chatter the
+# bot is not part of is filtered without a query per message.
+_presence: Optional[BoundedRegistry[tuple[bool, float]]] = None
+
+
+def _get_presence_cache() -> BoundedRegistry[tuple[bool, float]]:
+    """Get or create the checkpoint-existence cache."""
+    global _presence
+    if _presence is None:
+        settings = get_settings()
+        _presence = BoundedRegistry(
+            name="checkpoint_presence",
+            max_size=settings.session_registry_max_size,
+            idle_ttl_seconds=settings.session_presence_cache_seconds,
+        )
+    return _presence
+
+
+async def is_active_session(identity: "SessionIdentity") -> bool:
+    """True if the bot is active in the thread.
+
+    A live runner answers without I/O; otherwise the thread is active if it
+    has a persisted checkpoint, so runners evicted from the registry keep
+    answering. Checkpoint lookups are cached for
+    settings.session_presence_cache_seconds (negative answers expire too,
+    since another replica may start the thread).
+    """
+    session_id = identity.session_id
+    if has_runner(session_id):
+        return True
+
+    cache = _get_presence_cache()
+    now = time.monotonic()
+    entry = cache.get(session_id)
+    if entry is not None and now - entry[1] < get_settings().session_presence_cache_seconds:
+        return entry[0]
+
+    from src.db.checkpointer import thread_has_checkpoint
+
+    try:
+        exists = await thread_has_checkpoint(session_id)
+    except Exception as e:
+        logger.warning(f"Active session check failed: {e}", extra={"session_id": session_id})
+        return False
+    cache.remove(session_id)
+    cache.get_or_create(session_id, lambda: (exists, now))
+    return exists
 
 
 def cleanup_runner(session_id: str) -> None:
     """Clean up runner when session ends."""
-    if session_id in _runners:
-        del _runners[session_id]
+    if _get_runner_registry().remove(session_id):
         logger.debug(f"Cleaned up runner for {session_id}")
+
+
+def get_runner_stats() -> dict[str, Any]:
+    """Get runner registry metrics (size, evictions, hit rate)."""
+    return _get_runner_registry().get_stats()
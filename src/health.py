@@ -1,29 +1,266 @@
-"""Minimal health server for Docker healthcheck."""
+"""Health server: liveness, readiness and Prometheus metrics.
 
+Endpoints:
+- /health: liveness (process is up) for the Docker healthcheck
+- /ready: readiness - Postgres answers, the checkpointer can read, and the
+  graph is compiled. Results are cached for settings.ready_cache_seconds
+  so frequent probes do not load the database.
+- /metrics: Prometheus text exposition format (src.metrics counters and
+  histograms, plus gauges collected from pool/registry/scheduler stats)
+
+Checks run on the background event loop, which owns the connection pool.
+"""
+
+import asyncio
+import json
 import logging
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
-_server: HTTPServer | None = None
+_server: ThreadingHTTPServer | None = None
 _thread: threading.Thread | None = None
 
+# Cached readiness: (checked_at monotonic, ready, checks)
+_ready_cache: Optional[tuple[float, bool, dict[str, str]]] = None
+_ready_lock = threading.Lock()
+
+
+async def _check_dependencies() -> dict[str, str]:
+    """Check Postgres and the checkpointer. Returns {check: "ok" | error}."""
+    from src.db.checkpointer import get_checkpointer
+    from src.db.connection import get_connection
+
+    checks: dict[str, str] = {}
+    try:
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT 1")
+                await cur.fetchone()
+        checks["postgres"] = "ok"
+    except Exception as e:
+        checks["postgres"] = f"error: {e}"
+
+    try:
+        checkpointer = await get_checkpointer()
+        await checkpointer.aget_tuple(
+            {"configurable": {"thread_id": "__readiness__", "checkpoint_ns": ""}}
+        )
+        checks["checkpointer"] = "ok"
+    except Exception as e:
+        checks["checkpointer"] = f"error: {e}"
+
+    return checks
+
+
+def check_readiness() -> tuple[bool, dict[str, str]]:
+    """Run (or reuse cached) readiness checks.
+
+    Returns:
+        Tuple of (ready, {check: "ok" | reason})
+    """
+    global _ready_cache
+    from src.config import get_settings
+    from src.graph.graph import is_graph_compiled
+    from src.slack.scheduler import get_background_loop
+
+    settings = get_settings()
+    with _ready_lock:
+        now = time.monotonic()
+        if _ready_cache and now - _ready_cache[0] < settings.ready_cache_seconds:
+            return _ready_cache[1], _ready_cache[2]
+
+        if not is_graph_compiled():
+            checks = {"graph": "not compiled"}
+        else:
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    _check_dependencies(), get_background_loop()
+                )
+                checks = future.result(timeout=settings.ready_check_timeout_seconds)
+            except Exception as e:
+                checks = {"dependencies": f"error: {str(e) or type(e).__name__}"}
+            checks["graph"] = "ok"
+
+        ready = all(status == "ok" for status in checks.values())
+        _ready_cache = (now, ready, checks)
+        if not ready:
+            logger.warning("Readiness check failed", extra={"checks": checks})
+        return ready, checks
+
+
+def _gauge(name: str, help_text: str, value: Optional[float]) -> list[str]:
+    """Render an unlabelled gauge (skipped if the value is None)."""
+    from src.metrics import render_gauges
+
+    return render_gauges(name, help_text, [({}, value)])
+
+
+def _stats_gauges() -> list[str]:
+    """Collect gauges from the stats functions of each subsystem."""
+    from src.db.connection import get_pool_stats
+    from src.db.session_lock import get_advisory_lock_stats
+    from src.graph.runner import get_runner_stats
+    from src.llm.accounting import get_token_accountant
+    from src.llm.adapter_registry import get_adapter_stats
+    from src.llm.rate_limit import get_rate_limiter_stats
+    from src.metrics import render_gauges
+    from src.slack.dedup import get_dedup_stats
+    from src.slack.scheduler import get_background_loop, get_scheduler_stats
+    from src.slack.session import get_session_lock_stats
+
+    lines: list[str] = []
+
+    pool = get_pool_stats()
+    lines += _gauge("maro_db_pool_size", "Open pooled connections", pool.get("pool_size"))
+    lines += _gauge("maro_db_pool_in_use", "Pooled connections checked out", pool.get("in_use"))
+    lines += _gauge(
+        "maro_db_pool_waiting",
+        "Requests waiting for a connection",
+        pool.get("requests_waiting"),
+    )
+    lines += _gauge(
+        "maro_db_pool_utilisation",
+        "Checked out / max pool size",
+        pool.get("utilisation"),
+    )
+    lines += _gauge(
+        "maro_db_checkout_wait_max_ms",
+        "Longest connection checkout wait",
+        pool.get("checkout_wait_max_ms"),
+    )
+    lines += _gauge(
+        "maro_db_checkout_timeouts",
+        "Connection checkout timeouts",
+        pool.get("checkout_timeouts"),
+    )
+
+    dedup = get_dedup_stats()
+    lines += render_gauges(
+        "maro_dedup_entries",
+        "Dedup keys held in memory",
+        [({"store": store}, stats["size"]) for store, stats in dedup.items()],
+    )
+
+    adapters = get_adapter_stats()
+    lines += render_gauges(
+        "maro_registry_size",
+        "Per-session registry size",
+        [
+            ({"registry": "graph_runners"}, get_runner_stats()["size"]),
+            ({"registry": "session_locks"}, get_session_lock_stats()["size"]),
+            ({"registry": "llm_adapters"}, adapters["size"]),
+        ],
+    )
+    lines += _gauge(
+        "maro_llm_adapter_reuses",
+        "LLM calls served by a reused adapter/HTTP client",
+        adapters["hits"],
+    )
+
+    advisory = get_advisory_lock_stats()
+    lines += _gauge(
+        "maro_session_locks_held",
+        "Distributed session locks held by this replica",
+        advisory["held"],
+    )
+
+    limiters = get_rate_limiter_stats()
+    lines += render_gauges(
+        "maro_llm_concurrency_limit",
+        "Adaptive in-flight limit per provider/model",
+        [({"limiter": name}, stats["concurrency_limit"]) for name, stats in limiters.items()],
+    )
+    lines += render_gauges(
+        "maro_llm_in_flight",
+        "LLM calls in flight per provider/model",
+        [({"limiter": name}, stats["in_flight"]) for name, stats in limiters.items()],
+    )
+    lines += render_gauges(
+        "maro_llm_queued",
+        "LLM calls waiting for a rate limiter slot",
+        [({"limiter": name}, stats["queued"]) for name, stats in limiters.items()],
+    )
+
+    usage = get_token_accountant().get_stats()
+    lines += render_gauges(
+        "maro_llm_team_tokens",
+        "LLM tokens (prompt + completion) by team since process start",
+        [({"team": team}, tokens) for team, tokens in usage["tokens_by_team"].items()],
+    )
+    lines += _gauge(
+        "maro_llm_usage_pending_rows",
+        "Token usage rollups not yet flushed",
+        usage["pending_rows"],
+    )
+
+    scheduler = get_scheduler_stats()
+    lines += _gauge(
+        "maro_scheduler_queue_depth",
+        "Work admitted but not yet running",
+        scheduler.get("queue_depth"),
+    )
+    lines += _gauge(
+        "maro_scheduler_running",
+        "Work running on the background loop",
+        scheduler.get("running"),
+    )
+    lines += _gauge(
+        "maro_scheduler_rejected",
+        "Work shed by admission control",
+        scheduler.get("rejected"),
+    )
+    lines += _gauge("maro_scheduler_wait_p95_ms", "Queue wait p95", scheduler.get("wait_p95_ms"))
+
+    try:
+        tasks: Optional[int] = len(asyncio.all_tasks(get_background_loop()))
+    except RuntimeError:
+        tasks = None
+    lines += _gauge("maro_event_loop_tasks", "Tasks alive on the background loop", tasks)
+
+    return lines
+
+
+def render_metrics_text() -> str:
+    """Full /metrics payload."""
+    from src.metrics import render_metrics
+
+    lines = render_metrics()
+    try:
+        lines += _stats_gauges()
+    except Exception as e:
+        logger.warning(f"Metrics collection failed: {e}")
+    return "\n".join(lines) + "\n"
+
 
 class HealthHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for health endpoint."""
+    """HTTP request handler for health, readiness and metrics."""
 
     def do_GET(self):
         """Handle GET requests."""
         if self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(b'{"status":"healthy"}')
+            self._send(200, "application/json", b'{"status":"healthy"}')
+        elif self.path == "/ready":
+            ready, checks = check_readiness()
+            body: dict[str, Any] = {"status": "ready" if ready else "not_ready", "checks": checks}
+            self._send(200 if ready else 503, "application/json", json.dumps(body).encode())
+        elif self.path == "/metrics":
+            self._send(200, "text/plain; version=0.0.4", render_metrics_text().encode())
         else:
             self.send_response(404)
             self.end_headers()
 
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        """Write a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, format, *args):
         """Suppress access logs."""
         pass
@@ -36,7 +273,8 @@ def start_health_server(port: int = 8000) -> None:
         port: Port to listen on. Defaults to 8000.
     """
     global _server, _thread
-    _server = HTTPServer(("0.0.0.0", port), HealthHandler)
+    _server = ThreadingHTTPServer(("0.0.0.0", port), HealthHandler)
+    _server.daemon_threads = True
     _thread = threading.Thread(target=_server.serve_forever, daemon=True)
     _thread.start()
     logger.info(f"Health server started on port {port}")
@@ -7,6 +7,8 @@ from typing import Any, Optional
 import aiohttp
 
 from src.config.settings import Settings
+from src.tracing import span
+from src.metrics import JIRA_REQUEST_SECONDS, JIRA_REQUESTS
 from src.jira.types import (
     JiraCreateRequest,
     JiraIssue,
@@ -77,6 +79,28 @@ class JiraService:
         endpoint: str,
         json_data: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Make HTTP request (traced and metered, retries included).
+
+        See _request_with_retry for arguments and errors.
+        """
+        start = time.monotonic()
+        outcome = "error"
+        try:
+            with span(f"jira.{method}", kind="jira", endpoint=endpoint):
+                result = await self._request_with_retry(method, endpoint, json_data, params)
+            outcome = "ok"
+            return result
+        finally:
+            JIRA_REQUEST_SECONDS.observe(time.monotonic() - start, method=method)
+            JIRA_REQUESTS.inc(method=method, outcome=outcome)
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Make HTTP request with retry and exponential backoff.
 
@@ -57,6 +57,35 @@ from src.llm.factory import (
     get_default_model,
 )
 
+# Task routing
+from src.llm.routing import (
+    ModelRoute,
+    get_route,
+    get_llm_for_task,
+    get_task_stats,
+)
+
+# Token accounting and prompt guardrails
+from src.llm.accounting import (
+    usage_scope,
+    get_token_accountant,
+)
+from src.llm.guardrails import PromptBudget
+
+# Shared adapters
+from src.llm.adapter_registry import (
+    get_shared_adapter,
+    get_adapter_stats,
+    warm_adapters,
+)
+
+# Response cache
+from src.llm.cache import (
+    LLMResponseCache,
+    cache_if_parses,
+    get_llm_cache,
+)
+
 __all__ = [
     # Enums
     "LLMProvider",
@@ -80,4 +109,21 @@ __all__ = [
     "detect_provider",
     "create_adapter",
     "get_default_model",
+    # Task routing
+    "ModelRoute",
+    "get_route",
+    "get_llm_for_task",
+    "get_task_stats",
+    # Token accounting and prompt guardrails
+    "usage_scope",
+    "get_token_accountant",
+    "PromptBudget",
+    # Shared adapters
+    "get_shared_adapter",
+    "get_adapter_stats",
+    "warm_adapters",
+    # Cache
+    "LLMResponseCache",
+    "get_llm_cache",
+    "cache_if_parses",
 ]
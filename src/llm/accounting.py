@@ -0,0 +1,173 @@
+"""Token accounting for LLM calls.
+
+Every provider call made through UnifiedChatClient is attributed to the
+team and session of the turn it runs in (usage_scope(), set by
+GraphRunner.turn), its routing task and the model that answered. Usage
+is aggregated in memory and flushed periodically to the llm_token_usage
+table as (day, team, session, task, model) rollups; cache hits cost
+nothing and are not counted.
+
+Usage:
+    from src.llm.accounting import usage_scope, get_token_accountant
+
+    with usage_scope(team_id, session_id):
+        await llm.chat(prompt)
+
+    stats = get_token_accountant().get_stats()
+"""
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from src.config import get_settings
+from src.llm.types import LLMResult
+
+if TYPE_CHECKING:
+    from src.db.token_usage_store import TokenUsageRollup
+
+logger = logging.getLogger(__name__)
+
+# (team_id, session_id) of the turn making LLM calls ("" outside turns)
+_usage_scope: ContextVar[tuple[str, str]] = ContextVar("llm_usage_scope", default=("", ""))
+
+
+@contextmanager
+def usage_scope(team_id: str, session_id: str) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a team and session."""
+    token = _usage_scope.set((team_id, session_id))
+    try:
+        yield
+    finally:
+        _usage_scope.reset(token)
+
+
+class TokenAccountant:
+    """In-memory usage rollups, flushed to Postgres in batches."""
+
+    def __init__(self) -> None:
+        # (day, team, session, task, model) -> increment not yet flushed
+        self._pending: dict[tuple, "TokenUsageRollup"] = {}
+
+        # Process totals (since start) for stats
+        self._by_team: dict[str, int] = {}
+        self._by_task: dict[str, int] = {}
+        self._by_model: dict[str, int] = {}
+        self._flushes = 0
+        self._flush_errors = 0
+
+    def record(self, task: Optional[str], result: LLMResult) -> None:
+        """Record the usage of a provider call.
+
+        Args:
+            task: Routing task (None = untasked call site)
+            result: Call result (cache hits are ignored)
+        """
+        if result.cached:
+            return
+        from src.db.token_usage_store import TokenUsageRollup
+        from src.llm.routing import estimate_cost_usd
+
+        team_id, session_id = _usage_scope.get()
+        task = task or "untasked"
+        day = datetime.now(timezone.utc).date()
+        key = (day, team_id, session_id, task, result.model)
+
+        rollup = self._pending.get(key)
+        if rollup is None:
+            rollup = self._pending[key] = TokenUsageRollup(*key)
+        rollup.calls += 1
+        rollup.prompt_tokens += result.usage.prompt_tokens
+        rollup.completion_tokens += result.usage.completion_tokens
+        rollup.cost_usd += estimate_cost_usd(result) or 0.0
+
+        tokens = result.usage.prompt_tokens + result.usage.completion_tokens
+        for totals, name in (
+            (self._by_team, team_id or "none"),
+            (self._by_task, task),
+            (self._by_model, result.model),
+        ):
+            totals[name] = totals.get(name, 0) + tokens
+
+    def _merge(self, rollups: list["TokenUsageRollup"]) -> None:
+        """Put unflushed rollups back (after a failed flush)."""
+        for r in rollups:
+            key = (r.day, r.team_id, r.session_id, r.task, r.model)
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = r
+                continue
+            pending.calls += r.calls
+            pending.prompt_tokens += r.prompt_tokens
+            pending.completion_tokens += r.completion_tokens
+            pending.cost_usd += r.cost_usd
+
+    async def flush(self) -> int:
+        """Write pending rollups to Postgres.
+
+        Failed writes are kept and retried on the next flush.
+
+        Returns:
+            Number of rollup rows written
+        """
+        if not self._pending:
+            return 0
+        from src.db.connection import get_connection
+        from src.db.token_usage_store import TokenUsageStore
+
+        rollups = list(self._pending.values())
+        self._pending = {}
+        try:
+            async with get_connection() as conn:
+                await TokenUsageStore(conn).add_rollups(rollups)
+        except Exception as e:
+            self._flush_errors += 1
+            self._merge(rollups)
+            logger.warning(f"Token usage flush failed, will retry: {e}")
+            return 0
+
+        self._flushes += 1
+        return len(rollups)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get process token totals by team, task and model."""
+        return {
+            "pending_rows": len(self._pending),
+            "flushes": self._flushes,
+            "flush_errors": self._flush_errors,
+            "tokens_by_team": dict(self._by_team),
+            "tokens_by_task": dict(self._by_task),
+            "tokens_by_model": dict(self._by_model),
+        }
+
+
+_accountant: Optional[TokenAccountant] = None
+
+
+def get_token_accountant() -> TokenAccountant:
+    """Get or create the token accountant singleton."""
+    global _accountant
+    if _accountant is None:
+        _accountant = TokenAccountant()
+    return _accountant
+
+
+def record_usage(task: Optional[str], result: LLMResult) -> None:
+    """Record a call's usage if token accounting is enabled."""
+    if get_settings().token_accounting_enabled:
+        get_token_accountant().record(task, result)
+
+
+async def run_token_accounting_forever() -> None:
+    """Flush usage rollups every token_accounting_flush_seconds.
+
+    Runs on the background loop (same pool as the stores).
+    """
+    interval = get_settings().token_accounting_flush_seconds
+    while True:
+        await asyncio.sleep(interval)
+        written = await get_token_accountant().flush()
+        if written:
+            logger.debug(f"Flushed {written} token usage rollups")
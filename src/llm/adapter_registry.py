@@ -0,0 +1,131 @@
+"""Process-wide registry of LLM adapters, keyed by LLMConfig.
+
+get_llm() builds a new UnifiedChatClient for every call site, and each
+adapter owns a LangChain chat model with its own HTTP client and
+connection pool. Sharing one adapter per config (provider, model,
+sampling settings, timeout, API key) keeps provider connections alive
+across calls instead of paying a TLS handshake per extraction,
+validation or answer match.
+
+Adapters hold async HTTP clients bound to the event loop that first used
+them, so entries are also keyed by the running loop.
+
+Usage:
+    from src.llm.adapter_registry import get_shared_adapter, get_adapter_stats
+
+    adapter = get_shared_adapter(config)
+    stats = get_adapter_stats()  # hits = calls served by a reused client
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Any, Optional
+
+from src.llm.adapters.base import BaseAdapter
+from src.llm.factory import create_adapter
+from src.llm.types import LLMConfig
+from src.registry import BoundedRegistry
+
+logger = logging.getLogger(__name__)
+
+# Distinct configs are few (one per model/temperature combination in use)
+ADAPTER_REGISTRY_MAX_SIZE = 32
+ADAPTER_IDLE_TTL_SECONDS = 3600.0
+
+_adapters: Optional[BoundedRegistry[BaseAdapter]] = None
+
+# provider:model -> lookups served by an existing adapter
+_reuse_by_model: dict[str, int] = {}
+
+
+def _get_registry() -> BoundedRegistry[BaseAdapter]:
+    """Get or create the adapter registry."""
+    global _adapters
+    if _adapters is None:
+        _adapters = BoundedRegistry(
+            name="llm_adapters",
+            max_size=ADAPTER_REGISTRY_MAX_SIZE,
+            idle_ttl_seconds=ADAPTER_IDLE_TTL_SECONDS,
+        )
+    return _adapters
+
+
+def _registry_key(config: LLMConfig) -> str:
+    """Key for a config on the running event loop (API key hashed, not stored)."""
+    try:
+        loop_id = id(asyncio.get_running_loop())
+    except RuntimeError:
+        loop_id = 0
+    digest = hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+    return f"{loop_id}:{digest}"
+
+
+def get_shared_adapter(config: LLMConfig) -> BaseAdapter:
+    """Get the shared adapter for a config, creating it on first use.
+
+    Args:
+        config: LLM configuration
+
+    Returns:
+        Adapter shared by every client with an equal config
+
+    Raises:
+        ValueError: If the provider is unknown or its API key is missing
+    """
+    registry = _get_registry()
+    key = _registry_key(config)
+    if key in registry:
+        label = f"{config.provider.value}:{config.model}"
+        _reuse_by_model[label] = _reuse_by_model.get(label, 0) + 1
+    return registry.get_or_create(key, lambda: create_adapter(config))
+
+
+def warm_adapters(configs: Optional[list[LLMConfig]] = None) -> int:
+    """Create adapters ahead of the first turn.
+
+    Builds the LangChain models and their HTTP clients (imports, key
+    checks, client setup); the provider connection itself opens on the
+    first request. Call on the event loop that will use the adapters.
+
+    Args:
+        configs: Configs to warm (default: every routed task's config)
+
+    Returns:
+        Number of adapters warmed
+    """
+    if configs is None:
+        from src.llm.routing import DEFAULT_ROUTES, get_llm_for_task
+        configs = [get_llm_for_task(task).config for task in DEFAULT_ROUTES]
+
+    warmed = 0
+    for config in configs:
+        key = _registry_key(config)
+        if key in _get_registry():
+            continue
+        try:
+            get_shared_adapter(config)
+            warmed += 1
+        except Exception as e:
+            logger.warning(f"Failed to warm LLM adapter for {config.model}: {e}")
+
+    logger.info("LLM adapters warmed", extra={"count": warmed})
+    return warmed
+
+
+def clear_adapters() -> None:
+    """Drop all shared adapters (next use creates new ones)."""
+    global _adapters
+    _adapters = None
+    _reuse_by_model.clear()
+
+
+def get_adapter_stats() -> dict[str, Any]:
+    """Get adapter reuse metrics.
+
+    Returns:
+        Registry stats (size, hits = reused clients, misses = clients
+        created, hit rate, evictions) plus reuse counts by provider:model.
+    """
+    stats = _get_registry().get_stats()
+    stats["reused_by_model"] = dict(_reuse_by_model)
+    return stats
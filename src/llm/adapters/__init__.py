@@ -4,6 +4,7 @@ from src.llm.adapters.anthropic import AnthropicAdapter
 from src.llm.adapters.base import BaseAdapter, ToolDefinition
 from src.llm.adapters.gemini import GeminiAdapter
 from src.llm.adapters.openai import OpenAIAdapter
+from src.llm.adapters.replay import ReplayAdapter
 
 __all__ = [
     "AnthropicAdapter",
@@ -11,4 +12,5 @@ __all__ = [
     "ToolDefinition",
     "GeminiAdapter",
     "OpenAIAdapter",
+    "ReplayAdapter",
 ]
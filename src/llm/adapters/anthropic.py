@@ -9,12 +9,13 @@ from langchain_core.messages import (
     AIMessage,
     BaseMessage,
     HumanMessage,
+    SystemMessage,
     ToolMessage,
 )
 from pydantic import BaseModel
 
 from src.config import get_settings
-from src.llm.adapters.base import BaseAdapter, ToolDefinition
+from src.llm.adapters.base import BaseAdapter, ToolDefinition, is_rate_limit_error, parse_usage
 from src.llm.types import (
     FinishReason,
     LLMConfig,
@@ -22,18 +23,25 @@ from src.llm.types import (
     LLMResult,
     Message,
     MessageRole,
-    TokenUsage,
     ToolCall,
 )
 
 logger = logging.getLogger(__name__)
 
+# Anthropic accepts at most 4 cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
 
 class AnthropicAdapter(BaseAdapter):
     """Anthropic provider adapter using langchain-anthropic.
 
     Note: Anthropic handles system messages differently - they are passed
     as a separate parameter rather than in the messages list.
+
+    Messages marked cache_prefix get a cache_control breakpoint (when
+    llm_prompt_caching is on), so the prompt up to them is served from
+    Anthropic's prompt cache on later calls. Prefixes shorter than the
+    model's minimum (1024-2048 tokens) are simply not cached.
     """
 
     def __init__(self, config: LLMConfig):
@@ -53,23 +61,32 @@ class AnthropicAdapter(BaseAdapter):
 
     def convert_messages(
         self, messages: list[Message]
-    ) -> tuple[str | None, list[BaseMessage]]:
+    ) -> tuple[str | list[dict] | None, list[BaseMessage]]:
         """Convert canonical messages to LangChain format.
 
         Returns (system_message, other_messages) because Anthropic
-        handles system messages separately.
+        handles system messages separately. Cache breakpoints turn the
+        content into a list of text blocks with cache_control.
         """
         system_content = None
         result = []
+        breakpoints = MAX_CACHE_BREAKPOINTS if get_settings().llm_prompt_caching else 0
+
+        def content_of(msg: Message) -> str | list[dict]:
+            nonlocal breakpoints
+            if not (msg.cache_prefix and breakpoints):
+                return msg.content
+            breakpoints -= 1
+            return [{"type": "text", "text": msg.content, "cache_control": {"type": "ephemeral"}}]
 
         for msg in messages:
             if msg.role == MessageRole.SYSTEM:
                 # Anthropic: system message is separate, use last one if multiple
-                system_content = msg.content
+                system_content = content_of(msg)
             elif msg.role == MessageRole.USER:
-                result.append(HumanMessage(content=msg.content))
+                result.append(HumanMessage(content=content_of(msg)))
             elif msg.role == MessageRole.ASSISTANT:
-                result.append(AIMessage(content=msg.content))
+                result.append(AIMessage(content=content_of(msg)))
             elif msg.role == MessageRole.TOOL:
                 result.append(
                     ToolMessage(
@@ -123,14 +140,7 @@ class AnthropicAdapter(BaseAdapter):
         finish_reason = FinishReason.TOOL_CALLS if tool_calls else FinishReason.STOP
 
         # Extract usage if available
-        usage = TokenUsage()
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            um = response.usage_metadata
-            usage = TokenUsage(
-                prompt_tokens=um.get("input_tokens", 0),
-                completion_tokens=um.get("output_tokens", 0),
-                total_tokens=um.get("total_tokens", 0),
-            )
+        usage = parse_usage(response)
 
         return LLMResult(
             text=text if isinstance(text, str) else "",
@@ -168,10 +178,12 @@ class AnthropicAdapter(BaseAdapter):
             if response_schema:
                 client = client.with_structured_output(response_schema)
 
+            # LangChain ChatAnthropic sends the first SystemMessage as the
+            # system parameter
+            if system_msg:
+                lc_messages = [SystemMessage(content=system_msg), *lc_messages]
+
             # Invoke (async)
-            # Note: LangChain ChatAnthropic handles system message via
-            # the first SystemMessage in the list, but we extract it
-            # separately for clarity and control
             response = await client.ainvoke(lc_messages)
 
             latency_ms = (time.perf_counter() - start_time) * 1000
@@ -185,6 +197,7 @@ class AnthropicAdapter(BaseAdapter):
                     "provider": result.provider.value,
                     "model": result.model,
                     "latency_ms": result.latency_ms,
+                    "cached_prompt_tokens": result.usage.cached_prompt_tokens,
                 },
             )
 
@@ -199,4 +212,6 @@ class AnthropicAdapter(BaseAdapter):
                 provider=LLMProvider.ANTHROPIC,
                 model=self.config.model,
                 latency_ms=latency_ms,
+                error=str(e),
+                rate_limited=is_rate_limit_error(e),
             )
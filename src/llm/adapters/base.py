@@ -5,7 +5,68 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from src.llm.types import Message, LLMResult, LLMConfig
+from src.llm.types import Message, LLMResult, LLMConfig, TokenUsage
+
+
+# Exception classes SDKs raise for 429 / quota rejections: openai and
+# anthropic RateLimitError, langchain-core ModelRateLimitError (wrapped
+# Gemini errors), google-api-core ResourceExhausted / TooManyRequests
+_RATE_LIMIT_TYPES = frozenset(
+    {"RateLimitError", "ModelRateLimitError", "ResourceExhausted", "TooManyRequests"}
+)
+
+
+def _is_rate_limit(exc: BaseException) -> bool:
+    """True if this exception (ignoring its causes) signals a rate limit."""
+    if any(cls.__name__ in _RATE_LIMIT_TYPES for cls in type(exc).__mro__):
+        return True
+    response = getattr(exc, "response", None)
+    for status in (
+        getattr(exc, "status_code", None),
+        getattr(exc, "code", None),
+        getattr(response, "status_code", None),
+    ):
+        if status == 429:
+            return True
+    # google-genai APIError carries the gRPC status name
+    return getattr(exc, "status", None) == "RESOURCE_EXHAUSTED"
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """True if a provider exception is a 429 / quota rejection.
+
+    Checks the exception type and the HTTP status the SDK exposes, never
+    the message text: request ids, token counts or a "quota" mention in a
+    400 body must not trigger backoff. LangChain integrations re-raise
+    SDK errors, so the cause chain is followed as well.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        if _is_rate_limit(current):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def parse_usage(response: Any) -> TokenUsage:
+    """Token usage from a LangChain response's usage_metadata.
+
+    Prompt cache reads are reported by every provider integration as
+    input_token_details.cache_read (Anthropic cache hits, Gemini cached
+    contents and implicit caching, OpenAI automatic prefix caching).
+    """
+    um = getattr(response, "usage_metadata", None)
+    if not um:
+        return TokenUsage()
+    details = um.get("input_token_details") or {}
+    return TokenUsage(
+        prompt_tokens=um.get("input_tokens", 0),
+        completion_tokens=um.get("output_tokens", 0),
+        total_tokens=um.get("total_tokens", 0),
+        cached_prompt_tokens=details.get("cache_read") or 0,
+    )
 
 
 class ToolDefinition(BaseModel):
@@ -15,7 +15,8 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel
 
 from src.config import get_settings
-from src.llm.adapters.base import BaseAdapter, ToolDefinition
+from src.llm.adapters.base import BaseAdapter, ToolDefinition, is_rate_limit_error, parse_usage
+from src.llm.adapters.gemini_cache import GeminiContextCache
 from src.llm.types import (
     FinishReason,
     LLMConfig,
@@ -23,7 +24,6 @@ from src.llm.types import (
     LLMResult,
     Message,
     MessageRole,
-    TokenUsage,
     ToolCall,
 )
 
@@ -31,18 +31,25 @@ logger = logging.getLogger(__name__)
 
 
 class GeminiAdapter(BaseAdapter):
-    """Gemini provider adapter using langchain-google-genai."""
+    """Gemini provider adapter using langchain-google-genai.
+
+    Long system prompts marked cache_prefix are served from an explicit
+    cached content (see gemini_cache); shorter ones rely on Gemini's
+    implicit prefix caching, which only needs the prefix to be stable.
+    """
 
     def __init__(self, config: LLMConfig):
         super().__init__(config)
         settings = get_settings()
+        api_key = config.api_key or settings.google_api_key
         self.client = ChatGoogleGenerativeAI(
             model=config.model,
-            google_api_key=config.api_key or settings.google_api_key,
+            google_api_key=api_key,
             temperature=config.temperature,
             max_output_tokens=config.max_tokens,
             timeout=config.timeout_seconds,
         )
+        self.context_cache = GeminiContextCache(api_key)
 
     def convert_messages(self, messages: list[Message]) -> list[BaseMessage]:
         """Convert canonical messages to LangChain format."""
@@ -64,6 +71,20 @@ class GeminiAdapter(BaseAdapter):
                 )
         return result
 
+    def _cached_content_for(self, messages: list[Message]) -> str | None:
+        """Cached content name for a leading cache_prefix system message, if any."""
+        settings = get_settings()
+        if not (settings.llm_prompt_caching and settings.llm_gemini_cached_contents):
+            return None
+        if not messages or messages[0].role != MessageRole.SYSTEM or not messages[0].cache_prefix:
+            return None
+        from src.llm.guardrails import estimate_text_tokens
+
+        system_prompt = messages[0].content
+        if estimate_text_tokens(system_prompt) < settings.llm_gemini_cache_min_tokens:
+            return None
+        return self.context_cache.get(self.config.model, system_prompt)
+
     def _convert_tools(self, tools: list[ToolDefinition]) -> list[dict]:
         """Convert tool definitions to LangChain format."""
         return [
@@ -109,14 +130,7 @@ class GeminiAdapter(BaseAdapter):
         finish_reason = FinishReason.TOOL_CALLS if tool_calls else FinishReason.STOP
 
         # Extract usage if available
-        usage = TokenUsage()
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            um = response.usage_metadata
-            usage = TokenUsage(
-                prompt_tokens=um.get("input_tokens", 0),
-                completion_tokens=um.get("output_tokens", 0),
-                total_tokens=um.get("total_tokens", 0),
-            )
+        usage = parse_usage(response)
 
         return LLMResult(
             text=text,
@@ -137,10 +151,20 @@ class GeminiAdapter(BaseAdapter):
     ) -> LLMResult:
         """Send messages to Gemini and get unified result."""
         start_time = time.perf_counter()
+        cached_content = None
 
         try:
             lc_messages = self.convert_messages(messages)
 
+            # Cached contents replace the system instruction and can't be
+            # combined with request-level tools or response schemas
+            kwargs = {}
+            if not tools and not response_schema:
+                cached_content = self._cached_content_for(messages)
+            if cached_content:
+                lc_messages = lc_messages[1:]
+                kwargs["cached_content"] = cached_content
+
             # Bind tools if provided
             client = self.client
             if tools:
@@ -151,7 +175,7 @@ class GeminiAdapter(BaseAdapter):
                 client = client.with_structured_output(response_schema)
 
             # Invoke (async)
-            response = await client.ainvoke(lc_messages)
+            response = await client.ainvoke(lc_messages, **kwargs)
 
             latency_ms = (time.perf_counter() - start_time) * 1000
 
@@ -164,6 +188,7 @@ class GeminiAdapter(BaseAdapter):
                     "provider": result.provider.value,
                     "model": result.model,
                     "latency_ms": result.latency_ms,
+                    "cached_prompt_tokens": result.usage.cached_prompt_tokens,
                 },
             )
 
@@ -172,10 +197,15 @@ class GeminiAdapter(BaseAdapter):
         except Exception as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
             logger.error(f"Gemini request failed: {e}")
+            if cached_content:
+                # Expired or deleted server-side: recreate on a later call
+                self.context_cache.invalidate(cached_content)
             return LLMResult(
                 text="",
                 finish_reason=FinishReason.ERROR,
                 provider=LLMProvider.GEMINI,
                 model=self.config.model,
                 latency_ms=latency_ms,
+                error=str(e),
+                rate_limited=is_rate_limit_error(e),
             )
@@ -0,0 +1,179 @@
+"""Gemini cached contents for stable system prompts.
+
+Gemini 2.x models cache repeated prompt prefixes implicitly; explicit
+cached contents guarantee the discount and skip re-processing the prefix
+for long system prompts. A cached content is created per (model, system
+prompt) in the background on first use, reused until shortly before its
+TTL runs out, and then replaced. Each one is billed for storage while it
+lives, so only llm_gemini_cache_max_entries are kept per API key; the
+least recently used is deleted on the provider when a new one pushes it
+out.
+
+Requests using a cached content must not resend the system instruction
+or bind tools, so the adapter only uses it for plain calls whose system
+message is marked cache_prefix and is long enough to be worth storing
+(llm_gemini_cache_min_tokens).
+
+Uses the google-genai SDK (installed with langchain-google-genai); if
+it is missing, explicit caching is disabled and implicit caching still
+applies.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Optional
+
+from src.config import get_settings
+from src.registry import BoundedRegistry
+
+logger = logging.getLogger(__name__)
+
+# Replace cached contents this long before they expire
+EXPIRY_MARGIN_SECONDS = 60.0
+
+# Don't retry a failed creation for the same prefix before this
+FAILURE_BACKOFF_SECONDS = 600.0
+
+
+class GeminiContextCache:
+    """Cached content names by (model, system prompt), for one API key."""
+
+    def __init__(self, api_key: Optional[str]):
+        self.api_key = api_key
+        self._client: Any = None
+        self._available = True
+
+        settings = get_settings()
+        # key -> (cached content name or None after a failure, expires_at)
+        self._entries: BoundedRegistry[tuple[Optional[str], float]] = BoundedRegistry(
+            name="gemini_cached_contents",
+            max_size=settings.llm_gemini_cache_max_entries,
+            idle_ttl_seconds=settings.llm_gemini_cache_ttl_seconds,
+            on_evict=self._on_evict,
+        )
+        # key -> creation in progress
+        self._pending: dict[str, asyncio.Task] = {}
+        # Deletions of evicted cached contents in progress
+        self._deleting: set[asyncio.Task] = set()
+
+        self._hits = 0
+        self._created = 0
+        self._failures = 0
+
+    def _get_client(self) -> Any:
+        """Get or create the google-genai client (None if not installed)."""
+        if self._client is None and self._available:
+            try:
+                from google import genai
+            except ImportError:
+                self._available = False
+                logger.warning(
+                    "google-genai not installed, Gemini explicit prompt caching disabled"
+                )
+                return None
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
+    @staticmethod
+    def _key(model: str, system_prompt: str) -> str:
+        return f"{model}:{hashlib.sha256(system_prompt.encode()).hexdigest()[:16]}"
+
+    def get(self, model: str, system_prompt: str) -> Optional[str]:
+        """Get the cached content name for a system prompt.
+
+        On a miss the cached content is created in the background and the
+        current call goes without it, so creation never adds latency.
+
+        Args:
+            model: Gemini model name
+            system_prompt: Stable system instruction
+
+        Returns:
+            Cached content name, or None if not (yet) available
+        """
+        key = self._key(model, system_prompt)
+        entry = self._entries.get_or_create(key) if key in self._entries else None
+        if entry and entry[1] > time.monotonic():
+            if entry[0]:
+                self._hits += 1
+            return entry[0]
+
+        if key not in self._pending and self._available:
+            self._pending[key] = asyncio.create_task(self._refresh(key, model, system_prompt))
+        return None
+
+    async def _refresh(self, key: str, model: str, system_prompt: str) -> None:
+        """Create the cached content for a key and record its expiry."""
+        try:
+            name = await self._create(model, system_prompt)
+            ttl = get_settings().llm_gemini_cache_ttl_seconds
+            expires_at = time.monotonic() + (
+                ttl - EXPIRY_MARGIN_SECONDS if name else FAILURE_BACKOFF_SECONDS
+            )
+            # Replaces the expiring entry; its cached content runs out on its own
+            self._entries.remove(key)
+            self._entries.get_or_create(key, lambda: (name, expires_at))
+        finally:
+            self._pending.pop(key, None)
+
+    async def _create(self, model: str, system_prompt: str) -> Optional[str]:
+        """Create a cached content holding the system instruction."""
+        client = self._get_client()
+        if client is None:
+            return None
+        from google.genai import types
+
+        try:
+            cached = await client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    ttl=f"{get_settings().llm_gemini_cache_ttl_seconds}s",
+                    display_name="maro-system-prefix",
+                ),
+            )
+        except Exception as e:
+            self._failures += 1
+            logger.warning(f"Gemini cached content creation failed for {model}: {e}")
+            return None
+
+        self._created += 1
+        logger.info(
+            "Gemini cached content created",
+            extra={"model": model, "cached_content": cached.name},
+        )
+        return cached.name
+
+    def _on_evict(self, key: str, entry: tuple[Optional[str], float]) -> None:
+        """Delete an evicted cached content instead of paying for it until expiry."""
+        name = entry[0]
+        if name and self._client is not None:
+            task = asyncio.create_task(self._delete(name))
+            self._deleting.add(task)
+            task.add_done_callback(self._deleting.discard)
+
+    async def _delete(self, name: str) -> None:
+        """Delete a cached content on the provider (best effort)."""
+        try:
+            await self._client.aio.caches.delete(name=name)
+        except Exception as e:
+            logger.debug(f"Gemini cached content deletion failed for {name}: {e}")
+
+    def invalidate(self, name: str) -> None:
+        """Forget a cached content (e.g. after the provider rejected it)."""
+        for key in self._entries:
+            entry = self._entries.get(key)
+            if entry and entry[0] == name:
+                self._entries.remove(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache usage counters."""
+        entries = [self._entries.get(key) for key in self._entries]
+        return {
+            "entries": sum(1 for entry in entries if entry and entry[0]),
+            "evictions": self._entries.get_stats()["evictions"],
+            "hits": self._hits,
+            "created": self._created,
+            "failures": self._failures,
+        }
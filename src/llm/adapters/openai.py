@@ -15,7 +15,7 @@ from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from src.config import get_settings
-from src.llm.adapters.base import BaseAdapter, ToolDefinition
+from src.llm.adapters.base import BaseAdapter, ToolDefinition, is_rate_limit_error, parse_usage
 from src.llm.types import (
     FinishReason,
     LLMConfig,
@@ -23,7 +23,6 @@ from src.llm.types import (
     LLMResult,
     Message,
     MessageRole,
-    TokenUsage,
     ToolCall,
 )
 
@@ -99,14 +98,7 @@ class OpenAIAdapter(BaseAdapter):
 
         finish_reason = FinishReason.TOOL_CALLS if tool_calls else FinishReason.STOP
 
-        usage = TokenUsage()
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            um = response.usage_metadata
-            usage = TokenUsage(
-                prompt_tokens=um.get("input_tokens", 0),
-                completion_tokens=um.get("output_tokens", 0),
-                total_tokens=um.get("total_tokens", 0),
-            )
+        usage = parse_usage(response)
 
         return LLMResult(
             text=text,
@@ -165,4 +157,6 @@ class OpenAIAdapter(BaseAdapter):
                 provider=LLMProvider.OPENAI,
                 model=self.config.model,
                 latency_ms=latency_ms,
+                error=str(e),
+                rate_limited=is_rate_limit_error(e),
             )
@@ -0,0 +1,325 @@
+"""Record/replay adapter for deterministic load and latency testing.
+
+Two modes (settings.llm_replay_mode):
+- record: calls the real provider adapter and saves each successful
+  LLMResult to disk, keyed by the request hash (same key as the response
+  cache: provider, model, sampling settings, messages, tools, schema)
+- replay: serves saved results without network access, with simulated
+  latency, jitter and error rate
+
+Recordings are one JSON file per request in settings.llm_replay_dir, so
+runs from several processes can be merged by copying directories.
+
+Replay misses return an error result (like a failed provider call) and
+are counted, so a load test shows how much of its traffic was covered.
+Turn the response cache off (LLM_CACHE_ENABLED=false) when measuring
+latency, or repeated requests skip the simulated delay.
+
+Usage:
+    LLM_REPLAY_MODE=record python -m src ...   # capture a session
+    LLM_REPLAY_MODE=replay LLM_REPLAY_LATENCY_MS=800 \\
+        LLM_REPLAY_JITTER=exponential LLM_REPLAY_JITTER_MS=400 \\
+        LLM_REPLAY_ERROR_RATE=0.02 python -m src.benchmark --sessions 50
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from src.llm.adapters.base import BaseAdapter, ToolDefinition
+from src.llm.types import FinishReason, LLMConfig, LLMResult, Message
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODES = ("record", "replay")
+JITTER_DISTRIBUTIONS = ("none", "uniform", "normal", "exponential")
+
+
+class ReplayStore:
+    """Directory of recorded results, one <key>.json file per request."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self._loaded: dict[str, Optional[dict[str, Any]]] = {}
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Load a recording (memoized, including misses).
+
+        Args:
+            key: Request hash from make_cache_key()
+
+        Returns:
+            Serialized result, or None if nothing was recorded
+        """
+        if key not in self._loaded:
+            path = self.directory / f"{key}.json"
+            try:
+                self._loaded[key] = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._loaded[key] = None
+            except ValueError as e:
+                logger.warning(f"Unreadable LLM recording {path}: {e}")
+                self._loaded[key] = None
+
+        data = self._loaded[key]
+        if data is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return data
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        """Save a recording (atomic replace, last write wins).
+
+        Args:
+            key: Request hash from make_cache_key()
+            data: Serialized result
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._loaded[key] = data
+        self._recorded += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get recording hit/miss counters."""
+        lookups = self._hits + self._misses
+        return {
+            "directory": str(self.directory),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "recorded": self._recorded,
+        }
+
+
+class LatencyModel:
+    """Simulated provider latency: base plus jitter, and a failure rate."""
+
+    def __init__(
+        self,
+        base_ms: Optional[float] = None,
+        jitter: str = "none",
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize latency model.
+
+        Args:
+            base_ms: Base latency (None = use the recorded latency)
+            jitter: Distribution added to the base: none, uniform
+                (+/- jitter_ms), normal (stddev jitter_ms) or exponential
+                (mean jitter_ms, long tail)
+            jitter_ms: Spread of the jitter distribution
+            error_rate: Fraction of calls that fail (0.0 - 1.0)
+            seed: Seed for reproducible runs (None = random)
+
+        Raises:
+            ValueError: If jitter is not a known distribution
+        """
+        if jitter not in JITTER_DISTRIBUTIONS:
+            raise ValueError(f"Unknown jitter distribution: {jitter}")
+        self.base_ms = base_ms
+        self.jitter = jitter
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def sample_ms(self, recorded_ms: float) -> float:
+        """Latency for one call, never negative."""
+        base = recorded_ms if self.base_ms is None else self.base_ms
+        if self.jitter == "uniform":
+            base += self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        elif self.jitter == "normal":
+            base += self._random.gauss(0.0, self.jitter_ms)
+        elif self.jitter == "exponential" and self.jitter_ms > 0:
+            base += self._random.expovariate(1.0 / self.jitter_ms)
+        return max(0.0, base)
+
+    def should_fail(self) -> bool:
+        """Whether this call is a simulated failure."""
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+class ReplayAdapter(BaseAdapter):
+    """Adapter that records real results or replays them from disk.
+
+    Replay mode needs no API keys and makes no network calls.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        mode: str,
+        store: ReplayStore,
+        inner: Optional[BaseAdapter] = None,
+        latency: Optional[LatencyModel] = None,
+    ):
+        """Initialize adapter.
+
+        Args:
+            config: LLM configuration of the recorded provider/model
+            mode: "record" or "replay"
+            store: Where recordings live
+            inner: Real provider adapter (required to record)
+            latency: Simulated latency/errors for replay (None = none)
+
+        Raises:
+            ValueError: If mode is unknown or record mode has no inner adapter
+        """
+        super().__init__(config)
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay mode: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode requires a provider adapter")
+        self.mode = mode
+        self.store = store
+        self.inner = inner
+        self.latency = latency or LatencyModel()
+
+    async def invoke(
+        self,
+        messages: list[Message],
+        tools: list[ToolDefinition] | None = None,
+        response_schema: type[BaseModel] | None = None,
+    ) -> LLMResult:
+        """Record or replay one request."""
+        from src.llm.cache import make_cache_key
+
+        key = make_cache_key(self.config, messages, tools, response_schema)
+        if self.mode == "record":
+            return await self._record(key, messages, tools, response_schema)
+        return await self._replay(key, response_schema)
+
+    async def _record(
+        self,
+        key: str,
+        messages: list[Message],
+        tools: list[ToolDefinition] | None,
+        response_schema: type[BaseModel] | None,
+    ) -> LLMResult:
+        """Call the real provider and save successful results."""
+        from src.llm.cache import serialize_result
+
+        result = await self.inner.invoke(messages, tools=tools, response_schema=response_schema)
+        if result.finish_reason != FinishReason.ERROR:
+            try:
+                self.store.put(key, serialize_result(result))
+            except OSError as e:
+                logger.warning(f"Failed to save LLM recording {key[:12]}: {e}")
+        return result
+
+    async def _replay(
+        self,
+        key: str,
+        response_schema: type[BaseModel] | None,
+    ) -> LLMResult:
+        """Serve a recording after the simulated latency."""
+        from src.llm.cache import deserialize_result
+
+        data = self.store.get(key)
+        recorded_ms = float(data.get("latency_ms", 0)) if data else 0.0
+        latency_ms = self.latency.sample_ms(recorded_ms)
+        await asyncio.sleep(latency_ms / 1000)
+
+        if data is None:
+            logger.warning(
+                "No LLM recording for request",
+                extra={"key": key[:12], "model": self.config.model},
+            )
+            return self.parse_response("No recording for request", latency_ms)
+        if self.latency.should_fail():
+            # Simulated failures look like provider 429s (exercises the rate limiter)
+            result = self.parse_response("Simulated rate limit (429)", latency_ms)
+            result.rate_limited = True
+            return result
+
+        # Fresh request id/timestamp per replayed call
+        data = {k: v for k, v in data.items() if k not in ("request_id", "timestamp")}
+        result = deserialize_result(data, response_schema, cached=False)
+        result.latency_ms = latency_ms
+        return result
+
+    def convert_messages(self, messages: list[Message]) -> Any:
+        """Messages are hashed, not converted."""
+        return messages
+
+    def parse_response(self, response: Any, latency_ms: float) -> LLMResult:
+        """Build the error result for a miss or simulated failure."""
+        return LLMResult(
+            text="",
+            finish_reason=FinishReason.ERROR,
+            provider=self.config.provider,
+            model=self.config.model,
+            latency_ms=latency_ms,
+            error=response,
+        )
+
+
+_store: Optional[ReplayStore] = None
+_latency: Optional[LatencyModel] = None
+
+
+def get_replay_store() -> ReplayStore:
+    """Get or create the recordings store (directory from settings)."""
+    global _store
+    if _store is None:
+        from src.config import get_settings
+
+        _store = ReplayStore(get_settings().llm_replay_dir)
+    return _store
+
+
+def get_latency_model() -> LatencyModel:
+    """Get or create the latency model shared by all replay adapters.
+
+    Shared so a seeded run draws one sequence across all clients.
+    """
+    global _latency
+    if _latency is None:
+        from src.config import get_settings
+
+        settings = get_settings()
+        _latency = LatencyModel(
+            base_ms=settings.llm_replay_latency_ms,
+            jitter=settings.llm_replay_jitter,
+            jitter_ms=settings.llm_replay_jitter_ms,
+            error_rate=settings.llm_replay_error_rate,
+            seed=settings.llm_replay_seed,
+        )
+    return _latency
+
+
+def create_replay_adapter(config: LLMConfig, inner: Optional[BaseAdapter] = None) -> ReplayAdapter:
+    """Create a record/replay adapter configured from settings.
+
+    Args:
+        config: LLM configuration
+        inner: Real provider adapter (record mode)
+
+    Returns:
+        ReplayAdapter for settings.llm_replay_mode
+    """
+    from src.config import get_settings
+
+    return ReplayAdapter(
+        config,
+        mode=get_settings().llm_replay_mode,
+        store=get_replay_store(),
+        inner=inner,
+        latency=get_latency_model(),
+    )
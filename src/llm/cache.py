@@ -0,0 +1,267 @@
+"""Content-addressed LLM response cache.
+
+Identical requests (same provider, model, sampling settings, messages,
+tools and response schema) get the same answer from the cache instead of
+another provider round trip. Two tiers:
+- In-memory LRU with TTL (per process)
+- Optional PostgreSQL table shared by all workers (settings.llm_cache_postgres)
+
+UnifiedChatClient.invoke() consults the cache. Deterministic calls
+(temperature 0) are cached by default. Only usable answers are stored:
+errors, empty answers and answers cut off at max_tokens never are, and a
+caller can require that its parser accepts the answer (cache_if), so a
+retry after a bad parse does not get the same bad answer back.
+
+Usage:
+    from src.llm.cache import get_llm_cache
+
+    stats = get_llm_cache().get_stats()
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from src.config import get_settings
+from src.llm.adapters.base import ToolDefinition
+from src.llm.types import FinishReason, LLMConfig, LLMResult, Message
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    config: LLMConfig,
+    messages: list[Message],
+    tools: list[ToolDefinition] | None = None,
+    response_schema: type[BaseModel] | None = None,
+) -> str:
+    """Build the content hash identifying a request.
+
+    Args:
+        config: Client config (provider, model, temperature, max_tokens)
+        messages: Messages to send
+        tools: Optional tool definitions
+        response_schema: Optional structured output schema
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "provider": config.provider.value,
+        "model": config.model,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        "messages": [m.model_dump(mode="json", exclude={"cache_prefix"}) for m in messages],
+        "tools": [t.model_dump(mode="json") for t in tools] if tools else None,
+        "schema": response_schema.model_json_schema() if response_schema else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def is_cacheable(result: LLMResult) -> bool:
+    """True if a provider answer is worth caching.
+
+    Errors, empty answers and answers truncated at max_tokens are not.
+    """
+    if result.finish_reason in (FinishReason.ERROR, FinishReason.LENGTH):
+        return False
+    return bool(result.text.strip() or result.tool_calls or isinstance(result.raw, BaseModel))
+
+
+def cache_if_parses(parse: Callable[[str], Any]) -> Callable[[LLMResult], bool]:
+    """Build a cache_if predicate: cache only answers whose text parse() accepts.
+
+    Args:
+        parse: The caller's response parser (raises on a bad answer)
+    """
+    def parses(result: LLMResult) -> bool:
+        try:
+            parse(result.text)
+        except Exception:
+            return False
+        return True
+
+    return parses
+
+
+def serialize_result(result: LLMResult) -> dict[str, Any]:
+    """Serialize a result for storage (raw provider response is dropped)."""
+    data = result.model_dump(mode="json", exclude={"raw", "cached"})
+    if isinstance(result.raw, BaseModel):
+        # Structured output: keep the parsed object so it can be rebuilt
+        data["structured"] = result.raw.model_dump(mode="json")
+    return data
+
+
+def deserialize_result(
+    data: dict[str, Any],
+    response_schema: type[BaseModel] | None,
+    cached: bool = True,
+) -> LLMResult:
+    """Rebuild a stored result as a fresh LLMResult."""
+    data = dict(data)
+    structured = data.pop("structured", None)
+    result = LLMResult(**data, cached=cached)
+    if structured is not None and response_schema is not None:
+        result.raw = response_schema(**structured)
+    return result
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + optional Postgres) response cache."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        use_postgres: bool = False,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Max entries kept in memory (LRU eviction).
+            ttl_seconds: Time to live for entries in both tiers.
+            use_postgres: Also read/write the shared llm_response_cache table.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._use_postgres = use_postgres
+
+        # key -> (expires_at monotonic, serialized result)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._memory_hits = 0
+        self._postgres_hits = 0
+        self._stores = 0
+        self._evictions = 0
+        self._postgres_errors = 0
+
+    async def get(
+        self,
+        key: str,
+        response_schema: type[BaseModel] | None = None,
+    ) -> Optional[LLMResult]:
+        """Look up a cached result.
+
+        Args:
+            key: Key from make_cache_key()
+            response_schema: Schema used to rebuild structured output
+
+        Returns:
+            Cached LLMResult (cached=True), or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                self._memory_hits += 1
+                return deserialize_result(data, response_schema)
+            del self._entries[key]
+
+        if self._use_postgres:
+            data = await self._postgres_get(key)
+            if data is not None:
+                self._remember(key, data)
+                self._hits += 1
+                self._postgres_hits += 1
+                return deserialize_result(data, response_schema)
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, result: LLMResult) -> None:
+        """Cache a successful result in all tiers.
+
+        Args:
+            key: Key from make_cache_key()
+            result: Result to cache
+        """
+        data = serialize_result(result)
+        self._remember(key, data)
+        self._stores += 1
+
+        if self._use_postgres:
+            await self._postgres_put(key, data)
+
+    def _remember(self, key: str, data: dict[str, Any]) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def _postgres_get(self, key: str) -> Optional[dict[str, Any]]:
+        """Read from the shared tier. Failures count as a miss."""
+        from src.db.connection import get_connection
+        from src.db.llm_cache_store import LLMCacheStore
+
+        try:
+            async with get_connection() as conn:
+                return await LLMCacheStore(conn).get(key)
+        except Exception as e:
+            self._postgres_errors += 1
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    async def _postgres_put(self, key: str, data: dict[str, Any]) -> None:
+        """Write to the shared tier. Failures are logged, not raised."""
+        from src.db.connection import get_connection
+        from src.db.llm_cache_store import LLMCacheStore
+
+        try:
+            async with get_connection() as conn:
+                await LLMCacheStore(conn).put(key, data, self._ttl_seconds)
+        except Exception as e:
+            self._postgres_errors += 1
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the Postgres tier is left alone)."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache metrics.
+
+        Returns:
+            Dict with hit/miss counters, hit rate and memory tier size.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "memory_hits": self._memory_hits,
+            "postgres_hits": self._postgres_hits,
+            "stores": self._stores,
+            "evictions": self._evictions,
+            "postgres_errors": self._postgres_errors,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get or create the response cache singleton (sized from settings)."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = LLMResponseCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            use_postgres=settings.llm_cache_postgres,
+        )
+    return _cache
@@ -19,6 +19,10 @@ Usage:
     result = await llm.invoke(messages, tools=[...])
 """
 
+import logging
+import time
+from typing import Callable
+
 from pydantic import BaseModel
 
 from src.llm.types import (
@@ -27,11 +31,22 @@ from src.llm.types import (
     LLMResult,
     Message,
     MessageRole,
+    FinishReason,
 )
 from src.llm.adapters.base import BaseAdapter, ToolDefinition
-from src.llm.factory import detect_provider, create_adapter, get_default_model
+from src.llm.factory import detect_provider, get_default_model
+from src.llm.adapter_registry import get_shared_adapter
 from src.llm.capabilities import supports_feature
+from src.llm.cache import get_llm_cache, is_cacheable, make_cache_key
+from src.llm.rate_limit import invoke_with_rate_limit
+from src.llm.hedging import invoke_with_backups, record_latency
+from src.llm.routing import record_task_call
+from src.llm.accounting import record_usage
 from src.config import get_settings
+from src.tracing import span
+from src.metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_TOKENS
+
+logger = logging.getLogger(__name__)
 
 
 class UnifiedChatClient:
@@ -59,8 +74,14 @@ class UnifiedChatClient:
         # With structured output
         result = await client.invoke(messages, response_schema=MyModel)
 
+        # Latency-critical call: hedge to a fallback provider after p90
+        result = await client.invoke(messages, resilience="hedge")
+
         # Simple chat (returns text only)
         text = await client.chat("Hello!", system_message="You are helpful.")
+
+        # Cache only answers the caller's parser accepts
+        text = await client.chat(prompt, cache_if=cache_if_parses(json.loads))
     """
 
     def __init__(
@@ -71,6 +92,7 @@ class UnifiedChatClient:
         max_tokens: int = 4096,
         timeout_seconds: float = 30.0,
         api_key: str | None = None,
+        task: str | None = None,
     ):
         """Initialize the unified chat client.
 
@@ -82,6 +104,8 @@ class UnifiedChatClient:
             max_tokens: Maximum tokens in response.
             timeout_seconds: Request timeout.
             api_key: Override API key (otherwise uses settings).
+            task: Routing task name; calls are recorded per task (see
+                  src.llm.routing.get_llm_for_task).
         """
         settings = get_settings()
 
@@ -104,17 +128,19 @@ class UnifiedChatClient:
             api_key=api_key,
         )
 
+        self.task = task
         self._adapter: BaseAdapter | None = None
+        self._fallbacks: list[BaseAdapter] | None = None
 
     @property
     def adapter(self) -> BaseAdapter:
         """Lazy-load adapter.
 
-        The adapter is created on first access to avoid initialization
-        overhead when creating multiple clients.
+        Resolved on first access from the process-wide adapter registry,
+        so clients with equal configs share one adapter and HTTP client.
         """
         if self._adapter is None:
-            self._adapter = create_adapter(self.config)
+            self._adapter = get_shared_adapter(self.config)
         return self._adapter
 
     @property
@@ -127,6 +153,25 @@ class UnifiedChatClient:
         """Get the current model."""
         return self.config.model
 
+    def _fallback_adapters(self) -> list[BaseAdapter]:
+        """Adapters for settings.llm_fallback_models (same sampling settings).
+
+        Models whose provider has no API key configured are skipped.
+        """
+        if self._fallbacks is None:
+            self._fallbacks = []
+            for model in get_settings().llm_fallback_models:
+                if model == self.model:
+                    continue
+                config = self.config.model_copy(
+                    update={"provider": detect_provider(model), "model": model, "api_key": None}
+                )
+                try:
+                    self._fallbacks.append(get_shared_adapter(config))
+                except ValueError as e:
+                    logger.warning(f"Skipping fallback model {model}: {e}")
+        return self._fallbacks
+
     def supports(self, feature: str) -> bool:
         """Check if current provider supports a feature.
 
@@ -143,13 +188,29 @@ class UnifiedChatClient:
         messages: list[Message],
         tools: list[ToolDefinition] | None = None,
         response_schema: type[BaseModel] | None = None,
+        cache: bool | None = None,
+        resilience: str | None = None,
+        cache_if: Callable[[LLMResult], bool] | None = None,
     ) -> LLMResult:
         """Send messages and get unified result.
 
+        Identical requests are served from the response cache. By default
+        only deterministic calls (temperature 0) are cached, and only
+        usable answers are stored (see src.llm.cache.is_cacheable).
+
         Args:
             messages: List of messages to send
             tools: Optional tool definitions for function calling
             response_schema: Optional Pydantic model for structured output
+            cache: True to cache this call, False to bypass the cache,
+                   None for the default (cache if temperature is 0)
+            resilience: Backup policy using settings.llm_fallback_models:
+                   "off", "fallback" (retry elsewhere on error) or "hedge"
+                   (also race a fallback once the primary passes its p90),
+                   None for settings.llm_resilience_default
+            cache_if: Extra check before an answer is cached, typically
+                   cache_if_parses(parser) so unparseable answers are not
+                   replayed to retries
 
         Returns:
             Unified LLMResult with text, tool_calls, and metadata
@@ -163,13 +224,108 @@ class UnifiedChatClient:
         if response_schema and not self.supports("json_schema"):
             raise ValueError(f"{self.provider} does not support structured output")
 
-        return await self.adapter.invoke(
-            messages=messages,
-            tools=tools,
-            response_schema=response_schema,
-        )
-
-    async def chat(self, user_message: str, system_message: str | None = None) -> str:
+        settings = get_settings()
+        if cache is None:
+            cache = self.config.temperature == 0
+        use_cache = cache and settings.llm_cache_enabled
+
+        with span(
+            "llm.invoke",
+            kind="llm",
+            provider=self.provider.value,
+            model=self.model,
+        ) as llm_span:
+            cache_key = None
+            if use_cache:
+                cache_key = make_cache_key(self.config, messages, tools, response_schema)
+                cached = await get_llm_cache().get(cache_key, response_schema)
+                if cached is not None:
+                    if llm_span:
+                        llm_span.set(cached=True)
+                    LLM_REQUESTS.inc(provider=self.provider.value, outcome="cached")
+                    if self.task:
+                        record_task_call(self.task, cached, 0.0)
+                    return cached
+
+            mode = resilience or settings.llm_resilience_default
+            backups = self._usable_fallbacks(tools, response_schema) if mode != "off" else []
+            calls = [
+                (
+                    f"{adapter.config.provider.value}:{adapter.config.model}",
+                    lambda adapter=adapter: invoke_with_rate_limit(
+                        adapter,
+                        messages,
+                        tools=tools,
+                        response_schema=response_schema,
+                    ),
+                )
+                for adapter in [self.adapter, *backups]
+            ]
+
+            start = time.perf_counter()
+            result = await invoke_with_backups(calls, mode)
+            seconds = time.perf_counter() - start
+            self._record_metrics(result, seconds)
+            record_latency(result)
+            if self.task:
+                record_task_call(self.task, result, seconds)
+            record_usage(self.task, result)
+            if llm_span:
+                llm_span.set(
+                    cached=False,
+                    answered_by=f"{result.provider.value}:{result.model}",
+                    finish_reason=result.finish_reason.value,
+                    prompt_tokens=result.usage.prompt_tokens,
+                    cached_prompt_tokens=result.usage.cached_prompt_tokens,
+                    completion_tokens=result.usage.completion_tokens,
+                )
+
+            # Never cache unusable answers, nor a fallback model's answer
+            # under the primary model's key
+            answered_by_primary = (
+                result.provider == self.provider and result.model == self.model
+            )
+            if (
+                cache_key
+                and answered_by_primary
+                and is_cacheable(result)
+                and (cache_if is None or cache_if(result))
+            ):
+                await get_llm_cache().put(cache_key, result)
+
+            return result
+
+    def _usable_fallbacks(
+        self,
+        tools: list[ToolDefinition] | None,
+        response_schema: type[BaseModel] | None,
+    ) -> list[BaseAdapter]:
+        """Fallback adapters whose provider supports the requested features."""
+        return [
+            adapter
+            for adapter in self._fallback_adapters()
+            if (not tools or supports_feature(adapter.config.provider, "tools"))
+            and (not response_schema or supports_feature(adapter.config.provider, "json_schema"))
+        ]
+
+    def _record_metrics(self, result: LLMResult, seconds: float) -> None:
+        """Record latency, outcome and token usage for a provider call."""
+        provider = result.provider.value
+        LLM_REQUEST_SECONDS.observe(seconds, provider=provider)
+        outcome = "error" if result.finish_reason == FinishReason.ERROR else "ok"
+        LLM_REQUESTS.inc(provider=provider, outcome=outcome)
+        LLM_TOKENS.inc(result.usage.prompt_tokens, provider=provider, type="prompt")
+        LLM_TOKENS.inc(result.usage.completion_tokens, provider=provider, type="completion")
+        LLM_TOKENS.inc(result.usage.cached_prompt_tokens, provider=provider, type="cached_prompt")
+
+    async def chat(
+        self,
+        user_message: str,
+        system_message: str | None = None,
+        cache: bool | None = None,
+        resilience: str | None = None,
+        cache_if: Callable[[LLMResult], bool] | None = None,
+    ) -> str:
         """Simple chat interface - returns text only.
 
         This is a convenience method for simple conversations without
@@ -177,17 +333,25 @@ class UnifiedChatClient:
 
         Args:
             user_message: The user's message
-            system_message: Optional system prompt
+            system_message: Optional system prompt (static: marked as the
+                provider prompt-cache prefix)
+            cache: Response cache policy (see invoke())
+            resilience: Backup policy (see invoke())
+            cache_if: Extra check before an answer is cached (see invoke())
 
         Returns:
             The assistant's text response
         """
         messages = []
         if system_message:
-            messages.append(Message(role=MessageRole.SYSTEM, content=system_message))
+            messages.append(
+                Message(role=MessageRole.SYSTEM, content=system_message, cache_prefix=True)
+            )
         messages.append(Message(role=MessageRole.USER, content=user_message))
 
-        result = await self.invoke(messages)
+        result = await self.invoke(
+            messages, cache=cache, resilience=resilience, cache_if=cache_if
+        )
         return result.text
 
 
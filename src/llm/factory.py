@@ -3,6 +3,7 @@
 This module provides:
 - Provider detection from model names
 - Adapter instantiation based on provider/model
+- Record/replay wrapping (settings.llm_replay_mode)
 - Default model lookup for each provider
 """
 
@@ -42,6 +43,9 @@ def detect_provider(model: str) -> LLMProvider:
 def create_adapter(config: LLMConfig) -> BaseAdapter:
     """Create adapter instance for the specified provider.
 
+    With settings.llm_replay_mode set, returns a ReplayAdapter instead:
+    "record" wraps the provider adapter, "replay" needs no provider.
+
     Args:
         config: LLM configuration with provider, model, and settings
 
@@ -49,8 +53,21 @@ def create_adapter(config: LLMConfig) -> BaseAdapter:
         Initialized adapter for the provider
 
     Raises:
-        ValueError: If provider is unknown
+        ValueError: If provider or replay mode is unknown
     """
+    from src.config import get_settings
+
+    replay_mode = get_settings().llm_replay_mode
+    if replay_mode:
+        from src.llm.adapters.replay import create_replay_adapter
+
+        inner = _create_provider_adapter(config) if replay_mode == "record" else None
+        return create_replay_adapter(config, inner)
+    return _create_provider_adapter(config)
+
+
+def _create_provider_adapter(config: LLMConfig) -> BaseAdapter:
+    """Create the real adapter for config.provider."""
     if config.provider == LLMProvider.GEMINI:
         from src.llm.adapters.gemini import GeminiAdapter
         return GeminiAdapter(config)
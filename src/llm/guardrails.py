@@ -0,0 +1,155 @@
+"""Prompt-size guardrails for LLM call sites.
+
+Each routed task has a prompt budget (ModelRoute.prompt_budget_tokens).
+PromptBudget estimates the template's own size, then fits the dynamic
+inputs (latest message, pin content, draft JSON) into what is left:
+- Text inputs keep their head and tail with a marker in the middle
+- Drafts are trimmed field by field (long strings shortened, long lists
+  capped) so the JSON stays valid and every field stays present
+
+Every truncation is logged with the task and input name and counted in
+maro_llm_prompt_truncations_total.
+
+Usage:
+    budget = PromptBudget.for_task("extraction", EXTRACTION_SYSTEM_PROMPT + EXTRACTION_PROMPT)
+    message_text = budget.fit_text("message", message_text, share=0.5)
+    draft_json = budget.fit_draft("draft", draft, exclude=DRAFT_EXCLUDE)
+"""
+import json
+import logging
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from src.config import get_settings
+from src.metrics import LLM_PROMPT_TRUNCATIONS
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio (same estimate as the rate limiter)
+CHARS_PER_TOKEN = 4
+
+# Progressively tighter limits for draft trimming: (max chars per string, max list items)
+DRAFT_TRIM_STEPS = ((2000, 20), (1000, 10), (400, 5), (150, 3))
+
+TRUNCATION_MARKER = " [...truncated...] "
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Estimate tokens in a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def truncate_text(text: str, max_tokens: int) -> str:
+    """Shorten text to about max_tokens, keeping its head and tail."""
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    if len(text) <= max_chars + len(TRUNCATION_MARKER):
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    return text[:head] + TRUNCATION_MARKER + (text[-tail:] if tail else "")
+
+
+def _trim_value(value: Any, max_chars: int, max_items: int) -> Any:
+    """Shorten strings and cap lists inside a JSON-like value."""
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "..."
+    if isinstance(value, list):
+        trimmed = [_trim_value(v, max_chars, max_items) for v in value[:max_items]]
+        if len(value) > max_items:
+            trimmed.append(f"(+{len(value) - max_items} more)")
+        return trimmed
+    if isinstance(value, dict):
+        return {k: _trim_value(v, max_chars, max_items) for k, v in value.items()}
+    return value
+
+
+class PromptBudget:
+    """Token budget for the dynamic inputs of one prompt."""
+
+    def __init__(self, task: str, budget_tokens: int, template: str = ""):
+        """Initialize budget.
+
+        Args:
+            task: Routing task (for logs and metrics)
+            budget_tokens: Whole prompt budget (0 = unlimited)
+            template: Prompt template; its size is reserved first
+        """
+        self.task = task
+        self.enabled = budget_tokens > 0 and get_settings().prompt_guardrails_enabled
+        self.total = max(0, budget_tokens - estimate_text_tokens(template))
+        self.remaining = self.total
+        self.truncated: list[str] = []
+
+    @classmethod
+    def for_task(cls, task: str, template: str = "") -> "PromptBudget":
+        """Budget from the task's route (see src.llm.routing)."""
+        from src.llm.routing import get_route
+        return cls(task, get_route(task).prompt_budget_tokens, template)
+
+    def _record(self, name: str, before: int, after: int) -> None:
+        self.truncated.append(name)
+        LLM_PROMPT_TRUNCATIONS.inc(task=self.task, input=name)
+        logger.warning(
+            f"Prompt input '{name}' truncated for {self.task}",
+            extra={
+                "task": self.task,
+                "input": name,
+                "tokens_before": before,
+                "tokens_after": after,
+            },
+        )
+
+    def fit_text(self, name: str, text: str, share: float = 1.0) -> str:
+        """Fit a text input into the budget.
+
+        Args:
+            name: Input name (for logs)
+            text: Input text
+            share: Max fraction of the whole dynamic budget this input may use
+
+        Returns:
+            Text, truncated if over its allowance
+        """
+        tokens = estimate_text_tokens(text)
+        if not self.enabled:
+            return text
+        allowance = min(self.remaining, int(self.total * share))
+        if tokens > allowance:
+            text = truncate_text(text, allowance)
+            self._record(name, tokens, estimate_text_tokens(text))
+            tokens = estimate_text_tokens(text)
+        self.remaining = max(0, self.remaining - tokens)
+        return text
+
+    def fit_draft(
+        self,
+        name: str,
+        draft: BaseModel,
+        exclude: Optional[set[str]] = None,
+    ) -> str:
+        """Serialize a draft within the remaining budget.
+
+        Args:
+            name: Input name (for logs)
+            draft: Draft model
+            exclude: Fields left out of the JSON
+
+        Returns:
+            Draft JSON; trimmed (still valid JSON) if over budget
+        """
+        draft_json = draft.model_dump_json(exclude=exclude)
+        tokens = estimate_text_tokens(draft_json)
+        if not self.enabled or tokens <= self.remaining:
+            self.remaining = max(0, self.remaining - tokens)
+            return draft_json
+
+        data = draft.model_dump(mode="json", exclude=exclude)
+        for max_chars, max_items in DRAFT_TRIM_STEPS:
+            draft_json = json.dumps(_trim_value(data, max_chars, max_items))
+            if estimate_text_tokens(draft_json) <= self.remaining:
+                break
+        trimmed_tokens = estimate_text_tokens(draft_json)
+        self._record(name, tokens, trimmed_tokens)
+        self.remaining = max(0, self.remaining - trimmed_tokens)
+        return draft_json
@@ -0,0 +1,189 @@
+"""Latency hedging and fallback across LLM providers.
+
+UnifiedChatClient.invoke() can back up its primary provider with the
+models in settings.llm_fallback_models:
+- "fallback": if the primary returns an error, the next model is tried
+  immediately
+- "hedge": as fallback, and if the primary has not answered within its
+  observed latency percentile (settings.llm_hedge_percentile, p90 by
+  default), the same request goes to the next model as well. The first
+  good answer wins and the other request is cancelled.
+- "off": primary only
+
+The mode is chosen per call site (latency-critical extraction hedges,
+background pin extraction only falls back), with
+settings.llm_resilience_default for call sites that do not choose.
+
+Usage:
+    result = await llm.invoke(messages, resilience="hedge")
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from src.config import get_settings
+from src.llm.types import FinishReason, LLMResult
+from src.metrics import LLM_BACKUP_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+RESILIENCE_MODES = ("off", "fallback", "hedge")
+
+# Call latencies kept per provider:model (successful calls and cancelled
+# hedge losers)
+LATENCY_WINDOW = 200
+
+
+class LatencyTracker:
+    """Rolling window of call latencies for one provider/model."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, latency_ms: float) -> None:
+        self._samples.append(latency_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile in ms (None until enough samples)."""
+        if len(self._samples) < get_settings().llm_hedge_min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(pct * len(ordered)))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+_trackers: dict[str, LatencyTracker] = {}
+
+
+def get_latency_tracker(label: str) -> LatencyTracker:
+    """Get or create the tracker for a provider:model label."""
+    tracker = _trackers.get(label)
+    if tracker is None:
+        tracker = _trackers[label] = LatencyTracker()
+    return tracker
+
+
+def record_latency(result: LLMResult) -> None:
+    """Record a provider call latency (successful calls only)."""
+    if result.finish_reason != FinishReason.ERROR and not result.cached:
+        get_latency_tracker(f"{result.provider.value}:{result.model}").record(result.latency_ms)
+
+
+def hedge_delay_seconds(label: str) -> float:
+    """How long to wait for a provider before hedging.
+
+    The tracked percentile latency, floored at llm_hedge_min_delay_ms;
+    llm_hedge_default_delay_ms until enough samples are collected.
+    """
+    settings = get_settings()
+    observed = get_latency_tracker(label).percentile(settings.llm_hedge_percentile)
+    delay_ms = settings.llm_hedge_default_delay_ms if observed is None else observed
+    return max(delay_ms, settings.llm_hedge_min_delay_ms) / 1000
+
+
+def get_hedging_stats() -> dict[str, dict[str, Optional[float]]]:
+    """Get tracked p50/p90 latency and hedge delay per provider:model."""
+    return {
+        label: {
+            "samples": len(tracker),
+            "p50_ms": tracker.percentile(0.5),
+            "p90_ms": tracker.percentile(0.9),
+            "hedge_delay_ms": round(hedge_delay_seconds(label) * 1000, 1),
+        }
+        for label, tracker in _trackers.items()
+    }
+
+
+async def invoke_with_backups(
+    calls: list[tuple[str, Callable[[], Awaitable[LLMResult]]]],
+    mode: str,
+) -> LLMResult:
+    """Run the primary call, backed up by the others per mode.
+
+    At most two calls run at once. Losing calls are cancelled. A cancelled
+    primary's elapsed time (at least the hedge delay) is recorded as a
+    censored latency sample, so a slow primary that keeps losing the race
+    still pushes its percentile up instead of only its fast calls being
+    tracked.
+
+    Args:
+        calls: (provider:model label, call) pairs, primary first
+        mode: "off", "fallback" or "hedge"
+
+    Returns:
+        First successful result, or the last error result if all failed
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in RESILIENCE_MODES:
+        raise ValueError(f"Unknown resilience mode: {mode}")
+    if mode == "off" or len(calls) == 1:
+        return await calls[0][1]()
+
+    pending = list(calls)
+    running: dict[asyncio.Task, str] = {}
+    primary_started = time.perf_counter()
+    hedge_delay_ms = 0.0
+
+    def start_next(reason: str) -> None:
+        label, call = pending.pop(0)
+        if reason != "primary":
+            LLM_BACKUP_REQUESTS.inc(reason=reason, model=label)
+            logger.info(
+                f"Sending backup LLM request ({reason})",
+                extra={"model": label, "waiting_on": list(running.values())},
+            )
+        running[asyncio.ensure_future(call())] = label
+
+    start_next("primary")
+    primary_task = next(iter(running))
+    last_result: Optional[LLMResult] = None
+    last_error: Optional[BaseException] = None
+    try:
+        while running:
+            timeout = None
+            if mode == "hedge" and pending and len(running) == 1:
+                timeout = hedge_delay_seconds(next(iter(running.values())))
+                hedge_delay_ms = timeout * 1000
+
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                start_next("hedge")
+                continue
+
+            for task in done:
+                label = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"LLM request raised on {label}: {e}", extra={"model": label})
+                    continue
+                if result.finish_reason != FinishReason.ERROR:
+                    return result
+                last_result = result
+                logger.warning(
+                    f"LLM request failed on {label}: {result.error}",
+                    extra={"model": label, "rate_limited": result.rate_limited},
+                )
+
+            if pending and len(running) < 2:
+                start_next("error")
+    finally:
+        for task, label in running.items():
+            task.cancel()
+            if task is primary_task:
+                elapsed_ms = (time.perf_counter() - primary_started) * 1000
+                get_latency_tracker(label).record(max(elapsed_ms, hedge_delay_ms))
+
+    if last_result is None and last_error is not None:
+        raise last_error
+    return last_result
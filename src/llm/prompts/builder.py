@@ -70,21 +70,43 @@ class PromptBuilder:
         )
 
     def build_system_prompt(self) -> str:
-        """Build system prompt with provider overlay."""
+        """Build system prompt with provider overlay.
+
+        The result is the stable prefix of every prompt (providers cache
+        it, Gemini as one stored cached content per distinct prefix), so it
+        holds only static instructions. Channel context, drafts and
+        conversation go in the user message.
+        """
         overlay = get_system_overlay(self.provider)
         prompt = apply_overlay(ANALYST_SYSTEM_BASE, overlay)
         self._log_prompt("system", prompt)
         return prompt
 
+    def _system_message(self) -> Message:
+        """System message marked as the provider prompt-cache prefix."""
+        return Message(
+            role=MessageRole.SYSTEM,
+            content=self.build_system_prompt(),
+            cache_prefix=True,
+        )
+
+    @staticmethod
+    def _with_channel_context(user_content: str, channel_context: list[str] | None) -> str:
+        """Prepend channel context bullets (rules, conventions) to a user message."""
+        if not channel_context:
+            return user_content
+        bullets = "\n".join(f"- {line}" for line in channel_context)
+        return f"Channel context:\n{bullets}\n\n{user_content}"
+
     def build_extraction_prompt(
         self,
         ticket_type: str,
         draft: dict[str, Any] | None,
         missing_fields: list[str],
         conversation: str,
+        channel_context: list[str] | None = None,
     ) -> list[Message]:
         """Build extraction prompt messages."""
-        system = self.build_system_prompt()
 
         user_content = EXTRACTION_TEMPLATE.format(
             ticket_type=ticket_type,
@@ -100,8 +122,11 @@ class PromptBuilder:
         self._log_prompt("extraction", user_content)
 
         return [
-            Message(role=MessageRole.SYSTEM, content=system),
-            Message(role=MessageRole.USER, content=user_content),
+            self._system_message(),
+            Message(
+                role=MessageRole.USER,
+                content=self._with_channel_context(user_content, channel_context),
+            ),
         ]
 
     def build_validation_prompt(
@@ -109,9 +134,9 @@ class PromptBuilder:
         ticket_type: str,
         draft: dict[str, Any] | None,
         missing_fields: list[str],
+        channel_context: list[str] | None = None,
     ) -> list[Message]:
         """Build validation prompt messages."""
-        system = self.build_system_prompt()
 
         user_content = VALIDATION_TEMPLATE.format(
             ticket_type=ticket_type,
@@ -122,8 +147,11 @@ class PromptBuilder:
         self._log_prompt("validation", user_content)
 
         return [
-            Message(role=MessageRole.SYSTEM, content=system),
-            Message(role=MessageRole.USER, content=user_content),
+            self._system_message(),
+            Message(
+                role=MessageRole.USER,
+                content=self._with_channel_context(user_content, channel_context),
+            ),
         ]
 
     def build_questioning_prompt(
@@ -131,9 +159,9 @@ class PromptBuilder:
         ticket_type: str,
         draft: dict[str, Any] | None,
         missing_fields: list[str],
+        channel_context: list[str] | None = None,
     ) -> list[Message]:
         """Build questioning prompt messages."""
-        system = self.build_system_prompt()
 
         user_content = QUESTIONING_TEMPLATE.format(
             ticket_type=ticket_type,
@@ -144,8 +172,11 @@ class PromptBuilder:
         self._log_prompt("questioning", user_content)
 
         return [
-            Message(role=MessageRole.SYSTEM, content=system),
-            Message(role=MessageRole.USER, content=user_content),
+            self._system_message(),
+            Message(
+                role=MessageRole.USER,
+                content=self._with_channel_context(user_content, channel_context),
+            ),
         ]
 
 
@@ -0,0 +1,351 @@
+"""Client-side rate limiting for LLM provider calls.
+
+One RateLimiter per provider/model sits in front of adapter.invoke():
+- Token buckets for requests per minute and tokens per minute (prompt
+  estimate up front, corrected with the reported usage afterwards)
+- AIMD concurrency: the in-flight limit halves on a 429 / quota error
+  and grows by about one per limit's worth of successful calls
+- FIFO waiters with deadlines: a call that cannot start before its
+  deadline returns an error result instead of waiting forever
+- Rate-limited calls are retried (within the deadline) after the limit
+  shrinks, so bursts queue instead of degrading turns
+
+Limits come from settings: llm_rate_limit_rpm / llm_rate_limit_tpm as
+defaults, overridden per provider or model by llm_rate_limits, e.g.
+LLM_RATE_LIMITS='{"gemini": {"rpm": 1000}, "gpt-4o-mini": {"tpm": 200000}}'.
+
+Usage:
+    from src.llm.rate_limit import invoke_with_rate_limit
+
+    result = await invoke_with_rate_limit(adapter, messages, tools, schema)
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import BaseModel
+
+from src.config import get_settings
+from src.llm.types import FinishReason, LLMResult, Message
+from src.metrics import LLM_RATE_LIMITED, LLM_THROTTLE_WAIT_SECONDS
+
+if TYPE_CHECKING:
+    from src.llm.adapters.base import BaseAdapter, ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio for prompt estimates
+CHARS_PER_TOKEN = 4
+# Completion tokens reserved up front (corrected after the call)
+COMPLETION_ESTIMATE = 256
+# Ignore further 429s this long after a decrease (one cut per burst)
+DECREASE_COOLDOWN_SECONDS = 1.0
+# First retry delay after a 429 (doubles per retry, capped by the deadline)
+RETRY_BACKOFF_SECONDS = 0.5
+
+
+def estimate_tokens(messages: list[Message]) -> int:
+    """Estimate prompt tokens from message length."""
+    return sum(len(m.content) for m in messages) // CHARS_PER_TOKEN + 1
+
+
+class RateLimitTimeout(Exception):
+    """A call could not start before its deadline."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_minute.
+
+    The level may go negative when actual usage exceeds the estimate;
+    later calls then wait for the debt to refill.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(rate_per_minute)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount is available (0 if now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self._level) / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Take amount (or give back a negative amount)."""
+        if self.unlimited:
+            return
+        self._refill()
+        self._level = min(self.capacity, self._level - amount)
+
+    def drain(self) -> None:
+        """Empty the bucket (after a 429, wait for a fresh refill)."""
+        if not self.unlimited:
+            self._refill()
+            self._level = min(self._level, 0.0)
+
+
+class RateLimiter:
+    """Request/token buckets plus AIMD concurrency for one provider/model."""
+
+    def __init__(
+        self,
+        name: str,
+        rpm: float,
+        tpm: float,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+    ):
+        """Initialize limiter.
+
+        Args:
+            name: provider:model label for logs and metrics
+            rpm: Requests per minute (0 = unlimited)
+            tpm: Tokens per minute, prompt + completion (0 = unlimited)
+            max_concurrency: Upper bound (and starting value) of the in-flight limit
+            min_concurrency: Lower bound of the in-flight limit
+        """
+        self.name = name
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+
+        self._cond = asyncio.Condition()
+        self._queue: deque[object] = deque()
+        self._wake_tasks: set[asyncio.Task] = set()
+
+        # Metrics
+        self._calls = 0
+        self._throttled = 0
+        self._rate_limited = 0
+        self._timeouts = 0
+        self._wait_total_s = 0.0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self._min_concurrency, int(self._limit))
+
+    async def acquire(self, tokens: int, deadline: float) -> float:
+        """Wait for a slot, in FIFO order.
+
+        Args:
+            tokens: Estimated tokens for the call
+            deadline: time.monotonic() by which the call must start
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitTimeout: If the deadline passes first
+        """
+        start = time.monotonic()
+        ticket = object()
+        async with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    wait_s: Optional[float] = None
+                    if self._queue[0] is ticket and self._in_flight < self.concurrency_limit:
+                        wait_s = max(self._requests.wait_time(1), self._tokens.wait_time(tokens))
+                        if wait_s <= 0:
+                            break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise RateLimitTimeout(f"{self.name}: no capacity before deadline")
+                    timeout = remaining if wait_s is None else min(wait_s, remaining)
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._queue.remove(ticket)
+                # The next waiter may now be at the head of the queue
+                self._cond.notify_all()
+
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+            self._in_flight += 1
+
+        waited = time.monotonic() - start
+        self._calls += 1
+        self._wait_total_s += waited
+        if waited > 0.001:
+            self._throttled += 1
+        return waited
+
+    def release(self, estimated_tokens: int, result: Optional[LLMResult]) -> None:
+        """Return a slot and adapt the limit to the outcome.
+
+        Synchronous so it also runs for cancelled calls; waiters are woken
+        by a separate task.
+
+        Args:
+            estimated_tokens: Tokens reserved in acquire()
+            result: Call result (None if the call raised or was cancelled)
+        """
+        self._in_flight -= 1
+        if result is not None:
+            if result.usage.total_tokens:
+                self._tokens.consume(result.usage.total_tokens - estimated_tokens)
+            if result.rate_limited:
+                self._on_rate_limited()
+            elif result.finish_reason != FinishReason.ERROR:
+                # Additive increase: about +1 per limit's worth of successes
+                self._limit = min(self._max_concurrency, self._limit + 1 / self._limit)
+
+        task = asyncio.get_running_loop().create_task(self._wake())
+        self._wake_tasks.add(task)
+        task.add_done_callback(self._wake_tasks.discard)
+
+    async def _wake(self) -> None:
+        """Let queued waiters re-check for a free slot."""
+        async with self._cond:
+            self._cond.notify_all()
+
+    def _on_rate_limited(self) -> None:
+        """Multiplicative decrease (once per cooldown) and pause new starts."""
+        self._rate_limited += 1
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self._limit = max(self._min_concurrency, self._limit / 2)
+        self._requests.drain()
+        logger.warning(
+            f"LLM rate limited, concurrency limit now {self.concurrency_limit}",
+            extra={"limiter": self.name, "in_flight": self._in_flight},
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limiter metrics."""
+        wait_avg_s = self._wait_total_s / self._calls if self._calls else 0.0
+        return {
+            "concurrency_limit": self.concurrency_limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._queue),
+            "calls": self._calls,
+            "throttled": self._throttled,
+            "rate_limited": self._rate_limited,
+            "timeouts": self._timeouts,
+            "wait_avg_ms": round(wait_avg_s * 1000, 2),
+        }
+
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Get or create the limiter for a provider/model (limits from settings)."""
+    name = f"{provider}:{model}"
+    limiter = _limiters.get(name)
+    if limiter is None:
+        settings = get_settings()
+        limits = {
+            "rpm": settings.llm_rate_limit_rpm,
+            "tpm": settings.llm_rate_limit_tpm,
+            "concurrency": settings.llm_max_concurrency,
+        }
+        # Provider overrides first, then model overrides
+        limits.update(settings.llm_rate_limits.get(provider, {}))
+        limits.update(settings.llm_rate_limits.get(model, {}))
+        limiter = RateLimiter(
+            name,
+            rpm=limits["rpm"],
+            tpm=limits["tpm"],
+            max_concurrency=int(limits["concurrency"]),
+        )
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Get metrics for every limiter, by provider:model."""
+    return {name: limiter.get_stats() for name, limiter in _limiters.items()}
+
+
+async def invoke_with_rate_limit(
+    adapter: "BaseAdapter",
+    messages: list[Message],
+    tools: "list[ToolDefinition] | None" = None,
+    response_schema: type[BaseModel] | None = None,
+    max_wait_seconds: Optional[float] = None,
+) -> LLMResult:
+    """Invoke an adapter behind its provider/model rate limiter.
+
+    Rate-limited results are retried (up to llm_rate_limit_max_retries)
+    while the deadline allows. If no slot frees up in time, returns an
+    error result like a failed provider call.
+
+    Args:
+        adapter: Adapter to call
+        messages: Messages to send
+        tools: Optional tool definitions
+        response_schema: Optional structured output schema
+        max_wait_seconds: Queueing deadline (default llm_rate_limit_max_wait_seconds)
+
+    Returns:
+        Adapter result, or an error result on deadline
+    """
+    settings = get_settings()
+    if not settings.llm_rate_limit_enabled:
+        return await adapter.invoke(messages, tools=tools, response_schema=response_schema)
+
+    config = adapter.config
+    provider = config.provider.value
+    limiter = get_rate_limiter(provider, config.model)
+    estimated = estimate_tokens(messages) + min(config.max_tokens, COMPLETION_ESTIMATE)
+    if max_wait_seconds is None:
+        max_wait_seconds = settings.llm_rate_limit_max_wait_seconds
+    deadline = time.monotonic() + max_wait_seconds
+
+    attempt = 0
+    while True:
+        try:
+            waited = await limiter.acquire(estimated, deadline)
+        except RateLimitTimeout as e:
+            LLM_RATE_LIMITED.inc(provider=provider, outcome="deadline")
+            logger.warning(f"LLM call dropped: {e}")
+            return LLMResult(
+                text="",
+                finish_reason=FinishReason.ERROR,
+                provider=config.provider,
+                model=config.model,
+                error=str(e),
+                rate_limited=True,
+            )
+        LLM_THROTTLE_WAIT_SECONDS.observe(waited, provider=provider)
+
+        result = None
+        try:
+            result = await adapter.invoke(messages, tools=tools, response_schema=response_schema)
+        finally:
+            limiter.release(estimated, result)
+
+        if not result.rate_limited:
+            return result
+        LLM_RATE_LIMITED.inc(provider=provider, outcome="429")
+        attempt += 1
+        remaining = deadline - time.monotonic()
+        if attempt > settings.llm_rate_limit_max_retries or remaining <= 0:
+            return result
+        await asyncio.sleep(min(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1), remaining))
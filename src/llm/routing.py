@@ -0,0 +1,194 @@
+"""Task-based model routing for LLM call sites.
+
+Each call site names its task; the routing table maps the task to model,
+temperature, max_tokens, timeout and prompt budget. Defaults live in DEFAULT_ROUTES
+(model None = settings.default_llm_model) and can be overridden per task
+with settings.llm_routes, e.g.:
+
+    LLM_ROUTES='{"answer_matching": {"model": "gemini-1.5-flash-8b", "max_tokens": 512}}'
+
+Calls made through a routed client are recorded per task and model
+(latency, tokens, estimated cost) so the table can be tuned with data:
+get_task_stats() and the maro_llm_task_* metrics.
+
+Usage:
+    from src.llm import get_llm_for_task
+
+    llm = get_llm_for_task("extraction")
+    text = await llm.chat(prompt)
+"""
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Optional
+
+from src.config import get_settings
+from src.llm.types import FinishReason, LLMResult
+from src.metrics import LLM_COST_USD, LLM_TASK_SECONDS
+
+if TYPE_CHECKING:
+    from src.llm.client import UnifiedChatClient
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model and sampling settings for one task."""
+
+    model: Optional[str] = None  # None = settings.default_llm_model
+    temperature: float = 0.7
+    max_tokens: int = 4096
+    timeout_seconds: float = 30.0
+    prompt_budget_tokens: int = 8000  # Prompt size guardrail (0 = unlimited)
+
+
+DEFAULT_ROUTES: dict[str, ModelRoute] = {
+    # Turn critical path
+    "extraction": ModelRoute(),
+    "fused_turn": ModelRoute(prompt_budget_tokens=10000),
+    "validation": ModelRoute(temperature=0.0, prompt_budget_tokens=6000),
+    "answer_matching": ModelRoute(
+        temperature=0.0, max_tokens=1024, timeout_seconds=15.0, prompt_budget_tokens=4000
+    ),
+    "persona_validation": ModelRoute(
+        temperature=0.0, max_tokens=1024, timeout_seconds=15.0, prompt_budget_tokens=4000
+    ),
+    # Background
+    "pin_extraction": ModelRoute(temperature=0.0, timeout_seconds=60.0),
+}
+
+# USD per 1M tokens (input, output): list prices, prefix-matched on the
+# model name. Override or extend with settings.llm_model_prices.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gemini-1.5-flash-8b": (0.0375, 0.15),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-haiku": (0.25, 1.25),
+}
+
+
+def get_route(task: str) -> ModelRoute:
+    """Resolve the route for a task (defaults + settings overrides).
+
+    Unknown tasks get the default route, so new call sites work before
+    they are added to the table.
+    """
+    settings = get_settings()
+    route = DEFAULT_ROUTES.get(task, ModelRoute())
+    overrides = settings.llm_routes.get(task)
+    if overrides:
+        route = replace(route, **overrides)
+    if route.model is None:
+        route = replace(route, model=settings.default_llm_model)
+    return route
+
+
+def get_llm_for_task(task: str) -> "UnifiedChatClient":
+    """Get an LLM client configured by the routing table.
+
+    Args:
+        task: Task name (see DEFAULT_ROUTES)
+
+    Returns:
+        UnifiedChatClient whose calls are recorded under the task
+    """
+    from src.llm.client import UnifiedChatClient
+
+    route = get_route(task)
+    return UnifiedChatClient(
+        model=route.model,
+        temperature=route.temperature,
+        max_tokens=route.max_tokens,
+        timeout_seconds=route.timeout_seconds,
+        task=task,
+    )
+
+
+def _model_price(model: str) -> Optional[tuple[float, float]]:
+    """(input, output) USD per 1M tokens for a model, None if unknown."""
+    overrides = get_settings().llm_model_prices
+    if model in overrides:
+        price = overrides[model]
+        return price.get("input", 0.0), price.get("output", 0.0)
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+
+def estimate_cost_usd(result: LLMResult) -> Optional[float]:
+    """Estimated cost of a call (None if the model has no known price)."""
+    price = _model_price(result.model)
+    if price is None:
+        return None
+    return (
+        result.usage.prompt_tokens * price[0] + result.usage.completion_tokens * price[1]
+    ) / 1_000_000
+
+
+# (task, model) -> running totals
+_task_stats: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+def record_task_call(task: str, result: LLMResult, seconds: float) -> None:
+    """Record latency, tokens and cost of a routed call."""
+    key = (task, result.model)
+    stats = _task_stats.get(key)
+    if stats is None:
+        stats = _task_stats[key] = {
+            "calls": 0,
+            "cached": 0,
+            "errors": 0,
+            "latency_total_s": 0.0,
+            "latency_max_s": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cost_usd": 0.0,
+            "priced": True,
+        }
+
+    stats["calls"] += 1
+    if result.cached:
+        stats["cached"] += 1
+        return
+    if result.finish_reason == FinishReason.ERROR:
+        stats["errors"] += 1
+
+    stats["latency_total_s"] += seconds
+    stats["latency_max_s"] = max(stats["latency_max_s"], seconds)
+    stats["prompt_tokens"] += result.usage.prompt_tokens
+    stats["completion_tokens"] += result.usage.completion_tokens
+    LLM_TASK_SECONDS.observe(seconds, task=task, model=result.model)
+
+    cost = estimate_cost_usd(result)
+    if cost is None:
+        stats["priced"] = False
+    elif cost:
+        stats["cost_usd"] += cost
+        LLM_COST_USD.inc(cost, task=task, model=result.model)
+
+
+def get_task_stats() -> dict[str, dict[str, Any]]:
+    """Get per task/model call stats ("task:model" keys).
+
+    Returns:
+        Dict with calls, cache hits, errors, avg/max latency, tokens and
+        estimated cost (priced=False when the model has no known price).
+    """
+    report = {}
+    for (task, model), stats in _task_stats.items():
+        provider_calls = stats["calls"] - stats["cached"]
+        latency_avg_s = stats["latency_total_s"] / provider_calls if provider_calls else 0.0
+        report[f"{task}:{model}"] = {
+            "calls": stats["calls"],
+            "cached": stats["cached"],
+            "errors": stats["errors"],
+            "latency_avg_ms": round(latency_avg_s * 1000, 1),
+            "latency_max_ms": round(stats["latency_max_s"] * 1000, 1),
+            "prompt_tokens": stats["prompt_tokens"],
+            "completion_tokens": stats["completion_tokens"],
+            "cost_usd": round(stats["cost_usd"], 6),
+            "priced": stats["priced"],
+        }
+    return report
@@ -28,6 +28,7 @@ class Message(BaseModel):
     content: str
     name: Optional[str] = None  # For tool messages
     tool_call_id: Optional[str] = None  # For tool responses
+    cache_prefix: bool = False  # Stable prefix ends here (providers may cache up to it)
 
 
 class ToolCall(BaseModel):
@@ -51,6 +52,7 @@ class TokenUsage(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Read from the provider prompt cache (part of prompt_tokens)
 
 
 class LLMResult(BaseModel):
@@ -69,6 +71,11 @@ class LLMResult(BaseModel):
     latency_ms: float = 0
     usage: TokenUsage = Field(default_factory=TokenUsage)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    cached: bool = False  # Served from the response cache
+
+    # Failure details (finish_reason=error)
+    error: Optional[str] = None
+    rate_limited: bool = False  # Provider rejected the call (429 / quota)
 
     # Raw response for debugging
     raw: Optional[Any] = None
@@ -0,0 +1,222 @@
+"""Process metrics in Prometheus text exposition format.
+
+Counters and histograms are updated in-process by the code paths they
+measure (turns, LLM calls, Jira requests). Gauges (pool stats, registry
+sizes, queue depth) are collected from the existing get_*_stats()
+functions when /metrics is scraped (see src.health).
+
+No client library: the exposition format is small, and this keeps the
+bot free of another dependency.
+
+Usage:
+    from src.metrics import LLM_REQUEST_SECONDS
+
+    LLM_REQUEST_SECONDS.observe(0.42, provider="gemini")
+"""
+import bisect
+import threading
+from typing import Iterable, Optional
+
+# Default latency buckets (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Render {k="v",...} (empty string for no labels)."""
+    if not labels:
+        return ""
+    parts = []
+    for key, value in sorted(labels.items()):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value (+Inf aware, integers without decimals)."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base for labelled metrics. Thread-safe."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        super().__init__(name, help_text)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        lines = self._header()
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(dict(key))} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text)
+        self._buckets = tuple(sorted(buckets))
+        # label key -> ([count per bucket..., +Inf], sum)
+        self._values: dict[tuple, tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self._buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(key, (list(counts), total)) for key, (counts, total) in self._values.items()]
+        lines = self._header()
+        for key, (counts, total) in items:
+            labels = dict(key)
+            cumulative = 0
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+def render_gauges(
+    name: str,
+    help_text: str,
+    samples: Iterable[tuple[dict[str, str], Optional[float]]],
+) -> list[str]:
+    """Render a gauge family from (labels, value) samples (None values skipped)."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        if value is not None:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+# --- Metrics updated in-process ---
+
+TURN_SECONDS = Histogram(
+    "maro_turn_duration_seconds",
+    "Graph turn latency (lock wait, state load, graph run, dispatch)",
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "maro_llm_request_duration_seconds",
+    "LLM call latency incl. rate limit waits and retries (cache hits excluded)",
+)
+LLM_THROTTLE_WAIT_SECONDS = Histogram(
+    "maro_llm_throttle_wait_seconds",
+    "Time LLM calls waited for a rate limiter slot",
+)
+LLM_RATE_LIMITED = Counter(
+    "maro_llm_rate_limited_total",
+    "LLM calls rejected by the provider (429) or dropped at the queue deadline",
+)
+LLM_REQUESTS = Counter(
+    "maro_llm_requests_total",
+    "LLM invocations by provider and outcome (ok, error, cached)",
+)
+LLM_BACKUP_REQUESTS = Counter(
+    "maro_llm_backup_requests_total",
+    "Requests sent to a fallback model by reason (hedge, error)",
+)
+LLM_TASK_SECONDS = Histogram(
+    "maro_llm_task_duration_seconds",
+    "LLM call latency by routing task and model (cache hits excluded)",
+)
+LLM_COST_USD = Counter(
+    "maro_llm_cost_usd_total",
+    "Estimated LLM spend by routing task and model (known prices only)",
+)
+LLM_PROMPT_TRUNCATIONS = Counter(
+    "maro_llm_prompt_truncations_total",
+    "Prompt inputs truncated to fit the task's prompt budget, by task and input",
+)
+LLM_TOKENS = Counter(
+    "maro_llm_tokens_total",
+    "LLM tokens by provider and type (prompt, completion, cached_prompt = prompt tokens"
+    " served from the provider prompt cache)",
+)
+JIRA_REQUEST_SECONDS = Histogram(
+    "maro_jira_request_duration_seconds",
+    "Jira API request latency, retries included",
+)
+JIRA_REQUESTS = Counter(
+    "maro_jira_requests_total",
+    "Jira API requests by method and outcome (ok, error)",
+)
+SESSION_LOCK_WAIT_SECONDS = Histogram(
+    "maro_session_lock_wait_seconds",
+    "Session lock wait by scope (local, distributed)",
+)
+SESSION_LOCK_ACQUIRES = Counter(
+    "maro_session_lock_acquires_total",
+    "Distributed session lock outcomes (ok, timeout, lease_lost)",
+)
+
+ALL_METRICS: tuple[_Metric, ...] = (
+    TURN_SECONDS,
+    LLM_REQUEST_SECONDS,
+    LLM_THROTTLE_WAIT_SECONDS,
+    LLM_RATE_LIMITED,
+    LLM_REQUESTS,
+    LLM_BACKUP_REQUESTS,
+    LLM_TASK_SECONDS,
+    LLM_COST_USD,
+    LLM_PROMPT_TRUNCATIONS,
+    LLM_TOKENS,
+    JIRA_REQUEST_SECONDS,
+    JIRA_REQUESTS,
+    SESSION_LOCK_WAIT_SECONDS,
+    SESSION_LOCK_ACQUIRES,
+)
+
+
+def render_metrics() -> list[str]:
+    """Render all in-process counters and histograms."""
+    lines: list[str] = []
+    for metric in ALL_METRICS:
+        lines.extend(metric.render())
+    return lines
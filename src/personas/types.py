@@ -51,6 +51,15 @@ class ValidationFindings(BaseModel):
     """Collection of findings from all validators."""
     findings: list[ValidatorFinding] = Field(default_factory=list)
     has_blocking: bool = False  # True if any BLOCK severity
+    validators_run: list[str] = Field(default_factory=list)  # Validators these findings cover
+    validator_latency_ms: dict[str, float] = Field(default_factory=dict)  # This run only
+    timed_out: list[str] = Field(default_factory=list)  # Validators cut off by timeout/deadline
+    failed: list[str] = Field(default_factory=list)  # Validators that raised
+
+    @property
+    def complete(self) -> bool:
+        """True if every selected validator finished (none timed out or failed)."""
+        return not self.timed_out and not self.failed
 
     def add(self, finding: ValidatorFinding) -> None:
         """Add a finding."""
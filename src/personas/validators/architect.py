@@ -13,6 +13,8 @@ from src.personas.validators.base import BaseValidator, get_validator_registry
 class BoundariesValidator(BaseValidator):
     """Checks for clear system/service boundaries."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("boundaries", PersonaName.ARCHITECT)
 
@@ -51,6 +53,8 @@ class BoundariesValidator(BaseValidator):
 class FailureModesValidator(BaseValidator):
     """Checks for failure mode considerations."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("failure_modes", PersonaName.ARCHITECT)
 
@@ -90,6 +94,8 @@ class FailureModesValidator(BaseValidator):
 class IdempotencyValidator(BaseValidator):
     """Checks for idempotency in write operations."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("idempotency", PersonaName.ARCHITECT)
 
@@ -130,6 +136,8 @@ class IdempotencyValidator(BaseValidator):
 class ScalingValidator(BaseValidator):
     """Checks for scaling considerations."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("scaling", PersonaName.ARCHITECT)
 
@@ -29,12 +29,25 @@ class BaseValidator(ABC):
     - Belongs to a persona (PM, Security, Architect)
     - Produces findings with severity (BLOCK, WARN, INFO)
     - Can run silently (no persona switch) based on detection
+    - Declares the draft fields it reads (depends_on), so its findings can
+      be reused when none of them changed
     """
 
+    # Draft fields read by validate(). Empty = unknown, always re-run.
+    depends_on: tuple[str, ...] = ()
+
+    # True if validate() calls the LLM (concurrency-capped during validation)
+    uses_llm: bool = False
+
     def __init__(self, name: str, persona: PersonaName) -> None:
         self.name = name
         self.persona = persona
 
+    def get_llm(self):
+        """LLM client for validators with uses_llm (routed as "persona_validation")."""
+        from src.llm.routing import get_llm_for_task
+        return get_llm_for_task("persona_validation")
+
     @abstractmethod
     async def validate(
         self,
@@ -13,6 +13,8 @@ from src.personas.validators.base import BaseValidator, get_validator_registry
 class ScopeValidator(BaseValidator):
     """Checks for clear scope definition."""
 
+    depends_on = ("problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("scope", PersonaName.PM)
 
@@ -58,6 +60,8 @@ class ScopeValidator(BaseValidator):
 class AcceptanceCriteriaValidator(BaseValidator):
     """Checks acceptance criteria quality."""
 
+    depends_on = ("acceptance_criteria",)
+
     def __init__(self) -> None:
         super().__init__("acceptance_criteria", PersonaName.PM)
 
@@ -96,6 +100,8 @@ class AcceptanceCriteriaValidator(BaseValidator):
 class RisksValidator(BaseValidator):
     """Checks for risk identification."""
 
+    depends_on = ("title", "problem", "proposed_solution", "risks")
+
     def __init__(self) -> None:
         super().__init__("risks", PersonaName.PM)
 
@@ -129,6 +135,8 @@ class RisksValidator(BaseValidator):
 class DependenciesValidator(BaseValidator):
     """Checks for dependency identification."""
 
+    depends_on = ("problem", "proposed_solution", "dependencies")
+
     def __init__(self) -> None:
         super().__init__("dependencies", PersonaName.PM)
 
@@ -14,6 +14,8 @@ from src.personas.validators.base import BaseValidator, get_validator_registry
 class AuthzValidator(BaseValidator):
     """Checks for authorization model in requirements."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("authz", PersonaName.SECURITY)
 
@@ -48,6 +50,8 @@ class AuthzValidator(BaseValidator):
 class DataRetentionValidator(BaseValidator):
     """Checks for data retention considerations."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("data_retention", PersonaName.SECURITY)
 
@@ -86,6 +90,8 @@ class DataRetentionValidator(BaseValidator):
 class SecretsValidator(BaseValidator):
     """Checks for secret/credential handling."""
 
+    depends_on = ("title", "problem", "proposed_solution", "acceptance_criteria")
+
     def __init__(self) -> None:
         super().__init__("secrets", PersonaName.SECURITY)
 
@@ -136,6 +142,8 @@ class SecretsValidator(BaseValidator):
 class LeastPrivilegeValidator(BaseValidator):
     """Checks for least privilege principle."""
 
+    depends_on = ("title", "problem", "proposed_solution")
+
     def __init__(self) -> None:
         super().__init__("least_privilege", PersonaName.SECURITY)
 
@@ -0,0 +1,169 @@
+"""Bounded in-process registry with idle-TTL and LRU eviction.
+
+Used for per-session objects that would otherwise accumulate for every
+thread ever seen (graph runners, session locks). Entries idle for longer
+than the TTL are dropped, and the least recently used entries are dropped
+once the registry is over its size limit. Entries the owner marks as not
+evictable (e.g., a held lock) are skipped and stay until they are free.
+
+Eviction runs inside get_or_create(), so the cost is amortised over
+lookups and there is no background task.
+
+Usage:
+    from src.registry import BoundedRegistry
+
+    locks = BoundedRegistry(
+        name="session_locks",
+        max_size=10000,
+        idle_ttl_seconds=86400,
+        factory=lambda key: asyncio.Lock(),
+        can_evict=lambda lock: not lock.locked(),
+    )
+    lock = locks.get_or_create(session_id)
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class BoundedRegistry(Generic[V]):
+    """Keyed registry with idle-TTL + LRU eviction and hit-rate metrics.
+
+    Not thread-safe: use from one event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        idle_ttl_seconds: float,
+        factory: Optional[Callable[[str], V]] = None,
+        can_evict: Optional[Callable[[V], bool]] = None,
+        on_evict: Optional[Callable[[str, V], None]] = None,
+    ) -> None:
+        """Initialize registry.
+
+        Args:
+            name: Label for logs and stats.
+            max_size: Soft size limit (pinned entries may exceed it).
+            idle_ttl_seconds: Entries unused for longer are evicted.
+            factory: Creates the value for a missing key (or pass one to
+                get_or_create()).
+            can_evict: Returns False for values that must be kept.
+            on_evict: Called with (key, value) for each evicted entry, e.g.
+                to release resources held outside the process.
+        """
+        self.name = name
+        self._factory = factory
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl_seconds
+        self._can_evict = can_evict or (lambda value: True)
+        self._on_evict = on_evict
+
+        # key -> (value, last used monotonic), least recently used first
+        self._entries: OrderedDict[str, tuple[V, float]] = OrderedDict()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(self, key: str, factory: Optional[Callable[[], V]] = None) -> V:
+        """Get the value for key, creating it if missing, and mark it used.
+
+        Args:
+            key: Registry key.
+            factory: Creates the value if missing (overrides the registry factory).
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            value = entry[0]
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+        else:
+            self._misses += 1
+            value = factory() if factory else self._factory(key)
+            self._entries[key] = (value, now)
+            self._evict(now, keep=key)
+        return value
+
+    def get(self, key: str) -> Optional[V]:
+        """Get the value for key without creating it or marking it used."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def remove(self, key: str) -> bool:
+        """Remove key if present and evictable.
+
+        Returns:
+            True if removed.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not self._can_evict(entry[0]):
+            return False
+        del self._entries[key]
+        return True
+
+    def _evict(self, now: float, keep: Optional[str] = None) -> None:
+        """Drop idle entries and, while over max_size, least recently used ones.
+
+        Scans from the least recently used end and stops at the first entry
+        that is neither idle nor needed to get back under the size limit.
+        The just-inserted key (keep) is never evicted: the caller is about
+        to use its value, and a second caller must get the same one.
+        """
+        victims = []
+        size = len(self._entries)
+        for key, (value, last_used) in self._entries.items():
+            if key == keep:
+                break
+            over_size = size - len(victims) > self._max_size
+            idle = now - last_used > self._idle_ttl
+            if not over_size and not idle:
+                break
+            if self._can_evict(value):
+                victims.append(key)
+
+        for key in victims:
+            value, _ = self._entries.pop(key)
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+        if victims:
+            self._evictions += len(victims)
+            logger.debug(
+                f"Evicted {len(victims)} entries from {self.name}",
+                extra={"registry": self.name, "size": len(self._entries)},
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get registry metrics.
+
+        Returns:
+            Dict with size, limits, hits, misses, hit rate and evictions.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "idle_ttl_seconds": self._idle_ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+        }
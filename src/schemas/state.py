@@ -42,7 +42,11 @@ class AgentState(TypedDict):
     """
 
     # Conversation history (LangGraph manages with add_messages reducer)
+    # Only the last settings.message_window_size messages are kept inline;
+    # older ones live in the message_archive table
     messages: Annotated[list[BaseMessage], add_messages]
+    message_summary: Optional[str]  # Rolling summary of archived messages (prompt context)
+    archived_message_count: int  # Messages moved to the archive so far
 
     # Rich ticket draft with evidence tracking
     draft: Optional[TicketDraft]
@@ -53,6 +57,10 @@ class AgentState(TypedDict):
     # Loop protection (max_steps=10)
     step_count: int
 
+    # Extraction convergence: {"message_id": str, "patched": bool,
+    # "passes": int, "stop_reason": "ready"|"empty_draft"|"converged"|"max_steps"|None}
+    extraction_loop: Optional[dict[str, Any]]
+
     # Race detection
     state_version: int
     last_updated_at: Optional[str]
@@ -60,6 +68,15 @@ class AgentState(TypedDict):
     # Validation results (from validation node)
     validation_report: dict[str, Any]
 
+    # Fused turn mode: validation report produced by extraction's single call
+    # {"draft_fingerprint": str, "report": ValidationReport.model_dump()}
+    fused_validation: Optional[dict[str, Any]]
+
+    # Last validated draft, for incremental validation
+    # {"fingerprint": str, "field_hashes": {field: hash}, "persona": str,
+    #  "report_complete": bool, "validators_complete": bool}
+    validated_draft: Optional[dict[str, Any]]
+
     # Decision results (from decision node)
     decision_result: dict[str, Any]
 
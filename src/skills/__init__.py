@@ -20,6 +20,7 @@ from src.skills.ask_user import (
 
 from src.skills.answer_matcher import (
     match_answers,
+    build_match_result,
     AnswerMatch,
     MatchResult,
 )
@@ -51,6 +52,7 @@ __all__ = [
     "QuestionStatus",
     # answer_matcher skill
     "match_answers",
+    "build_match_result",
     "AnswerMatch",
     "MatchResult",
     # preview_ticket skill
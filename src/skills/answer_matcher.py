@@ -7,7 +7,8 @@ import logging
 from typing import Optional
 from pydantic import BaseModel, Field
 
-from src.llm import get_llm
+from src.llm import cache_if_parses, get_llm_for_task
+from src.llm.guardrails import PromptBudget
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +29,11 @@ class MatchResult(BaseModel):
     all_answered: bool = False
 
 
-MATCH_PROMPT = '''You are matching a user's response to questions that were asked.
+# Static instructions first (provider prompt-cache prefix), per-call data last
+MATCH_SYSTEM_PROMPT = '''You are matching a user's response to questions that were asked.
 
-Questions asked (numbered):
-{questions}
-
-User's response:
-{response}
-
-For each question, determine if the response contains an answer. Return a JSON object with:
+You will be given the questions asked (numbered) and the user's response. For each
+question, determine if the response contains an answer. Return a JSON object with:
 - "matches": list of matched answers, each with:
   - "question_index": 1-based question number
   - "answer": the extracted answer (brief, just the answer)
@@ -49,11 +46,90 @@ Rules:
 - Do not invent or assume answers
 - Confidence should be high (0.8+) only if the answer is explicit
 - For Yes/No questions, "yes", "sure", "okay" = "yes"; "no", "not", "nope" = "no"
-- If response says "I don't know" or similar, mark as unanswered
+- If response says "I don't know" or similar, mark as unanswered'''
+
+MATCH_PROMPT = '''Questions asked (numbered):
+{questions}
+
+User's response:
+{response}
 
 JSON response:'''
 
 
+def build_match_result(questions: list[str], parsed: dict) -> MatchResult:
+    """Build a MatchResult from the LLM's matches/unanswered JSON.
+
+    Shared by match_answers() and the fused turn call, which returns the
+    same structure as part of a larger response.
+
+    Args:
+        questions: List of questions that were asked
+        parsed: Dict with "matches" (question_index, answer, confidence,
+            source_text) and "unanswered" (1-based indices)
+
+    Returns:
+        MatchResult with matches and unanswered questions
+    """
+    matches = []
+    matched_indices = set()
+
+    for match_data in parsed.get("matches", []):
+        idx = match_data.get("question_index", 0)
+        if 1 <= idx <= len(questions):
+            matched_indices.add(idx)
+            matches.append(AnswerMatch(
+                question=questions[idx - 1],
+                question_index=idx,
+                answer=match_data.get("answer", ""),
+                confidence=float(match_data.get("confidence", 0.5)),
+                source_text=match_data.get("source_text", ""),
+            ))
+
+    # Determine unanswered questions
+    unanswered_indices = parsed.get("unanswered", [])
+    unanswered = [
+        questions[idx - 1]
+        for idx in unanswered_indices
+        if 1 <= idx <= len(questions)
+    ]
+
+    # Add any questions not mentioned at all
+    for i, q in enumerate(questions, 1):
+        if i not in matched_indices and q not in unanswered:
+            unanswered.append(q)
+
+    logger.info(
+        "Matched answers",
+        extra={
+            "total_questions": len(questions),
+            "matched": len(matches),
+            "unanswered": len(unanswered),
+        }
+    )
+
+    return MatchResult(
+        matches=matches,
+        unanswered_questions=unanswered,
+        all_answered=len(unanswered) == 0,
+    )
+
+
+def _parse_match_response(text: str) -> dict:
+    """Parse the matcher's JSON answer (optionally in a markdown code block).
+
+    Raises:
+        json.JSONDecodeError: If the answer is not valid JSON.
+    """
+    response_text = text.strip()
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+        response_text = response_text.strip()
+    return json.loads(response_text)
+
+
 async def match_answers(
     questions: list[str],
     user_response: str,
@@ -80,68 +156,20 @@ async def match_answers(
         f"{i}. {q}" for i, q in enumerate(questions, 1)
     )
 
+    budget = PromptBudget.for_task("answer_matching", MATCH_SYSTEM_PROMPT + MATCH_PROMPT)
     prompt = MATCH_PROMPT.format(
-        questions=numbered_questions,
-        response=user_response,
+        questions=budget.fit_text("questions", numbered_questions, share=0.3),
+        response=budget.fit_text("response", user_response),
     )
 
     try:
-        llm = get_llm()
-        result = await llm.chat(prompt)
-        response_text = result.strip()
-
-        # Parse JSON response
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-
-        parsed = json.loads(response_text)
-
-        # Build matches
-        matches = []
-        matched_indices = set()
-
-        for match_data in parsed.get("matches", []):
-            idx = match_data.get("question_index", 0)
-            if 1 <= idx <= len(questions):
-                matched_indices.add(idx)
-                matches.append(AnswerMatch(
-                    question=questions[idx - 1],
-                    question_index=idx,
-                    answer=match_data.get("answer", ""),
-                    confidence=float(match_data.get("confidence", 0.5)),
-                    source_text=match_data.get("source_text", ""),
-                ))
-
-        # Determine unanswered questions
-        unanswered_indices = parsed.get("unanswered", [])
-        unanswered = [
-            questions[idx - 1]
-            for idx in unanswered_indices
-            if 1 <= idx <= len(questions)
-        ]
-
-        # Add any questions not mentioned at all
-        for i, q in enumerate(questions, 1):
-            if i not in matched_indices and q not in unanswered:
-                unanswered.append(q)
-
-        logger.info(
-            "Matched answers",
-            extra={
-                "total_questions": len(questions),
-                "matched": len(matches),
-                "unanswered": len(unanswered),
-            }
-        )
-
-        return MatchResult(
-            matches=matches,
-            unanswered_questions=unanswered,
-            all_answered=len(unanswered) == 0,
+        llm = get_llm_for_task("answer_matching")
+        result = await llm.chat(
+            prompt,
+            system_message=MATCH_SYSTEM_PROMPT,
+            cache_if=cache_if_parses(_parse_match_response),  # Never replay a bad parse
         )
+        return build_match_result(questions, _parse_match_response(result))
 
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse match response: {e}")
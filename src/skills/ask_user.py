@@ -9,6 +9,8 @@ from typing import Optional
 from uuid import uuid4
 from pydantic import BaseModel, Field
 
+from src.slack.api import call_slack
+
 
 class QuestionStatus(str, Enum):
     """Status of a question set."""
@@ -193,8 +195,8 @@ async def ask_user(
             ]
         })
 
-    # Post message (WebClient is sync, not async)
-    result = slack_client.chat_postMessage(
+    # Post message (works with both WebClient and AsyncWebClient)
+    result = await call_slack(slack_client.chat_postMessage,
         channel=channel,
         thread_ts=thread_ts,
         blocks=blocks,
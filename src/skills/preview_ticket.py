@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field
 from slack_sdk.web.async_client import AsyncWebClient
 
 from src.schemas.draft import TicketDraft
+from src.slack.api import call_slack
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,7 @@ async def preview_ticket(
     )
 
     # Post preview
-    response = await client.chat_postMessage(
+    response = await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=thread_ts,
         text=f"Here's the ticket preview for: {draft.title or 'Untitled'}",
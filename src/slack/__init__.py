@@ -1,6 +1,22 @@
 """Slack integration module."""
 
-from src.slack.app import get_slack_app, start_socket_mode, stop_socket_mode
-from src.slack.router import register_handlers
+from src.slack.app import (
+    get_async_slack_app,
+    get_slack_app,
+    start_async_socket_mode,
+    start_socket_mode,
+    stop_async_socket_mode,
+    stop_socket_mode,
+)
+from src.slack.router import register_async_handlers, register_handlers
 
-__all__ = ["get_slack_app", "start_socket_mode", "stop_socket_mode", "register_handlers"]
+__all__ = [
+    "get_slack_app",
+    "start_socket_mode",
+    "stop_socket_mode",
+    "get_async_slack_app",
+    "start_async_socket_mode",
+    "stop_async_socket_mode",
+    "register_handlers",
+    "register_async_handlers",
+]
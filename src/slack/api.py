@@ -0,0 +1,32 @@
+"""Non-blocking Slack Web API calls for both sync and async Bolt modes.
+
+Handlers, skills and context helpers receive either a sync WebClient
+(sync Bolt app) or an AsyncWebClient (AsyncApp). call_slack() lets the
+same coroutine work with both without stalling the event loop that runs
+the graph and checkpointer:
+- AsyncWebClient methods are awaited directly
+- WebClient methods run in a worker thread
+
+Usage:
+    from src.slack.api import call_slack
+
+    await call_slack(client.chat_postMessage, channel=channel, text="Hi")
+"""
+import asyncio
+import inspect
+from typing import Any, Callable
+
+
+async def call_slack(method: Callable[..., Any], **kwargs: Any) -> Any:
+    """Call a Slack Web API client method without blocking the event loop.
+
+    Args:
+        method: Bound client method (e.g., client.chat_postMessage).
+        **kwargs: Arguments for the API method.
+
+    Returns:
+        SlackResponse (or AsyncSlackResponse) from the API call.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(**kwargs)
+    return await asyncio.to_thread(method, **kwargs)
@@ -1,8 +1,17 @@
-"""Slack Bolt application with Socket Mode."""
+"""Slack Bolt application with Socket Mode.
+
+Two modes, selected by settings.slack_async_mode:
+- Sync (default): App + SocketModeHandler. Listeners run in Bolt worker
+  threads and hand async work to the background event loop.
+- Async: AsyncApp + AsyncSocketModeHandler + AsyncWebClient, running on the
+  same event loop as the graph, connection pool and checkpointer.
+"""
 
 import logging
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_bolt.async_app import AsyncApp
 
 from src.config import get_settings
 
@@ -11,6 +20,9 @@ logger = logging.getLogger(__name__)
 _app: App | None = None
 _handler: SocketModeHandler | None = None
 
+_async_app: AsyncApp | None = None
+_async_handler: AsyncSocketModeHandler | None = None
+
 
 def get_slack_app() -> App:
     """Get or create the Slack Bolt app singleton."""
@@ -43,3 +55,36 @@ def stop_socket_mode():
         _handler.close()
         _handler = None
         logger.info("Socket Mode stopped")
+
+
+def get_async_slack_app() -> AsyncApp:
+    """Get or create the async Slack Bolt app singleton."""
+    global _async_app
+    if _async_app is None:
+        settings = get_settings()
+        _async_app = AsyncApp(
+            token=settings.slack_bot_token,
+            signing_secret=settings.slack_signing_secret,
+        )
+        logger.info("Async Slack app initialized")
+    return _async_app
+
+
+async def start_async_socket_mode():
+    """Start async Socket Mode handler (runs until stopped)."""
+    global _async_handler
+    settings = get_settings()
+    app = get_async_slack_app()
+
+    _async_handler = AsyncSocketModeHandler(app, settings.slack_app_token)
+    logger.info("Starting async Socket Mode...")
+    await _async_handler.start_async()
+
+
+async def stop_async_socket_mode():
+    """Stop async Socket Mode handler."""
+    global _async_handler
+    if _async_handler:
+        await _async_handler.close_async()
+        _async_handler = None
+        logger.info("Async Socket Mode stopped")
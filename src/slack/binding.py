@@ -5,6 +5,7 @@ from typing import Optional
 
 from slack_sdk.web import WebClient
 
+from src.slack.api import call_slack
 from src.slack.blocks import build_session_card, build_epic_selector
 from src.slack.session import SessionIdentity
 from src.db.session_store import SessionStore
@@ -62,7 +63,7 @@ async def start_binding_flow(
             session_status="Active",
             thread_ts=identity.thread_ts,
         )
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=identity.channel_id,
             thread_ts=identity.thread_ts,
             text="Session active",
@@ -79,7 +80,7 @@ async def start_binding_flow(
         message_preview=message_text,
     )
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=identity.channel_id,
         thread_ts=identity.thread_ts,
         text="Which Epic does this relate to?",
@@ -150,7 +151,7 @@ async def bind_epic(
         thread_ts=identity.thread_ts,
     )
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=identity.channel_id,
         thread_ts=identity.thread_ts,
         text=f"Session linked to {epic_key}",
@@ -10,6 +10,7 @@ from slack_sdk.web import WebClient
 
 from src.knowledge.store import KnowledgeStore
 from src.knowledge.models import Constraint, ConstraintStatus
+from src.slack.api import call_slack
 from src.slack.session import SessionIdentity
 
 logger = logging.getLogger(__name__)
@@ -184,7 +185,7 @@ async def maybe_alert_contradiction(
         source_thread_ts=identity.thread_ts,
     )
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=identity.channel_id,
         thread_ts=identity.thread_ts,
         text=f"Contradiction detected: {subject}",
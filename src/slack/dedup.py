@@ -1,22 +1,142 @@
-"""Event deduplication to handle Socket Mode retries and button clicks."""
+"""Event deduplication to handle Socket Mode retries and button clicks.
+
+Each dedup store keeps keys in insertion order. With a fixed TTL that is
+also expiry order, so expired keys are popped from the front in amortised
+O(1) instead of scanning every entry on every call. A hard entry cap
+bounds memory under bursts (oldest keys go first).
+
+check_and_set() is atomic, so two concurrent retries cannot both pass.
+With settings.dedup_postgres, claims also go through an UNLOGGED
+Postgres table so dedup holds across bot replicas.
+"""
 
 import logging
+import threading
 import time
-from typing import Optional
-
-logger = logging.getLogger(__name__)
+from collections import OrderedDict
+from typing import Any, Optional
 
-# In-memory dedupe store with TTL
-# Format: {event_key: timestamp}
-_processed_events: dict[str, float] = {}
+from src.config import get_settings
 
-# Button click dedupe store (separate from events)
-# Format: {button_key: timestamp}
-_processed_buttons: dict[str, float] = {}
+logger = logging.getLogger(__name__)
 
 # TTL for processed events (5 minutes)
 DEDUP_TTL_SECONDS = 300
 
+# Shared-tier cleanup runs once per this many claims
+POSTGRES_CLEANUP_EVERY = 500
+
+
+class DedupStore:
+    """In-memory dedup keys with TTL, FIFO expiry and a hard size cap.
+
+    Thread-safe: used from Bolt listener threads and the event loop.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int) -> None:
+        """Initialize store.
+
+        Args:
+            name: Label for logs and stats.
+            ttl_seconds: How long a key counts as processed.
+            max_entries: Hard cap; oldest keys are dropped beyond it.
+        """
+        self.name = name
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+        # key -> expires_at (monotonic), oldest first
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+        # Metrics
+        self._duplicates = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def _expire(self, now: float) -> None:
+        """Pop expired keys from the front (caller holds the lock)."""
+        while self._entries:
+            key, expires_at = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+            self._expired += 1
+
+    def _set(self, key: str, now: float) -> None:
+        """Insert key at the back and enforce the cap (caller holds the lock)."""
+        self._entries[key] = now + self._ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evicted += 1
+
+    def contains(self, key: str) -> bool:
+        """True if key was processed within the TTL."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return key in self._entries
+
+    def add(self, key: str) -> None:
+        """Mark key as processed."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._set(key, now)
+
+    def check_and_set(self, key: str) -> bool:
+        """Atomically mark key as processed.
+
+        Returns:
+            True if key is new (caller should process), False if duplicate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if key in self._entries:
+                self._duplicates += 1
+                return False
+            self._set(key, now)
+            return True
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store metrics (size, cap, duplicates, expired, evicted)."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "duplicates": self._duplicates,
+            "expired": self._expired,
+            "evicted": self._evicted,
+        }
+
+
+# Event and button click stores (created on first use, sized from settings)
+_processed_events: Optional[DedupStore] = None
+_processed_buttons: Optional[DedupStore] = None
+_stores_lock = threading.Lock()
+
+# Claims since the last shared-tier cleanup
+_postgres_claims = 0
+
+
+def _get_stores() -> tuple[DedupStore, DedupStore]:
+    """Get or create the event and button dedup stores."""
+    global _processed_events, _processed_buttons
+    with _stores_lock:
+        if _processed_events is None:
+            max_entries = get_settings().dedup_max_entries
+            _processed_events = DedupStore("events", DEDUP_TTL_SECONDS, max_entries)
+            _processed_buttons = DedupStore("buttons", DEDUP_TTL_SECONDS, max_entries)
+    return _processed_events, _processed_buttons
+
 
 def _get_event_key(event: dict) -> Optional[str]:
     """Extract unique key from event for deduplication.
@@ -40,6 +160,42 @@ def _get_event_key(event: dict) -> Optional[str]:
     return None
 
 
+def _get_button_key(action_id: str, user_id: str, button_value: str) -> str:
+    """Build dedup key for a button click."""
+    return f"btn:{action_id}:{user_id}:{button_value}"
+
+
+async def _claim_shared(key: str) -> bool:
+    """Claim key in the shared Postgres tier (if enabled).
+
+    Fails open: if the database is unavailable, local dedup still applies.
+
+    Returns:
+        True if new across replicas, False if another replica claimed it.
+    """
+    global _postgres_claims
+    if not get_settings().dedup_postgres:
+        return True
+
+    from src.db.connection import get_connection
+    from src.db.dedup_store import SlackDedupStore
+
+    try:
+        async with get_connection() as conn:
+            store = SlackDedupStore(conn)
+            claimed = await store.claim(key, DEDUP_TTL_SECONDS)
+
+            _postgres_claims += 1
+            if _postgres_claims >= POSTGRES_CLEANUP_EVERY:
+                _postgres_claims = 0
+                await store.delete_expired()
+
+            return claimed
+    except Exception as e:
+        logger.warning(f"Shared dedup unavailable, using local only: {e}")
+        return True
+
+
 def is_duplicate(event: dict) -> bool:
     """Check if event was already processed.
 
@@ -50,14 +206,8 @@ def is_duplicate(event: dict) -> bool:
         # Can't dedupe without key, assume not duplicate
         return False
 
-    now = time.time()
-
-    # Clean expired entries (lazy cleanup)
-    expired = [k for k, t in _processed_events.items() if now - t > DEDUP_TTL_SECONDS]
-    for k in expired:
-        del _processed_events[k]
-
-    if key in _processed_events:
+    events, _ = _get_stores()
+    if events.contains(key):
         logger.debug(f"Duplicate event detected: {key}")
         return True
 
@@ -71,14 +221,42 @@ def mark_processed(event: dict) -> None:
     """
     key = _get_event_key(event)
     if key:
-        _processed_events[key] = time.time()
+        events, _ = _get_stores()
+        events.add(key)
         logger.debug(f"Marked event processed: {key}")
 
 
+async def try_process_event(event: dict) -> bool:
+    """Atomic check-and-mark for events.
+
+    First call wins - subsequent calls (retries, other replicas) return False.
+
+    Returns:
+        True if this is the first delivery (should process)
+        False if duplicate (should skip)
+    """
+    key = _get_event_key(event)
+    if not key:
+        return True
+
+    events, _ = _get_stores()
+    if not events.check_and_set(key) or not await _claim_shared(key):
+        logger.debug(f"Duplicate event detected: {key}")
+        return False
+    return True
+
+
 def clear_dedup_store() -> None:
     """Clear all entries (for testing)."""
-    _processed_events.clear()
-    _processed_buttons.clear()
+    events, buttons = _get_stores()
+    events.clear()
+    buttons.clear()
+
+
+def get_dedup_stats() -> dict[str, Any]:
+    """Get dedup store metrics for events and buttons."""
+    events, buttons = _get_stores()
+    return {"events": events.get_stats(), "buttons": buttons.get_stats()}
 
 
 # --- Button Click Deduplication ---
@@ -97,16 +275,10 @@ def is_button_duplicate(action_id: str, user_id: str, button_value: str) -> bool
     Returns:
         True if duplicate (should skip), False if new
     """
-    key = f"btn:{action_id}:{user_id}:{button_value}"
-
-    now = time.time()
-
-    # Clean expired entries (lazy cleanup)
-    expired = [k for k, t in _processed_buttons.items() if now - t > DEDUP_TTL_SECONDS]
-    for k in expired:
-        del _processed_buttons[k]
+    key = _get_button_key(action_id, user_id, button_value)
 
-    if key in _processed_buttons:
+    _, buttons = _get_stores()
+    if buttons.contains(key):
         logger.debug(f"Duplicate button click: {key}")
         return True
 
@@ -118,16 +290,18 @@ def mark_button_processed(action_id: str, user_id: str, button_value: str) -> No
 
     Call after successfully processing button click.
     """
-    key = f"btn:{action_id}:{user_id}:{button_value}"
-    _processed_buttons[key] = time.time()
+    key = _get_button_key(action_id, user_id, button_value)
+    _, buttons = _get_stores()
+    buttons.add(key)
     logger.debug(f"Marked button processed: {key}")
 
 
-def try_process_button(action_id: str, user_id: str, button_value: str) -> bool:
+async def try_process_button(action_id: str, user_id: str, button_value: str) -> bool:
     """Atomic check-and-mark for button clicks.
 
     Combines duplicate check and marking into one operation.
-    First call wins - subsequent calls return False.
+    First call wins - subsequent calls (and other replicas, with the
+    shared tier enabled) return False.
 
     Args:
         action_id: Button action ID
@@ -138,8 +312,10 @@ def try_process_button(action_id: str, user_id: str, button_value: str) -> bool:
         True if this is the first click (should process)
         False if duplicate (should skip)
     """
-    if is_button_duplicate(action_id, user_id, button_value):
-        return False
+    key = _get_button_key(action_id, user_id, button_value)
 
-    mark_button_processed(action_id, user_id, button_value)
+    _, buttons = _get_stores()
+    if not buttons.check_and_set(key) or not await _claim_shared(key):
+        logger.debug(f"Duplicate button click: {key}")
+        return False
     return True
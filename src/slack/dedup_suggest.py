@@ -8,6 +8,7 @@ from typing import Optional
 from slack_sdk.web import WebClient
 
 from src.memory.zep_client import search_similar_threads
+from src.slack.api import call_slack
 from src.slack.session import SessionIdentity
 
 logger = logging.getLogger(__name__)
@@ -188,7 +189,7 @@ async def maybe_suggest_dedup(
         current_summary=message_text[:200],
     )
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=identity.channel_id,
         thread_ts=identity.thread_ts,
         text="Similar discussion found",
@@ -1,50 +1,159 @@
 """Slack event handlers with fast-ack pattern."""
 
 import asyncio
+import inspect
 import logging
-import threading
 from slack_bolt import Ack, BoltContext
 from slack_bolt.kwargs_injection.args import Args
 from slack_sdk.web import WebClient
 
+from src.slack.api import call_slack
+from src.slack.dedup import try_process_event
+from src.slack.scheduler import WorkPriority, get_background_loop, get_scheduler
 from src.slack.session import SessionIdentity
 from src.graph.runner import get_runner
 
 logger = logging.getLogger(__name__)
 
-# Persistent background event loop for all async operations
-# This ensures all async code (including the checkpointer) uses the same event loop
-_background_loop: asyncio.AbstractEventLoop | None = None
-_loop_thread: threading.Thread | None = None
+# Sent (ephemerally) when the work scheduler sheds load
+BUSY_MESSAGE = "I'm handling a lot of requests right now. Please try again in a minute."
 
+# Pending busy notices (async mode): the loop only keeps weak references to tasks
+_notify_tasks: set[asyncio.Task] = set()
 
-def _get_background_loop() -> asyncio.AbstractEventLoop:
-    """Get or create the persistent background event loop."""
-    global _background_loop, _loop_thread
 
-    if _background_loop is None or not _background_loop.is_running():
-        _background_loop = asyncio.new_event_loop()
+def _on_notify_done(task: asyncio.Task) -> None:
+    """Forget a finished busy notice and log its failure, if any."""
+    _notify_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Failed to send busy notice: {task.exception()}")
 
-        def run_loop():
-            asyncio.set_event_loop(_background_loop)
-            _background_loop.run_forever()
 
-        _loop_thread = threading.Thread(target=run_loop, daemon=True, name="async_event_loop")
-        _loop_thread.start()
-        logger.info("Started persistent background event loop")
+def _busy_notifier(
+    client: WebClient,
+    channel: str | None,
+    user: str | None,
+    thread_ts: str | None = None,
+):
+    """Build a callback that tells the user their request was shed.
 
-    return _background_loop
+    Returns None if there is nowhere to post (e.g., modal submissions).
+    """
+    if not channel or not user:
+        return None
+
+    def notify() -> None:
+        kwargs = {"channel": channel, "user": user, "text": BUSY_MESSAGE}
+        if thread_ts:
+            kwargs["thread_ts"] = thread_ts
+        result = client.chat_postEphemeral(**kwargs)
+        if inspect.isawaitable(result):
+            # AsyncWebClient (async Bolt mode): we are already on the loop
+            task = asyncio.ensure_future(result)
+            _notify_tasks.add(task)
+            task.add_done_callback(_on_notify_done)
+
+    return notify
+
+
+def _submit(
+    coro,
+    *,
+    team_id: str,
+    priority: WorkPriority,
+    name: str,
+    on_rejected=None,
+) -> bool:
+    """Run an async coroutine from a sync context.
 
+    Submits the coroutine to the bounded work scheduler, which runs it on the
+    persistent background event loop. This ensures all async code uses the same
+    event loop, which is required for the AsyncPostgresSaver checkpointer and the
+    connection pool to work correctly.
 
-def _run_async(coro):
-    """Run an async coroutine from a sync context.
+    Returns:
+        True if accepted, False if shed because the scheduler is full.
+    """
+    return get_scheduler().submit(
+        coro,
+        team_id=team_id,
+        priority=priority,
+        name=name,
+        on_rejected=on_rejected,
+    )
+
+
+def _noop_ack(*args, **kwargs) -> None:
+    """Stand-in ack for handlers whose ack was already sent by the wrapper."""
+
+
+def _submit_action(handler, params, body: dict, client, context, action=None, view=None) -> None:
+    """Submit an already-acked action/view handler at ACTION priority."""
+    kwargs = {"body": body, "client": client}
+    if "ack" in params:
+        kwargs["ack"] = _noop_ack
+    if "action" in params:
+        kwargs["action"] = action
+    if "view" in params:
+        kwargs["view"] = view
+
+    message = body.get("message") or {}
+    _submit(
+        handler(**kwargs),
+        team_id=context.get("team_id", ""),
+        priority=WorkPriority.ACTION,
+        name=handler.__name__,
+        on_rejected=_busy_notifier(
+            client,
+            (body.get("channel") or {}).get("id"),
+            (body.get("user") or {}).get("id"),
+            message.get("thread_ts") or message.get("ts"),
+        ),
+    )
+
+
+def scheduled_action(handler):
+    """Wrap an async action/view handler for the sync Bolt app.
 
-    Submits the coroutine to the persistent background event loop.
-    This ensures all async code uses the same event loop, which is required
-    for the AsyncPostgresSaver checkpointer locks to work correctly.
+    Acks in the Bolt thread, then runs the handler on the work scheduler at
+    ACTION priority so button clicks are served before queued mentions.
+    The handler receives a no-op ack plus whichever of body/client/action/view
+    it declares.
     """
-    loop = _get_background_loop()
-    asyncio.run_coroutine_threadsafe(coro, loop)
+    params = inspect.signature(handler).parameters
+
+    def wrapper(
+        ack: Ack,
+        body: dict,
+        client: WebClient,
+        context: BoltContext,
+        action=None,
+        view=None,
+    ):
+        ack()
+        _submit_action(handler, params, body, client, context, action, view)
+
+    # Not functools.wraps: Bolt injects kwargs from the wrapper's own signature
+    wrapper.__name__ = handler.__name__
+    wrapper.__doc__ = handler.__doc__
+    return wrapper
+
+
+def async_scheduled_action(handler):
+    """Wrap an async action/view handler for the AsyncApp.
+
+    Same contract as scheduled_action(): ack first, then hand the handler to
+    the work scheduler, which runs on the same event loop as the AsyncApp.
+    """
+    params = inspect.signature(handler).parameters
+
+    async def wrapper(ack, body: dict, client, context, action=None, view=None):
+        await ack()
+        _submit_action(handler, params, body, client, context, action, view)
+
+    wrapper.__name__ = handler.__name__
+    wrapper.__doc__ = handler.__doc__
+    return wrapper
 
 
 def handle_app_mention(event: dict, say, client: WebClient, context: BoltContext):
@@ -76,10 +185,26 @@ def handle_app_mention(event: dict, say, client: WebClient, context: BoltContext
     )
 
     # Run async processing in background
-    _run_async(_process_mention(identity, text, user, client, thread_ts, channel))
+    _submit(
+        _process_mention(event, identity, text, user, client, thread_ts, channel),
+        team_id=team_id,
+        priority=WorkPriority.MESSAGE,
+        name="app_mention",
+        on_rejected=_busy_notifier(client, channel, user, thread_ts),
+    )
+
+
+async def handle_app_mention_async(event: dict, say, client, context):
+    """Handle @mention events in async Bolt mode.
+
+    Submitting to the work scheduler never blocks, so the sync handler can
+    run directly on the event loop.
+    """
+    handle_app_mention(event, say, client, context)
 
 
 async def _process_mention(
+    event: dict,
     identity: SessionIdentity,
     text: str,
     user: str,
@@ -88,20 +213,29 @@ async def _process_mention(
     channel: str,
 ):
     """Async processing for @mention - runs graph and dispatches to skills."""
+    # Slack retries and other replicas: first delivery wins. A mention in an
+    # active thread also arrives as a message event with the same key, so
+    # only one of the two handlers runs the turn.
+    if not await try_process_event(event):
+        logger.info("Skipping duplicate mention event", extra={"thread_ts": thread_ts})
+        return
+
     try:
         runner = get_runner(identity)
 
-        # Check for persona switch before running graph (Phase 9)
-        await _check_persona_switch(runner, text, client, channel, thread_ts)
+        # One state load and one write for the whole turn
+        async with runner.turn() as turn:
+            # Check for persona switch before running graph (Phase 9)
+            await _check_persona_switch(turn, text, client, channel, thread_ts)
 
-        result = await runner.run_with_message(text, user)
+            result = await turn.run_with_message(text, user)
 
-        # Use dispatcher for skill execution
-        await _dispatch_result(result, identity, client, runner)
+            # Use dispatcher for skill execution
+            await _dispatch_result(result, identity, client, turn)
 
     except Exception as e:
         logger.error(f"Error processing mention: {e}", exc_info=True)
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Sorry, something went wrong. Please try again.",
@@ -109,7 +243,7 @@ async def _process_mention(
 
 
 async def _check_persona_switch(
-    runner,
+    turn,
     message_text: str,
     client: WebClient,
     channel: str,
@@ -117,13 +251,14 @@ async def _check_persona_switch(
 ) -> None:
     """Check for and apply persona switch based on message content.
 
+    The switch is staged on the turn session and saved with the graph run.
     Notifies user when persona switches due to topic detection.
     """
     try:
         from src.personas.switcher import PersonaSwitcher
         from src.personas.types import PersonaName, PersonaReason
 
-        state = await runner._get_current_state()
+        state = turn.state
         current_persona = PersonaName(state.get("persona", "pm"))
         is_locked = state.get("persona_lock", False)
 
@@ -136,9 +271,8 @@ async def _check_persona_switch(
 
         if switch_result.switched:
             state_update = switcher.apply_switch(state, switch_result)
-            # Update runner state
-            new_state = {**state, **state_update}
-            await runner._update_state(new_state)
+            # Stage on the turn (written with the graph run)
+            turn.update(**state_update)
 
             # Notify user of switch (only if detected, not explicit)
             if switch_result.reason == PersonaReason.DETECTED:
@@ -148,7 +282,7 @@ async def _check_persona_switch(
                     message_count=0,
                 )
                 if indicator:
-                    client.chat_postMessage(
+                    await call_slack(client.chat_postMessage,
                         channel=channel,
                         thread_ts=thread_ts,
                         text=f"{indicator} {switch_result.message}",
@@ -162,7 +296,7 @@ async def _dispatch_result(
     result: dict,
     identity: SessionIdentity,
     client: WebClient,
-    runner,
+    turn,
 ):
     """Dispatch graph result to appropriate skill via dispatcher.
 
@@ -178,7 +312,7 @@ async def _dispatch_result(
 
     if action == "intro" or action == "nudge":
         # Empty draft - send intro or nudge message
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=identity.channel_id,
             thread_ts=identity.thread_ts,
             text=result.get("message", "Tell me what you'd like to work on."),
@@ -197,9 +331,9 @@ async def _dispatch_result(
         dispatcher = SkillDispatcher(client, identity)
         skill_result = await dispatcher.dispatch(decision, result.get("draft"))
 
-        # Store pending questions in runner state
+        # Stage pending questions (written when the turn ends)
         if skill_result.get("success") and skill_result.get("pending_questions"):
-            await runner.store_pending_questions(skill_result["pending_questions"])
+            turn.set_pending_questions(skill_result["pending_questions"])
 
     elif action == "preview":
         draft = result.get("draft")
@@ -214,14 +348,14 @@ async def _dispatch_result(
 
     elif action == "ready":
         # Approved - notify user
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=identity.channel_id,
             thread_ts=identity.thread_ts,
             text="Ticket approved and ready to create in Jira!",
         )
 
     elif action == "error":
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=identity.channel_id,
             thread_ts=identity.thread_ts,
             text=f"Sorry, I encountered an error: {result.get('error', 'Unknown error')}",
@@ -229,15 +363,19 @@ async def _dispatch_result(
 
     else:
         # Continue - acknowledge receipt
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=identity.channel_id,
             thread_ts=identity.thread_ts,
             text="Got it! I'm collecting the requirements.",
         )
 
 
-def handle_message(event: dict, say, client: WebClient, context: BoltContext):
-    """Handle message events in threads where bot is already participating.
+# Max wait (sync Bolt mode) for the active-thread check of a thread message
+ACTIVE_CHECK_TIMEOUT_SECONDS = 5.0
+
+
+def _thread_message_identity(event: dict, context) -> SessionIdentity | None:
+    """Session identity of a thread reply the bot may answer, else None.
 
     Only processes:
     - Messages in threads (has thread_ts)
@@ -246,47 +384,95 @@ def handle_message(event: dict, say, client: WebClient, context: BoltContext):
     """
     # Skip non-thread messages (channel root)
     if "thread_ts" not in event:
-        return
+        return None
 
     # Skip bot messages
     if event.get("bot_id") or event.get("subtype") == "bot_message":
-        return
+        return None
 
     # Skip message edits/deletes
     subtype = event.get("subtype")
     if subtype in ("message_changed", "message_deleted"):
-        return
-
-    channel = event.get("channel")
-    thread_ts = event["thread_ts"]
-    user = event.get("user")
-    text = event.get("text", "")
+        return None
 
     logger.info(
         "Thread message received",
         extra={
-            "channel": channel,
-            "thread_ts": thread_ts,
-            "user": user,
+            "channel": event.get("channel"),
+            "thread_ts": event["thread_ts"],
+            "user": event.get("user"),
         }
     )
 
-    # Create session identity
-    team_id = context.get("team_id", "")
-    identity = SessionIdentity(
-        team_id=team_id,
-        channel_id=channel,
-        thread_ts=thread_ts,
+    return SessionIdentity(
+        team_id=context.get("team_id", ""),
+        channel_id=event.get("channel"),
+        thread_ts=event["thread_ts"],
+    )
+
+
+def _is_active_thread(identity: SessionIdentity) -> bool:
+    """Whether the bot is active in the thread (from a sync listener thread).
+
+    A live runner answers in-thread; otherwise the cached checkpoint check
+    runs on the background loop.
+    """
+    from src.graph.runner import has_runner, is_active_session
+    if has_runner(identity.session_id):
+        return True
+
+    future = asyncio.run_coroutine_threadsafe(is_active_session(identity), get_background_loop())
+    try:
+        return future.result(timeout=ACTIVE_CHECK_TIMEOUT_SECONDS)
+    except Exception as e:
+        future.cancel()
+        logger.warning(
+            f"Active thread check failed: {e!r}",
+            extra={"session_id": identity.session_id},
+        )
+        return False
+
+
+def _submit_thread_message(event: dict, identity: SessionIdentity, client) -> None:
+    """Admit a reply in an active thread to the work scheduler."""
+    channel = event.get("channel")
+    thread_ts = event["thread_ts"]
+    user = event.get("user")
+    _submit(
+        _process_thread_message(
+            event, identity, event.get("text", ""), user, client, thread_ts, channel
+        ),
+        team_id=identity.team_id,
+        priority=WorkPriority.MESSAGE,
+        name="thread_message",
+        on_rejected=_busy_notifier(client, channel, user, thread_ts),
     )
 
-    # Check if we have an active session for this thread
-    from src.graph.runner import _runners
-    if identity.session_id in _runners:
-        # Active session - process message
-        _run_async(_process_thread_message(identity, text, user, client, thread_ts, channel))
+
+def handle_message(event: dict, say, client: WebClient, context: BoltContext):
+    """Handle message events in threads where bot is already participating.
+
+    Replies in other threads are dropped before they reach the work
+    scheduler, so unrelated thread chatter never takes queue slots.
+    """
+    identity = _thread_message_identity(event, context)
+    if identity is None or not _is_active_thread(identity):
+        return
+    _submit_thread_message(event, identity, client)
+
+
+async def handle_message_async(event: dict, say, client, context):
+    """Handle thread message events in async Bolt mode."""
+    identity = _thread_message_identity(event, context)
+    if identity is None:
+        return
+    from src.graph.runner import is_active_session
+    if await is_active_session(identity):
+        _submit_thread_message(event, identity, client)
 
 
 async def _process_thread_message(
+    event: dict,
     identity: SessionIdentity,
     text: str,
     user: str,
@@ -295,28 +481,30 @@ async def _process_thread_message(
     channel: str,
 ):
     """Async processing for thread message - continues graph and dispatches to skills."""
+    # Slack retries, other replicas and the matching app_mention event
+    if not await try_process_event(event):
+        logger.info("Skipping duplicate message event", extra={"thread_ts": thread_ts})
+        return
+
     try:
         runner = get_runner(identity)
 
-        # Check for persona switch before running graph (Phase 9)
-        await _check_persona_switch(runner, text, client, channel, thread_ts)
+        # One state load and one write for the whole turn
+        async with runner.turn() as turn:
+            # Check for persona switch before running graph (Phase 9)
+            await _check_persona_switch(turn, text, client, channel, thread_ts)
 
-        result = await runner.run_with_message(text, user)
+            result = await turn.run_with_message(text, user)
 
-        # Use dispatcher for skill execution (same as _process_mention)
-        await _dispatch_result(result, identity, client, runner)
+            # Use dispatcher for skill execution (same as _process_mention)
+            await _dispatch_result(result, identity, client, turn)
 
     except Exception as e:
         logger.error(f"Error processing thread message: {e}", exc_info=True)
 
 
-def handle_help_command(ack: Ack, command: dict, say, client: WebClient):
-    """Handle /help slash command - show all available commands."""
-    ack()
-
-    channel = command.get("channel_id")
-
-    help_text = """*MARO - Requirements Assistant*
+# /help reply text
+HELP_TEXT = """*MARO - Requirements Assistant*
 
 I help turn ideas, bugs, and features into Jira tickets.
 
@@ -339,19 +527,27 @@ I help turn ideas, bugs, and features into Jira tickets.
 • Include acceptance criteria when you can
 • I'll ask clarifying questions if needed"""
 
-    say(text=help_text, channel=channel)
 
+def handle_help_command(ack: Ack, command: dict, say, client: WebClient):
+    """Handle /help slash command - show all available commands."""
+    ack()
+    say(text=HELP_TEXT, channel=command.get("channel_id"))
 
-def handle_jira_command(ack: Ack, command: dict, say, client: WebClient):
-    """Handle /jira slash command with subcommands.
+
+async def handle_help_command_async(ack, command: dict, say):
+    """Handle /help slash command in async Bolt mode."""
+    await ack()
+    await say(text=HELP_TEXT, channel=command.get("channel_id"))
+
+
+def _jira_command_reply(command: dict) -> str:
+    """Build the reply for a /jira slash command.
 
     Subcommands:
     - /jira create [type] - Start new ticket session
     - /jira search <query> - Search existing tickets
     - /jira status - Show current session status
     """
-    ack()  # Ack immediately
-
     channel = command.get("channel_id")
     user = command.get("user_id")
     text = command.get("text", "").strip()
@@ -373,37 +569,52 @@ def handle_jira_command(ack: Ack, command: dict, say, client: WebClient):
 
     if subcommand == "create":
         ticket_type = args.capitalize() if args else None
-        say(
-            text=f"Starting new ticket session{' for ' + ticket_type if ticket_type else ''}...",
-            channel=channel,
-        )
         # TODO: Route to session creation in 04-04
+        return f"Starting new ticket session{' for ' + ticket_type if ticket_type else ''}..."
 
     elif subcommand == "search":
         if not args:
-            say(text="Usage: /jira search <query>", channel=channel)
-            return
-        say(text=f"Searching for: {args}...", channel=channel)
+            return "Usage: /jira search <query>"
         # TODO: Implement Jira search in Phase 7
+        return f"Searching for: {args}..."
 
     elif subcommand == "status":
-        say(text="No active session in this channel.", channel=channel)
         # TODO: Query session status in 04-04
+        return "No active session in this channel."
 
-    else:
-        say(
-            text="Available commands:\n• `/jira create [type]` - Start new ticket\n• `/jira search <query>` - Search tickets\n• `/jira status` - Session status",
-            channel=channel,
-        )
+    return (
+        "Available commands:\n"
+        "• `/jira create [type]` - Start new ticket\n"
+        "• `/jira search <query>` - Search tickets\n"
+        "• `/jira status` - Session status"
+    )
+
+
+def handle_jira_command(ack: Ack, command: dict, say, client: WebClient):
+    """Handle /jira slash command with subcommands (see _jira_command_reply)."""
+    ack()  # Ack immediately
+    say(text=_jira_command_reply(command), channel=command.get("channel_id"))
+
+
+async def handle_jira_command_async(ack, command: dict, say):
+    """Handle /jira slash command in async Bolt mode."""
+    await ack()
+    await say(text=_jira_command_reply(command), channel=command.get("channel_id"))
 
 
 def handle_persona_command(ack: Ack, command: dict, say, client: WebClient):
     """Handle /persona slash command (sync wrapper).
 
-    Delegates to async implementation via _run_async().
+    Delegates to async implementation via the work scheduler.
     """
     ack()  # Ack immediately
-    _run_async(_handle_persona_command_async(command, say, client))
+    _submit(
+        _handle_persona_command_async(command, say, client),
+        team_id=command.get("team_id", ""),
+        priority=WorkPriority.COMMAND,
+        name="persona_command",
+        on_rejected=_busy_notifier(client, command.get("channel_id"), command.get("user_id")),
+    )
 
 
 async def _handle_persona_command_async(command: dict, say, client: WebClient):
@@ -449,9 +660,9 @@ async def _handle_persona_command_async(command: dict, say, client: WebClient):
                 channel_id=channel,
                 thread_ts=thread_ts,
             )
-            # Check if runner exists for this session
-            from src.graph.runner import _runners
-            if identity.session_id in _runners:
+            # Check if the bot is active in this thread
+            from src.graph.runner import is_active_session
+            if await is_active_session(identity):
                 runner = get_runner(identity)
                 current_state = await runner._get_current_state()
                 state = {
@@ -474,9 +685,9 @@ async def _handle_persona_command_async(command: dict, say, client: WebClient):
     if thread_ts:
         response_kwargs["thread_ts"] = thread_ts
 
-    client.chat_postMessage(**response_kwargs)
+    await call_slack(client.chat_postMessage, **response_kwargs)
 
-    # Update session if state changed and we have a runner
+    # Update session if state changed and the bot is active in the thread
     if result.state_update and thread_ts:
         try:
             identity = SessionIdentity(
@@ -484,12 +695,11 @@ async def _handle_persona_command_async(command: dict, say, client: WebClient):
                 channel_id=channel,
                 thread_ts=thread_ts,
             )
-            from src.graph.runner import _runners
-            if identity.session_id in _runners:
+            from src.graph.runner import is_active_session
+            if await is_active_session(identity):
                 runner = get_runner(identity)
-                current_state = await runner._get_current_state()
-                new_state = {**current_state, **result.state_update}
-                await runner._update_state(new_state)
+                async with runner.turn() as turn:
+                    turn.update(**result.state_update)
                 logger.info(
                     "Persona state updated",
                     extra={
@@ -532,7 +742,7 @@ async def handle_epic_selection(ack, body, client: WebClient, action):
     if epic_key == "new":
         # User wants to create new Epic
         # For now, create a placeholder - full creation in Phase 7
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Creating new Epic... (This will create a Jira Epic in Phase 7)",
@@ -556,8 +766,20 @@ def handle_epic_selection_sync(ack, body, client: WebClient, action):
     """
     ack()
 
-    # Run the async handler in background thread with its own event loop
-    _run_async(_handle_epic_selection_async(body, client, action))
+    # Run the async handler on the work scheduler (button click priority)
+    message = body.get("message") or {}
+    _submit(
+        _handle_epic_selection_async(body, client, action),
+        team_id=(body.get("team") or {}).get("id", ""),
+        priority=WorkPriority.ACTION,
+        name="epic_selection",
+        on_rejected=_busy_notifier(
+            client,
+            (body.get("channel") or {}).get("id"),
+            (body.get("user") or {}).get("id"),
+            message.get("thread_ts") or message.get("ts"),
+        ),
+    )
 
 
 async def _handle_epic_selection_async(body, client: WebClient, action):
@@ -585,7 +807,7 @@ async def _handle_epic_selection_async(body, client: WebClient, action):
     if epic_key == "new":
         # User wants to create new Epic
         # For now, create a placeholder - full creation in Phase 7
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Creating new Epic... (This will create a Jira Epic in Phase 7)",
@@ -622,7 +844,7 @@ async def handle_merge_context(ack, body, client, action):
     )
 
     # Acknowledge the merge
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=thread_ts,
         text=f"Context linked from related thread. I'll consider both discussions when gathering requirements.",
@@ -643,7 +865,7 @@ async def handle_ignore_dedup(ack, body, client):
     # Delete the suggestion message
     message_ts = body["message"]["ts"]
     try:
-        client.chat_delete(channel=channel, ts=message_ts)
+        await call_slack(client.chat_delete, channel=channel, ts=message_ts)
     except Exception:
         pass  # May not have permission to delete
 
@@ -669,7 +891,7 @@ async def handle_contradiction_conflict(ack, body, client, action):
     # TODO: Update constraint status to 'conflicted' in KG
     # TODO: Add to Epic summary as unresolved conflict
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=message_thread,
         text=f"Marked `{subject}` as having conflicting requirements. This needs team alignment.",
@@ -695,7 +917,7 @@ async def handle_contradiction_override(ack, body, client, action):
     # TODO: Mark old constraint as 'deprecated'
     # TODO: Mark new constraint as 'accepted'
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=message_thread,
         text=f"Updated `{subject}` to `{proposed_value}`. Previous value deprecated.",
@@ -720,7 +942,7 @@ async def handle_contradiction_both(ack, body, client, action):
 
     # TODO: Mark both as 'accepted' with note about intentional dual values
 
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=message_thread,
         text=f"Noted - keeping both values for `{subject}` as intentional.",
@@ -752,9 +974,9 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
     button_value = action.get("value", "")
     action_id = action.get("action_id", "approve_draft")
 
-    # In-memory dedup for Slack retries and rage-clicks
+    # Dedup for Slack retries and rage-clicks (atomic check-and-set)
     from src.slack.dedup import try_process_button
-    if not try_process_button(action_id, user_id, button_value):
+    if not await try_process_button(action_id, user_id, button_value):
         # Duplicate click - silently ignore (already processing)
         logger.debug(f"Ignoring duplicate approve click: {button_value}")
         return
@@ -794,7 +1016,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
     draft = state.get("draft")
 
     if not draft:
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Error: Could not find draft. Please start a new session.",
@@ -824,7 +1046,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
             draft_hash=current_hash,
         )
 
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="The draft has changed since you saw this preview. Please review the updated version:",
@@ -852,7 +1074,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
                 if existing_op and existing_op.jira_key:
                     settings = get_settings()
                     jira_url = f"{settings.jira_url.rstrip('/')}/browse/{existing_op.jira_key}"
-                    client.chat_postMessage(
+                    await call_slack(client.chat_postMessage,
                         channel=channel,
                         thread_ts=thread_ts,
                         text=f"Ticket was already created: <{jira_url}|{existing_op.jira_key}>",
@@ -861,7 +1083,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
 
             # Already approved but not created - notify
             approver = existing.approved_by
-            client.chat_postMessage(
+            await call_slack(client.chat_postMessage,
                 channel=channel,
                 thread_ts=thread_ts,
                 text=f"This draft was already approved by <@{approver}>.",
@@ -879,7 +1101,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
         if not is_new:
             # Race condition - another approval just happened
             approver = await approval_store.get_approver(session_id, hash_to_record)
-            client.chat_postMessage(
+            await call_slack(client.chat_postMessage,
                 channel=channel,
                 thread_ts=thread_ts,
                 text=f"This draft was just approved by <@{approver}>.",
@@ -895,7 +1117,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
         try:
             from src.context.jira_linker import JiraLinker
             linker = JiraLinker(client, jira_service)
-            slack_permalink = linker.get_thread_permalink(channel, thread_ts)
+            slack_permalink = await linker.get_thread_permalink(channel, thread_ts)
         except Exception as e:
             logger.warning(f"Failed to get Slack permalink: {e}")
 
@@ -916,7 +1138,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
     if create_result.success:
         if create_result.was_duplicate:
             # Already created (idempotent return) - just notify
-            client.chat_postMessage(
+            await call_slack(client.chat_postMessage,
                 channel=channel,
                 thread_ts=thread_ts,
                 text=f"Ticket was already created: <{create_result.jira_url}|{create_result.jira_key}>",
@@ -949,7 +1171,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
                 # Non-blocking
 
             # Update preview message to show created state
-            _update_preview_to_created(
+            await _update_preview_to_created(
                 client=client,
                 channel=channel,
                 message_ts=message_ts,
@@ -960,7 +1182,7 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
             )
 
             # Notify in thread with Jira link
-            client.chat_postMessage(
+            await call_slack(client.chat_postMessage,
                 channel=channel,
                 thread_ts=thread_ts,
                 text=f"Ticket created: <{create_result.jira_url}|{create_result.jira_key}>",
@@ -968,14 +1190,14 @@ async def handle_approve_draft(ack, body, client: WebClient, action):
     else:
         # Creation failed - don't advance state, notify error
         # Update preview to show error state (keep buttons for retry)
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text=f"Could not create ticket: {create_result.error}",
         )
 
 
-def _update_preview_to_created(
+async def _update_preview_to_created(
     client: WebClient,
     channel: str,
     message_ts: str,
@@ -1063,7 +1285,7 @@ def _update_preview_to_created(
     })
 
     try:
-        client.chat_update(
+        await call_slack(client.chat_update,
             channel=channel,
             ts=message_ts,
             text=f"Ticket created: {jira_key}",
@@ -1173,9 +1395,9 @@ async def handle_reject_draft(ack, body, client: WebClient, action):
     button_value = action.get("value", "")
     action_id = action.get("action_id", "reject_draft")
 
-    # In-memory dedup for Slack retries and rage-clicks
+    # Dedup for Slack retries and rage-clicks (atomic check-and-set)
     from src.slack.dedup import try_process_button
-    if not try_process_button(action_id, user_id, button_value):
+    if not await try_process_button(action_id, user_id, button_value):
         # Duplicate click - silently ignore
         logger.debug(f"Ignoring duplicate reject click: {button_value}")
         return
@@ -1207,7 +1429,7 @@ async def handle_reject_draft(ack, body, client: WebClient, action):
     draft = state.get("draft")
 
     if not draft:
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Error: Could not find draft. Please start a new session.",
@@ -1227,13 +1449,13 @@ async def handle_reject_draft(ack, body, client: WebClient, action):
     )
 
     try:
-        client.views_open(
+        await call_slack(client.views_open,
             trigger_id=trigger_id,
             view=modal_view,
         )
     except Exception as e:
         logger.error(f"Failed to open edit modal: {e}", exc_info=True)
-        client.chat_postMessage(
+        await call_slack(client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="Sorry, I couldn't open the edit form. Please tell me what needs to be changed in the thread.",
@@ -1349,7 +1571,7 @@ async def handle_edit_draft_submit(ack, body, client: WebClient, view):
     )
 
     try:
-        client.chat_update(
+        await call_slack(client.chat_update,
             channel=channel,
             ts=preview_message_ts,
             text=f"Updated ticket preview for: {draft.title or 'Untitled'}",
@@ -1359,7 +1581,7 @@ async def handle_edit_draft_submit(ack, body, client: WebClient, view):
         logger.warning(f"Failed to update preview message: {e}")
 
     # Post confirmation
-    client.chat_postMessage(
+    await call_slack(client.chat_postMessage,
         channel=channel,
         thread_ts=thread_ts,
         text=f"Draft updated by <@{user_id}>. Please review the changes above.",
@@ -3,12 +3,18 @@
 import logging
 import re
 from slack_bolt import App
+from slack_bolt.async_app import AsyncApp
 
 from src.slack.handlers import (
     handle_app_mention,
+    handle_app_mention_async,
     handle_message,
+    handle_message_async,
     handle_jira_command,
+    handle_jira_command_async,
     handle_help_command,
+    handle_help_command_async,
+    handle_epic_selection,
     handle_epic_selection_sync,
     handle_merge_context,
     handle_ignore_dedup,
@@ -18,6 +24,8 @@ from src.slack.handlers import (
     handle_approve_draft,
     handle_reject_draft,
     handle_edit_draft_submit,
+    scheduled_action,
+    async_scheduled_action,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,6 +35,8 @@ def register_handlers(app: App) -> None:
     """Register all event handlers with the Slack app.
 
     Call this after get_slack_app() but before start_socket_mode().
+    Async action/view handlers are wrapped with scheduled_action() so they
+    ack immediately and run on the work scheduler at button-click priority.
     """
     # App mentions - explicit trigger
     app.event("app_mention")(handle_app_mention)
@@ -43,19 +53,49 @@ def register_handlers(app: App) -> None:
     app.action(re.compile(r"^select_epic_.*"))(handle_epic_selection_sync)
 
     # Action handlers for dedup suggestions
-    app.action("merge_thread_context")(handle_merge_context)
-    app.action("ignore_dedup_suggestion")(handle_ignore_dedup)
+    app.action("merge_thread_context")(scheduled_action(handle_merge_context))
+    app.action("ignore_dedup_suggestion")(scheduled_action(handle_ignore_dedup))
 
     # Action handlers for contradiction resolution
-    app.action("resolve_contradiction_conflict")(handle_contradiction_conflict)
-    app.action("resolve_contradiction_override")(handle_contradiction_override)
-    app.action("resolve_contradiction_both")(handle_contradiction_both)
+    app.action("resolve_contradiction_conflict")(scheduled_action(handle_contradiction_conflict))
+    app.action("resolve_contradiction_override")(scheduled_action(handle_contradiction_override))
+    app.action("resolve_contradiction_both")(scheduled_action(handle_contradiction_both))
 
     # Action handlers for draft approval/rejection
-    app.action("approve_draft")(handle_approve_draft)
-    app.action("reject_draft")(handle_reject_draft)
+    app.action("approve_draft")(scheduled_action(handle_approve_draft))
+    app.action("reject_draft")(scheduled_action(handle_reject_draft))
 
     # View submission handlers
-    app.view("edit_draft_modal")(handle_edit_draft_submit)
+    app.view("edit_draft_modal")(scheduled_action(handle_edit_draft_submit))
 
     logger.info("Slack handlers registered: app_mention, message, /jira, /help, select_epic_*, dedup, contradiction, draft_approval, edit_modal")
+
+
+def register_async_handlers(app: AsyncApp) -> None:
+    """Register all event handlers with the async Slack app.
+
+    Mirrors register_handlers() for settings.slack_async_mode. Listeners run
+    on the event loop and hand work to the same scheduler, so event handling,
+    the graph and the checkpointer all share one loop.
+    """
+    app.event("app_mention")(handle_app_mention_async)
+    app.event("message")(handle_message_async)
+
+    app.command("/jira")(handle_jira_command_async)
+    app.command("/help")(handle_help_command_async)
+
+    app.action(re.compile(r"^select_epic_.*"))(async_scheduled_action(handle_epic_selection))
+
+    app.action("merge_thread_context")(async_scheduled_action(handle_merge_context))
+    app.action("ignore_dedup_suggestion")(async_scheduled_action(handle_ignore_dedup))
+
+    app.action("resolve_contradiction_conflict")(async_scheduled_action(handle_contradiction_conflict))
+    app.action("resolve_contradiction_override")(async_scheduled_action(handle_contradiction_override))
+    app.action("resolve_contradiction_both")(async_scheduled_action(handle_contradiction_both))
+
+    app.action("approve_draft")(async_scheduled_action(handle_approve_draft))
+    app.action("reject_draft")(async_scheduled_action(handle_reject_draft))
+
+    app.view("edit_draft_modal")(async_scheduled_action(handle_edit_draft_submit))
+
+    logger.info("Async Slack handlers registered")
@@ -0,0 +1,343 @@
+"""Bounded work scheduler for async Slack event processing.
+
+Bolt listeners run in worker threads and must ack fast, so the real work
+(graph runs, Jira calls, DB writes) is handed to this scheduler, which runs
+it on one persistent background event loop. The same loop hosts the
+connection pool and the checkpointer, which are bound to the loop they were
+opened on.
+
+The scheduler provides:
+- A bounded queue with admission control (load shedding when full)
+- Priority ordering: button clicks and modal submissions before slash
+  commands, slash commands before new mentions and thread replies
+- Global and per-team concurrency limits, so one busy workspace cannot
+  fan out unbounded LLM calls and starve everyone else
+- Error capture: failures after submission are logged, never dropped
+- Queue depth and wait-time metrics
+
+Usage:
+    from src.slack.scheduler import get_scheduler, WorkPriority
+
+    accepted = get_scheduler().submit(
+        _process_mention(...),
+        team_id=team_id,
+        priority=WorkPriority.MESSAGE,
+        name="app_mention",
+        on_rejected=lambda: client.chat_postEphemeral(...),
+    )
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Coroutine, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Persistent background event loop for all async operations
+# This ensures all async code (including the checkpointer) uses the same event loop
+_background_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+# Number of recent wait samples kept for percentile metrics
+WAIT_SAMPLE_SIZE = 1000
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or create the persistent background event loop."""
+    global _background_loop, _loop_thread
+
+    with _loop_lock:
+        if _background_loop is None or not _background_loop.is_running():
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            _loop_thread = threading.Thread(target=run_loop, daemon=True, name="async_event_loop")
+            _loop_thread.start()
+            started.wait()
+            _background_loop = loop
+            logger.info("Started persistent background event loop")
+
+    return _background_loop
+
+
+class WorkPriority(IntEnum):
+    """Scheduling priority (lower value runs first)."""
+    ACTION = 0  # Button clicks, modal submissions - user is looking at the UI
+    COMMAND = 1  # Slash commands
+    MESSAGE = 2  # New mentions and thread replies
+
+
+@dataclass(order=True)
+class _WorkItem:
+    """Queued unit of work. Ordered by (priority, seq) for FIFO within a priority."""
+    priority: int
+    seq: int
+    coro: Coroutine[Any, Any, Any] = field(compare=False)
+    team_id: str = field(compare=False)
+    name: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class WorkScheduler:
+    """Bounded, priority-ordered executor on the background event loop.
+
+    submit() is thread-safe and returns immediately. Admission is decided
+    synchronously so the caller can tell the Slack user when work is shed.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_queue_size: int,
+        max_concurrency: int,
+        per_team_concurrency: int,
+        action_reserve: int = 0,
+    ) -> None:
+        """Initialize scheduler and start its dispatcher on the loop.
+
+        Args:
+            loop: Event loop that runs all work (must already be running).
+            max_queue_size: Max items admitted but not yet running.
+            max_concurrency: Max items running at once across all teams.
+            per_team_concurrency: Max items running at once for one team.
+            action_reserve: Queue slots only ACTION priority may use, so
+                button clicks are still accepted when mentions are shed.
+        """
+        self._loop = loop
+        self._max_queue_size = max_queue_size
+        self._max_concurrency = max_concurrency
+        self._per_team_concurrency = per_team_concurrency
+        self._action_reserve = min(action_reserve, max_queue_size)
+
+        # Admission state (touched from Bolt threads)
+        self._admission_lock = threading.Lock()
+        self._pending = 0  # Admitted but not yet started
+        self._seq = itertools.count()
+
+        # Loop-only state
+        self._heap: list[_WorkItem] = []
+        self._running = 0
+        self._team_running: dict[str, int] = defaultdict(int)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._tasks: set[asyncio.Task] = set()
+
+        # Metrics
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._wait_samples: deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+        loop.call_soon_threadsafe(self._start)
+
+    def _start(self) -> None:
+        """Create the dispatcher task (runs on the loop)."""
+        self._wakeup = asyncio.Event()
+        self._dispatcher = self._loop.create_task(self._dispatch_loop(), name="work_scheduler")
+
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        *,
+        team_id: str,
+        priority: WorkPriority = WorkPriority.MESSAGE,
+        name: str = "",
+        on_rejected: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """Submit a coroutine for execution. Thread-safe.
+
+        Args:
+            coro: Coroutine to run on the background loop.
+            team_id: Slack team ID used for per-team concurrency.
+            priority: Scheduling priority.
+            name: Label for logs.
+            on_rejected: Called synchronously (in the caller's thread) if the
+                queue is full and the work is shed.
+
+        Returns:
+            True if accepted, False if shed.
+        """
+        capacity = self._max_queue_size
+        if priority != WorkPriority.ACTION:
+            capacity -= self._action_reserve
+
+        with self._admission_lock:
+            accepted = self._pending < capacity
+            if accepted:
+                self._pending += 1
+                self._submitted += 1
+                seq = next(self._seq)
+            else:
+                self._rejected += 1
+
+        if not accepted:
+            coro.close()  # Never awaited - avoid "coroutine was never awaited"
+            logger.warning(
+                "Work scheduler full, shedding work",
+                extra={
+                    "work_name": name,
+                    "team_id": team_id,
+                    "priority": priority.name,
+                    "queue_depth": self._pending,
+                },
+            )
+            if on_rejected:
+                try:
+                    on_rejected()
+                except Exception as e:
+                    logger.warning(f"Failed to notify about shed work: {e}")
+            return False
+
+        item = _WorkItem(
+            priority=int(priority),
+            seq=seq,
+            coro=coro,
+            team_id=team_id,
+            name=name,
+            enqueued_at=time.monotonic(),
+        )
+        self._loop.call_soon_threadsafe(self._enqueue, item)
+        return True
+
+    def _enqueue(self, item: _WorkItem) -> None:
+        """Add item to the heap and wake the dispatcher (runs on the loop)."""
+        heapq.heappush(self._heap, item)
+        self._wakeup.set()
+
+    def _next_runnable(self) -> Optional[_WorkItem]:
+        """Pop the highest-priority item whose team is under its limit."""
+        skipped = []
+        found = None
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            if self._team_running[item.team_id] < self._per_team_concurrency:
+                found = item
+                break
+            skipped.append(item)
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+        return found
+
+    async def _dispatch_loop(self) -> None:
+        """Start queued work whenever a global and per-team slot is free."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._running < self._max_concurrency:
+                item = self._next_runnable()
+                if item is None:
+                    break
+                self._start_item(item)
+
+    def _start_item(self, item: _WorkItem) -> None:
+        """Launch a work item as a task and record its queue wait."""
+        with self._admission_lock:
+            self._pending -= 1
+
+        wait_ms = (time.monotonic() - item.enqueued_at) * 1000
+        self._wait_total_ms += wait_ms
+        self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+        self._wait_samples.append(wait_ms)
+
+        self._running += 1
+        self._team_running[item.team_id] += 1
+
+        task = self._loop.create_task(self._run(item), name=f"work:{item.name}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, item: _WorkItem) -> None:
+        """Run one item, capturing failures, then free its slots."""
+        try:
+            await item.coro
+            self._completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._failed += 1
+            logger.error(
+                f"Scheduled work failed: {e}",
+                exc_info=True,
+                extra={"work_name": item.name, "team_id": item.team_id},
+            )
+        finally:
+            self._running -= 1
+            self._team_running[item.team_id] -= 1
+            if self._team_running[item.team_id] <= 0:
+                del self._team_running[item.team_id]
+            self._wakeup.set()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler metrics.
+
+        Returns:
+            Dict with queue depth, running count, counters and wait times.
+        """
+        samples = sorted(self._wait_samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+        started = self._completed + self._failed + self._running
+        return {
+            "queue_depth": self._pending,
+            "max_queue_size": self._max_queue_size,
+            "running": self._running,
+            "max_concurrency": self._max_concurrency,
+            "teams_running": len(self._team_running),
+            "submitted": self._submitted,
+            "rejected": self._rejected,
+            "completed": self._completed,
+            "failed": self._failed,
+            "wait_avg_ms": round(self._wait_total_ms / started, 2) if started else 0.0,
+            "wait_p95_ms": round(p95, 2),
+            "wait_max_ms": round(self._wait_max_ms, 2),
+        }
+
+
+_scheduler: Optional[WorkScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> WorkScheduler:
+    """Get or create the work scheduler singleton (sized from settings)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            settings = get_settings()
+            _scheduler = WorkScheduler(
+                loop=get_background_loop(),
+                max_queue_size=settings.scheduler_max_queue_size,
+                max_concurrency=settings.scheduler_max_concurrency,
+                per_team_concurrency=settings.scheduler_per_team_concurrency,
+                action_reserve=settings.scheduler_action_reserve,
+            )
+            logger.info(
+                "Work scheduler started",
+                extra={
+                    "max_queue_size": settings.scheduler_max_queue_size,
+                    "max_concurrency": settings.scheduler_max_concurrency,
+                    "per_team_concurrency": settings.scheduler_per_team_concurrency,
+                },
+            )
+    return _scheduler
+
+
+def get_scheduler_stats() -> dict[str, Any]:
+    """Get scheduler metrics without starting it (empty dict if not started)."""
+    return _scheduler.get_stats() if _scheduler is not None else {}
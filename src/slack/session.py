@@ -2,13 +2,21 @@
 
 import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
+
+from src.config import get_settings
+from src.registry import BoundedRegistry
+
+if TYPE_CHECKING:
+    from src.db.session_lock import SessionLease
 
 logger = logging.getLogger(__name__)
 
-# Per-session locks to serialize processing
-_session_locks: dict[str, asyncio.Lock] = {}
+# Per-session locks to serialize processing (bounded, created on first use)
+_session_locks: Optional[BoundedRegistry[asyncio.Lock]] = None
 
 
 @dataclass
@@ -44,14 +52,35 @@ class SessionIdentity:
         )
 
 
+def _lock_is_free(lock: asyncio.Lock) -> bool:
+    """True if nobody holds or waits for the lock."""
+    return not lock.locked() and not getattr(lock, "_waiters", None)
+
+
+def _get_lock_registry() -> BoundedRegistry[asyncio.Lock]:
+    """Get or create the session lock registry (sized from settings)."""
+    global _session_locks
+    if _session_locks is None:
+        settings = get_settings()
+        _session_locks = BoundedRegistry(
+            name="session_locks",
+            max_size=settings.session_registry_max_size,
+            idle_ttl_seconds=settings.session_registry_idle_ttl_seconds,
+            factory=lambda session_id: asyncio.Lock(),
+            can_evict=_lock_is_free,
+        )
+    return _session_locks
+
+
 def get_session_lock(session_id: str) -> asyncio.Lock:
     """Get or create lock for session.
 
     Ensures one run at a time per thread to prevent race conditions.
+    Callers must acquire the lock without awaiting anything else first
+    (``async with get_session_lock(...)``): a held or awaited lock is never
+    evicted, so two callers can never end up with different locks.
     """
-    if session_id not in _session_locks:
-        _session_locks[session_id] = asyncio.Lock()
-    return _session_locks[session_id]
+    return _get_lock_registry().get_or_create(session_id)
 
 
 async def with_session_lock(session_id: str):
@@ -66,11 +95,51 @@ async def with_session_lock(session_id: str):
         yield
 
 
+@asynccontextmanager
+async def session_lock(session_id: str) -> AsyncIterator[Optional["SessionLease"]]:
+    """Hold the session lock for one turn, across replicas if configured.
+
+    Takes the in-process lock first, so turns queued in this process wait
+    locally. With settings.session_lock_distributed, the holder then also
+    takes the Postgres advisory lock (see src.db.session_lock).
+
+    Usage:
+        async with session_lock(session_id) as lease:
+            # process session
+            if lease:
+                lease.check()  # before writing state
+
+    Yields:
+        SessionLease of the distributed lock, None if only the local lock
+        is used
+
+    Raises:
+        SessionLockTimeout: If another replica holds the session too long.
+    """
+    from src.metrics import SESSION_LOCK_WAIT_SECONDS
+
+    lock = get_session_lock(session_id)
+    start = time.perf_counter()
+    async with lock:
+        SESSION_LOCK_WAIT_SECONDS.observe(time.perf_counter() - start, scope="local")
+        if not get_settings().session_lock_distributed:
+            yield None
+            return
+
+        from src.db.session_lock import advisory_session_lock
+        async with advisory_session_lock(session_id) as lease:
+            yield lease
+
+
 def cleanup_session_lock(session_id: str) -> None:
     """Remove session lock when session is closed.
 
     Call when thread is archived or session completed.
     """
-    if session_id in _session_locks:
-        del _session_locks[session_id]
+    if _get_lock_registry().remove(session_id):
         logger.debug(f"Cleaned up lock for session {session_id}")
+
+
+def get_session_lock_stats() -> dict[str, Any]:
+    """Get session lock registry metrics (size, evictions, hit rate)."""
+    return _get_lock_registry().get_stats()
@@ -0,0 +1,336 @@
+"""Lightweight in-process tracing for graph turns.
+
+Shows where a turn's time goes: graph nodes, LLM calls, DB work,
+checkpoint reads/writes and Jira requests each get a span with timings
+(and token usage for LLM calls). Spans nest via a ContextVar, so tasks
+spawned inside a span (e.g., concurrent persona validators) attach to it.
+
+One trace tree is built per turn, keyed by session id:
+- The latest trace of each session is kept in memory (get_turn_trace)
+- The slowest turns are kept in a fixed-size buffer (get_slowest_turns)
+- Finished turns are appended to a JSONL file (settings.tracing_export_path)
+  by a writer thread, so file I/O never runs on the event loop
+
+Spans opened outside a turn (e.g., startup) are not recorded.
+
+Usage:
+    from src.tracing import trace_turn, span, traced
+
+    with trace_turn(session_id):
+        with span("jira.search", kind="jira") as s:
+            ...
+            s.set(results=3)
+
+    @traced("node", "extraction")
+    async def extraction_node(state): ...
+"""
+import functools
+import heapq
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Traces waiting for the export writer; more are dropped (and counted)
+EXPORT_QUEUE_SIZE = 1000
+
+
+@dataclass
+class Span:
+    """Timed operation within a turn."""
+
+    name: str
+    kind: str  # turn | node | llm | db | checkpoint | jira | ...
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration (up to now if still open)."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes (e.g., token usage, row counts)."""
+        self.attributes.update(attributes)
+
+    def to_dict(self, origin: Optional[float] = None) -> dict[str, Any]:
+        """Serialize the span tree (offsets relative to the root span)."""
+        origin = self.start if origin is None else origin
+        data: dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "offset_ms": round((self.start - origin) * 1000, 2),
+            "duration_ms": round(self.duration_ms, 2),
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [c.to_dict(origin) for c in self.children]
+        return data
+
+    def totals_by_kind(self) -> dict[str, float]:
+        """Total time per span kind among descendants (ms).
+
+        Nested spans of the same kind are counted once (outermost wins).
+        """
+        totals: dict[str, float] = {}
+
+        def walk(node: "Span", open_kinds: frozenset[str]) -> None:
+            for child in node.children:
+                if child.kind not in open_kinds:
+                    totals[child.kind] = totals.get(child.kind, 0.0) + child.duration_ms
+                walk(child, open_kinds | {child.kind})
+
+        walk(self, frozenset())
+        return {kind: round(ms, 2) for kind, ms in totals.items()}
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class TraceRecorder:
+    """Keeps finished turn traces: latest per session, slowest N, JSONL export."""
+
+    def __init__(
+        self,
+        slowest_size: int,
+        max_sessions: int,
+        export_path: Optional[str] = None,
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            slowest_size: How many of the slowest turns to keep.
+            max_sessions: How many sessions' latest traces to keep.
+            export_path: JSONL file to append finished turns to (None = off).
+        """
+        self._slowest_size = slowest_size
+        self._max_sessions = max_sessions
+        self._export_path = export_path
+        self._lock = threading.Lock()
+
+        # Min-heap of (duration_ms, seq, trace) - root is the fastest kept
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._seq = itertools.count()
+
+        # session_id -> latest trace, least recently recorded first
+        self._latest: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        # Traces to append to the export file, written by _export_thread
+        self._export_queue: queue.Queue[dict[str, Any]] = queue.Queue(EXPORT_QUEUE_SIZE)
+        self._export_thread: Optional[threading.Thread] = None
+
+        self._turns = 0
+        self._export_errors = 0
+        self._export_dropped = 0
+
+    def record(self, session_id: str, root: Span) -> dict[str, Any]:
+        """Record a finished turn.
+
+        Returns:
+            The serialized trace
+        """
+        trace = {
+            "session_id": session_id,
+            "recorded_at": time.time(),
+            "duration_ms": round(root.duration_ms, 2),
+            "totals_ms": root.totals_by_kind(),
+            "trace": root.to_dict(),
+        }
+
+        with self._lock:
+            self._turns += 1
+
+            self._latest[session_id] = trace
+            self._latest.move_to_end(session_id)
+            while len(self._latest) > self._max_sessions:
+                self._latest.popitem(last=False)
+
+            entry = (trace["duration_ms"], next(self._seq), trace)
+            if len(self._slowest) < self._slowest_size:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+        if self._export_path:
+            self._export(trace)
+        return trace
+
+    def _export(self, trace: dict[str, Any]) -> None:
+        """Queue one trace for the writer thread (dropped if the queue is full)."""
+        with self._lock:
+            if self._export_thread is None:
+                self._export_thread = threading.Thread(
+                    target=self._export_forever, name="trace-export", daemon=True
+                )
+                self._export_thread.start()
+        try:
+            self._export_queue.put_nowait(trace)
+        except queue.Full:
+            self._export_dropped += 1
+
+    def _export_forever(self) -> None:
+        """Writer thread: append queued traces as JSON lines, a batch per open.
+
+        Failures are logged, not raised.
+        """
+        while True:
+            batch = [self._export_queue.get()]
+            while True:
+                try:
+                    batch.append(self._export_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with open(self._export_path, "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(trace, default=str) + "\n" for trace in batch)
+            except OSError as e:
+                self._export_errors += 1
+                logger.warning(f"Trace export failed: {e}")
+            finally:
+                for _ in batch:
+                    self._export_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued trace has been written (or failed)."""
+        self._export_queue.join()
+
+    def get_turn_trace(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Latest turn trace for a session."""
+        return self._latest.get(session_id)
+
+    def get_slowest_turns(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Slowest recorded turns, slowest first."""
+        with self._lock:
+            entries = sorted(self._slowest, key=lambda e: e[0], reverse=True)
+        return [trace for _, _, trace in entries[:limit]]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Recorder metrics."""
+        return {
+            "turns": self._turns,
+            "sessions": len(self._latest),
+            "slowest_kept": len(self._slowest),
+            "export_errors": self._export_errors,
+            "export_queued": self._export_queue.qsize(),
+            "export_dropped": self._export_dropped,
+        }
+
+
+_recorder: Optional[TraceRecorder] = None
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """Get or create the trace recorder singleton (sized from settings)."""
+    global _recorder
+    if _recorder is None:
+        settings = get_settings()
+        _recorder = TraceRecorder(
+            slowest_size=settings.tracing_slowest_turns,
+            max_sessions=settings.session_registry_max_size,
+            export_path=settings.tracing_export_path,
+        )
+    return _recorder
+
+
+@contextmanager
+def trace_turn(session_id: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Open the root span of a turn and record the tree when it ends.
+
+    Nested turns (a turn opened inside another) become plain spans.
+    Yields None if tracing is disabled.
+    """
+    if not get_settings().tracing_enabled:
+        yield None
+        return
+    if _current_span.get() is not None:
+        with span("turn", kind="turn", session_id=session_id, **attributes) as s:
+            yield s
+        return
+
+    root = Span(name="turn", kind="turn", attributes={"session_id": session_id, **attributes})
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = type(e).__name__
+        raise
+    finally:
+        root.end = time.perf_counter()
+        _current_span.reset(token)
+        trace = get_trace_recorder().record(session_id, root)
+        logger.debug(
+            f"Turn traced in {trace['duration_ms']}ms",
+            extra={"session_id": session_id, "totals_ms": trace["totals_ms"]},
+        )
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a block as a child of the current span.
+
+    Yields None (and records nothing) outside a turn.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name=name, kind=kind, attributes=dict(attributes))
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = type(e).__name__
+        raise
+    finally:
+        child.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span, if any."""
+    return _current_span.get()
+
+
+def traced(kind: str, name: Optional[str] = None) -> Callable:
+    """Decorator: run an async function inside a span."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name, kind=kind):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_turn_trace(session_id: str) -> Optional[dict[str, Any]]:
+    """Latest turn trace for a session."""
+    return get_trace_recorder().get_turn_trace(session_id)
+
+
+def get_slowest_turns(limit: Optional[int] = None) -> list[dict[str, Any]]:
+    """Slowest recorded turns, slowest first."""
+    return get_trace_recorder().get_slowest_turns(limit)
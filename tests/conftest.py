@@ -0,0 +1,32 @@
+"""Shared test setup.
+
+Settings require Slack, Jira and Gemini credentials; tests never call them, so
+placeholders are enough to construct them.
+"""
+import os
+
+import pytest
+
+for _name in (
+    "SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "JIRA_URL", "JIRA_USER", "JIRA_API_TOKEN", "GOOGLE_API_KEY"
+):
+    os.environ.setdefault(_name, "test")
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """A FakeClock; patch it over a module's `time` to control expiry."""
+    return FakeClock()
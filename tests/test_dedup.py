@@ -0,0 +1,106 @@
+"""Tests for event deduplication."""
+import asyncio
+import threading
+
+import pytest
+
+from src.slack import dedup
+from src.slack.dedup import DedupStore
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr(dedup, "time", fake_clock)
+    return fake_clock
+
+
+def test_check_and_set_first_call_wins(clock):
+    store = DedupStore("test", ttl_seconds=300, max_entries=100)
+    assert store.check_and_set("k") is True
+    assert store.check_and_set("k") is False
+    assert store.get_stats()["duplicates"] == 1
+
+
+def test_keys_expire_after_ttl(clock):
+    store = DedupStore("test", ttl_seconds=300, max_entries=100)
+    store.add("k")
+    clock.advance(299)
+    assert store.contains("k")
+    clock.advance(2)
+    assert not store.contains("k")
+    assert store.check_and_set("k") is True
+    assert store.get_stats()["expired"] == 1
+
+
+def test_expiry_stops_at_first_live_key(clock):
+    store = DedupStore("test", ttl_seconds=300, max_entries=100)
+    store.add("old")
+    clock.advance(200)
+    store.add("new")
+    clock.advance(150)
+
+    assert not store.contains("old")
+    assert store.contains("new")
+    assert len(store) == 1
+
+
+def test_hard_cap_drops_oldest(clock):
+    store = DedupStore("test", ttl_seconds=300, max_entries=2)
+    for key in ("a", "b", "c"):
+        store.add(key)
+
+    assert not store.contains("a")
+    assert store.contains("b") and store.contains("c")
+    assert store.get_stats()["evicted"] == 1
+
+
+def test_re_adding_key_moves_it_to_the_back(clock):
+    store = DedupStore("test", ttl_seconds=300, max_entries=2)
+    store.add("a")
+    store.add("b")
+    clock.advance(10)
+    store.add("a")
+    store.add("c")
+
+    assert store.contains("a")
+    assert not store.contains("b")
+
+
+def test_check_and_set_is_atomic_across_threads():
+    store = DedupStore("test", ttl_seconds=300, max_entries=1000)
+    winners = []
+    barrier = threading.Barrier(8)
+
+    def claim():
+        barrier.wait()
+        if store.check_and_set("k"):
+            winners.append(threading.get_ident())
+
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(winners) == 1
+
+
+def test_event_key_preference():
+    assert dedup._get_event_key({"event_id": "E1", "client_msg_id": "m"}) == "event:E1"
+    assert dedup._get_event_key({"client_msg_id": "m", "ts": "1.0"}) == "msg:m"
+    assert dedup._get_event_key({"channel": "C1", "ts": "1.0"}) == "ts:C1:1.0"
+    assert dedup._get_event_key({}) is None
+
+
+def test_try_process_event_mention_and_message_share_a_key(monkeypatch):
+    # A mention in a thread arrives as both app_mention and message events
+    monkeypatch.setattr(dedup.get_settings(), "dedup_postgres", False)
+    dedup.clear_dedup_store()
+    mention = {"type": "app_mention", "client_msg_id": "m1", "channel": "C1", "ts": "1.0"}
+    message = {"type": "message", "client_msg_id": "m1", "channel": "C1", "ts": "1.0"}
+
+    async def run():
+        return [await dedup.try_process_event(mention), await dedup.try_process_event(message)]
+
+    assert asyncio.run(run()) == [True, False]
+    dedup.clear_dedup_store()
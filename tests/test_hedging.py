@@ -0,0 +1,151 @@
+"""Tests for latency hedging and fallback."""
+import asyncio
+import time
+
+import pytest
+
+from src.config import get_settings
+from src.llm import hedging
+from src.llm.hedging import get_latency_tracker, invoke_with_backups
+from src.llm.types import FinishReason, LLMProvider, LLMResult
+
+HEDGE_DELAY_MS = 50.0
+
+
+@pytest.fixture(autouse=True)
+def hedge_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_hedge_default_delay_ms", HEDGE_DELAY_MS)
+    monkeypatch.setattr(settings, "llm_hedge_min_delay_ms", HEDGE_DELAY_MS)
+    monkeypatch.setattr(settings, "llm_hedge_min_samples", 20)
+    monkeypatch.setattr(hedging, "_trackers", {})
+
+
+class FakeCall:
+    """A provider call that answers after a delay and records its lifecycle."""
+
+    def __init__(self, model: str, delay: float, error: bool = False):
+        self.model = model
+        self.delay = delay
+        self.error = error
+        self.started_at = None
+        self.cancelled = False
+
+    @property
+    def label(self) -> str:
+        return f"gemini:{self.model}"
+
+    async def __call__(self) -> LLMResult:
+        self.started_at = time.perf_counter()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return LLMResult(
+            provider=LLMProvider.GEMINI,
+            model=self.model,
+            finish_reason=FinishReason.ERROR if self.error else FinishReason.STOP,
+            error="boom" if self.error else None,
+        )
+
+
+def run_backups(calls: list[FakeCall], mode: str) -> tuple[LLMResult, float]:
+    async def run():
+        start = time.perf_counter()
+        result = await invoke_with_backups([(call.label, call) for call in calls], mode)
+        # Let cancellations be delivered
+        await asyncio.sleep(0)
+        return result, start
+
+    return asyncio.run(run())
+
+
+def test_hedge_fires_after_delay_and_cancels_slow_primary():
+    primary = FakeCall("primary", delay=5.0)
+    backup = FakeCall("backup", delay=0.01)
+
+    result, start = run_backups([primary, backup], "hedge")
+
+    assert result.model == "backup"
+    assert primary.cancelled
+    hedge_after_ms = (backup.started_at - start) * 1000
+    assert HEDGE_DELAY_MS * 0.9 <= hedge_after_ms < HEDGE_DELAY_MS * 10
+
+
+def test_hedge_cancels_slow_backup_when_primary_wins():
+    primary = FakeCall("primary", delay=0.1)
+    backup = FakeCall("backup", delay=5.0)
+
+    result, _ = run_backups([primary, backup], "hedge")
+
+    assert result.model == "primary"
+    assert backup.started_at is not None
+    assert backup.cancelled
+
+
+def test_no_hedge_when_primary_is_fast():
+    primary = FakeCall("primary", delay=0.0)
+    backup = FakeCall("backup", delay=0.0)
+
+    result, _ = run_backups([primary, backup], "hedge")
+
+    assert result.model == "primary"
+    assert backup.started_at is None
+
+
+def test_fallback_mode_never_hedges():
+    primary = FakeCall("primary", delay=0.1)
+    backup = FakeCall("backup", delay=0.0)
+
+    result, _ = run_backups([primary, backup], "fallback")
+
+    assert result.model == "primary"
+    assert backup.started_at is None
+
+
+def test_fallback_on_error_starts_backup_immediately():
+    primary = FakeCall("primary", delay=0.0, error=True)
+    backup = FakeCall("backup", delay=0.0)
+
+    result, start = run_backups([primary, backup], "fallback")
+
+    assert result.model == "backup"
+    assert (backup.started_at - start) * 1000 < HEDGE_DELAY_MS
+
+
+def test_all_failed_returns_last_error():
+    calls = [FakeCall("primary", 0.0, error=True), FakeCall("backup", 0.0, error=True)]
+
+    result, _ = run_backups(calls, "fallback")
+
+    assert result.finish_reason == FinishReason.ERROR
+    assert result.model == "backup"
+
+
+def test_off_mode_uses_primary_only():
+    primary = FakeCall("primary", delay=0.0, error=True)
+    backup = FakeCall("backup", delay=0.0)
+
+    result, _ = run_backups([primary, backup], "off")
+
+    assert result.model == "primary"
+    assert backup.started_at is None
+
+
+def test_cancelled_primary_records_censored_latency():
+    primary = FakeCall("primary", delay=5.0)
+    backup = FakeCall("backup", delay=0.01)
+
+    run_backups([primary, backup], "hedge")
+
+    samples = list(get_latency_tracker(primary.label)._samples)
+    assert len(samples) == 1
+    assert samples[0] >= HEDGE_DELAY_MS
+    # A cancelled backup leaves no (misleadingly short) sample
+    assert len(get_latency_tracker(backup.label)) == 0
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        run_backups([FakeCall("primary", 0.0)], "sometimes")
@@ -0,0 +1,73 @@
+"""Tests for what the LLM response cache stores."""
+import asyncio
+import json
+
+import pytest
+
+from src.llm import cache as cache_module
+from src.llm.cache import LLMResponseCache, cache_if_parses, is_cacheable
+from src.llm.client import UnifiedChatClient
+from src.llm.types import FinishReason, LLMProvider, LLMResult
+
+
+def make_result(text: str = '{"ok": true}', **kwargs) -> LLMResult:
+    return LLMResult(provider=LLMProvider.GEMINI, model="gemini-1.5-flash", text=text, **kwargs)
+
+
+class FakeAdapter:
+    """Adapter returning queued answers and counting calls."""
+
+    def __init__(self, config, answers: list[str]):
+        self.config = config
+        self.answers = answers
+        self.calls = 0
+
+    async def invoke(self, messages, tools=None, response_schema=None) -> LLMResult:
+        self.calls += 1
+        return make_result(self.answers.pop(0))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache", LLMResponseCache(100, 3600, use_postgres=False))
+    llm = UnifiedChatClient(model="gemini-1.5-flash", temperature=0.0)
+    llm._fallbacks = []
+    return llm
+
+
+def test_is_cacheable():
+    assert is_cacheable(make_result())
+    assert not is_cacheable(make_result(""))
+    assert not is_cacheable(make_result("   "))
+    assert not is_cacheable(make_result(finish_reason=FinishReason.LENGTH))
+    assert not is_cacheable(make_result(finish_reason=FinishReason.ERROR))
+
+
+def test_cache_if_parses():
+    check = cache_if_parses(json.loads)
+    assert check(make_result('{"a": 1}'))
+    assert not check(make_result("Sure! Here is the JSON"))
+
+
+def test_unparseable_answer_is_not_replayed(client):
+    client._adapter = FakeAdapter(client.config, ["not json", '{"a": 1}', '{"b": 2}'])
+
+    async def run():
+        check = cache_if_parses(json.loads)
+        first = await client.chat("prompt", cache_if=check)
+        retry = await client.chat("prompt", cache_if=check)
+        again = await client.chat("prompt", cache_if=check)
+        return first, retry, again
+
+    assert asyncio.run(run()) == ("not json", '{"a": 1}', '{"a": 1}')
+    assert client._adapter.calls == 2
+
+
+def test_non_deterministic_calls_are_not_cached(client):
+    client.config = client.config.model_copy(update={"temperature": 0.7})
+    client._adapter = FakeAdapter(client.config, ['{"a": 1}', '{"a": 2}'])
+
+    async def run():
+        return [await client.chat("prompt") for _ in range(2)]
+
+    assert asyncio.run(run()) == ['{"a": 1}', '{"a": 2}']
@@ -0,0 +1,63 @@
+"""Tests for the rolling message summary and its use in prompts."""
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.slack import handlers  # noqa: F401  (import order: src.slack before src.graph)
+from src.graph import message_window
+from src.graph.nodes import extraction, fused_turn
+from src.schemas.draft import TicketDraft
+
+
+class FakeLLM:
+    """Records prompts and returns a fixed answer."""
+
+    def __init__(self, answer: str = "{}"):
+        self.answer = answer
+        self.prompts: list[str] = []
+
+    async def chat(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.answer
+
+    async def invoke(self, messages, **kwargs):
+        self.prompts.append(messages[-1].content)
+        raise RuntimeError("no fused answer")
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(extraction, "get_llm_for_task", lambda task: llm)
+    monkeypatch.setattr(fused_turn, "get_llm_for_task", lambda task: llm)
+    return llm
+
+
+def test_update_summary_drops_oldest_lines():
+    archived = [HumanMessage(content="first " * 10), AIMessage(content="second")]
+    summary = message_window.update_summary("old line", archived, max_chars=40)
+    assert summary.splitlines() == ["ai: second"]
+
+
+def test_summary_context_is_empty_without_summary():
+    assert message_window.summary_context(None) == ""
+    assert message_window.summary_context("") == ""
+
+
+def test_extraction_prompt_leads_with_summary(llm):
+    draft = TicketDraft(title="Export")
+    asyncio.run(extraction._llm_extract(draft, "Use the same format", "human: export as CSV"))
+    assert llm.prompts[0].startswith("Earlier conversation")
+    assert "human: export as CSV" in llm.prompts[0]
+
+
+def test_fused_prompt_leads_with_summary(llm):
+    draft = TicketDraft(title="Export")
+    asyncio.run(fused_turn.run_fused_turn(draft, "Use the same format", None, "human: CSV"))
+    assert llm.prompts[0].startswith("Earlier conversation")
+
+
+def test_prompt_without_summary_is_unchanged(llm):
+    asyncio.run(extraction._llm_extract(TicketDraft(), "hello"))
+    assert llm.prompts[0].startswith("Current draft state:")
@@ -0,0 +1,70 @@
+"""Tests for the provider prompt-cache prefix and Gemini cached contents."""
+import asyncio
+
+import pytest
+
+from src.llm.adapters import gemini_cache
+from src.llm.adapters.gemini_cache import GeminiContextCache
+from src.llm.prompts import get_prompt_builder
+from src.llm.types import LLMProvider
+
+
+class FakeCaches:
+    """Stands in for client.aio.caches, naming contents in creation order."""
+
+    def __init__(self):
+        self.created = 0
+        self.deleted: list[str] = []
+
+    async def create(self, model, config):
+        self.created += 1
+        return type("Cached", (), {"name": f"cachedContents/{self.created}"})()
+
+    async def delete(self, name):
+        self.deleted.append(name)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(gemini_cache.get_settings(), "llm_gemini_cache_max_entries", 2)
+    cache = GeminiContextCache(api_key="test")
+    caches = FakeCaches()
+    cache._client = type("Client", (), {"aio": type("Aio", (), {"caches": caches})()})()
+    return cache, caches
+
+
+def test_system_prefix_does_not_depend_on_channel():
+    builder = get_prompt_builder(LLMProvider.GEMINI)
+    first = builder.build_validation_prompt("Story", {}, [], channel_context=["Use Jira EPIC-1"])
+    second = builder.build_validation_prompt("Story", {}, [], channel_context=["Prefer Go"])
+
+    assert first[0].content == second[0].content
+    assert first[1].content.startswith("Channel context:\n- Use Jira EPIC-1")
+
+
+def test_cached_contents_are_bounded_and_evicted_ones_deleted(cache):
+    cache, caches = cache
+
+    async def run():
+        for prompt in ("one", "two", "three"):
+            cache.get("gemini-2.0-flash", prompt)
+            await asyncio.sleep(0)
+            await asyncio.gather(*cache._pending.values())
+        await asyncio.gather(*cache._deleting)
+
+    asyncio.run(run())
+    assert len(cache._entries) == 2
+    assert caches.deleted == ["cachedContents/1"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_cached_content_is_reused(cache):
+    cache, caches = cache
+
+    async def run():
+        assert cache.get("gemini-2.0-flash", "prompt") is None
+        await asyncio.gather(*cache._pending.values())
+        return cache.get("gemini-2.0-flash", "prompt")
+
+    assert asyncio.run(run()) == "cachedContents/1"
+    assert caches.created == 1
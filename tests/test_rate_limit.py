@@ -0,0 +1,245 @@
+"""Tests for the LLM client-side rate limiter."""
+import asyncio
+import time
+
+import pytest
+
+from src.llm import rate_limit
+from src.llm.adapters.base import is_rate_limit_error
+from src.llm.rate_limit import RateLimiter, RateLimitTimeout, TokenBucket
+from src.llm.types import FinishReason, LLMProvider, LLMResult, TokenUsage
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr(rate_limit, "time", fake_clock)
+    return fake_clock
+
+
+def make_result(**kwargs) -> LLMResult:
+    return LLMResult(provider=LLMProvider.GEMINI, model="test-model", **kwargs)
+
+
+# --- TokenBucket ---
+
+
+def test_bucket_starts_full(clock):
+    bucket = TokenBucket(60)
+    assert bucket.wait_time(60) == 0.0
+    bucket.consume(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+
+def test_bucket_refills_continuously(clock):
+    bucket = TokenBucket(60)  # 1 per second
+    bucket.consume(60)
+    clock.advance(30)
+    assert bucket.wait_time(30) == 0.0
+    assert bucket.wait_time(40) == pytest.approx(10.0)
+
+
+def test_bucket_never_exceeds_capacity(clock):
+    bucket = TokenBucket(60)
+    clock.advance(600)
+    bucket.consume(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+
+def test_bucket_debt_and_refund(clock):
+    bucket = TokenBucket(60)
+    bucket.consume(90)  # Actual usage above the estimate
+    assert bucket.wait_time(1) == pytest.approx(31.0)
+    bucket.consume(-30)  # Usage below the estimate is given back
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+
+def test_bucket_oversized_request_waits_for_full_bucket(clock):
+    bucket = TokenBucket(60)
+    bucket.consume(60)
+    assert bucket.wait_time(1000) == pytest.approx(60.0)
+
+
+def test_bucket_drain(clock):
+    bucket = TokenBucket(60)
+    bucket.drain()
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+
+def test_unlimited_bucket(clock):
+    bucket = TokenBucket(0)
+    bucket.consume(1_000_000)
+    assert bucket.unlimited
+    assert bucket.wait_time(1_000_000) == 0.0
+
+
+# --- RateLimiter ---
+
+
+def test_acquire_is_fifo():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=1)
+        await limiter.acquire(1, time.monotonic() + 5)
+        order = []
+
+        async def waiter(name: str):
+            await limiter.acquire(1, time.monotonic() + 5)
+            order.append(name)
+            limiter.release(1, make_result())
+
+        tasks = []
+        for name in ("first", "second", "third"):
+            tasks.append(asyncio.create_task(waiter(name)))
+            await asyncio.sleep(0)  # Queue in creation order
+
+        limiter.release(1, make_result())
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["first", "second", "third"]
+
+
+def test_acquire_raises_at_deadline():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=1)
+        await limiter.acquire(1, time.monotonic() + 5)
+        start = time.monotonic()
+        with pytest.raises(RateLimitTimeout):
+            await limiter.acquire(1, time.monotonic() + 0.05)
+        waited = time.monotonic() - start
+
+        stats = limiter.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["queued"] == 0  # The timed out waiter left the queue
+        assert stats["in_flight"] == 1
+        return waited
+
+    waited = asyncio.run(run())
+    assert 0.04 <= waited < 1.0
+
+
+def test_timed_out_head_does_not_block_queue():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=1)
+        await limiter.acquire(1, time.monotonic() + 5)
+        impatient = asyncio.create_task(limiter.acquire(1, time.monotonic() + 0.02))
+        await asyncio.sleep(0)
+        patient = asyncio.create_task(limiter.acquire(1, time.monotonic() + 5))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(RateLimitTimeout):
+            await impatient
+        limiter.release(1, make_result())
+        await asyncio.wait_for(patient, 1)
+
+    asyncio.run(run())
+
+
+def test_acquire_waits_for_request_bucket():
+    async def run():
+        limiter = RateLimiter("test", rpm=600, tpm=0, max_concurrency=10)  # 10 per second
+        limiter._requests.consume(600)
+        return await limiter.acquire(1, time.monotonic() + 5)
+
+    waited = asyncio.run(run())
+    assert 0.05 <= waited < 1.0
+
+
+def test_aimd_halves_on_rate_limit_once_per_cooldown():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=8)
+        for _ in range(2):
+            await limiter.acquire(1, time.monotonic() + 5)
+        limiter.release(1, make_result(finish_reason=FinishReason.ERROR, rate_limited=True))
+        limiter.release(1, make_result(finish_reason=FinishReason.ERROR, rate_limited=True))
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.concurrency_limit == 4  # One cut per burst
+    assert limiter.get_stats()["rate_limited"] == 2
+
+
+def test_aimd_grows_by_about_one_per_limit_of_successes():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=8)
+        limiter._limit = 4.0
+        for _ in range(4):
+            await limiter.acquire(1, time.monotonic() + 5)
+            limiter.release(1, make_result())
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.concurrency_limit == 4
+    assert 4.9 < limiter._limit < 5.0
+
+
+def test_aimd_stays_within_bounds():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=2, min_concurrency=1)
+        for _ in range(20):
+            await limiter.acquire(1, time.monotonic() + 5)
+            limiter.release(1, make_result())
+        assert limiter.concurrency_limit == 2
+
+        for _ in range(3):
+            limiter._last_decrease = 0.0  # Outside the cooldown
+            await limiter.acquire(1, time.monotonic() + 5)
+            limiter.release(1, make_result(finish_reason=FinishReason.ERROR, rate_limited=True))
+        assert limiter.concurrency_limit == 1
+
+    asyncio.run(run())
+
+
+def test_errors_do_not_change_limit():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=0, max_concurrency=8)
+        limiter._limit = 4.0
+        await limiter.acquire(1, time.monotonic() + 5)
+        limiter.release(1, make_result(finish_reason=FinishReason.ERROR))
+        return limiter
+
+    assert asyncio.run(run())._limit == 4.0
+
+
+def test_release_corrects_token_estimate():
+    async def run():
+        limiter = RateLimiter("test", rpm=0, tpm=600, max_concurrency=1)
+        await limiter.acquire(100, time.monotonic() + 5)
+        limiter.release(100, make_result(usage=TokenUsage(total_tokens=400)))
+        return limiter
+
+    limiter = asyncio.run(run())
+    # 400 of 600 used: the next 300-token call waits about 10s of refill
+    assert limiter._tokens.wait_time(300) == pytest.approx(10.0, abs=0.1)
+
+
+# --- is_rate_limit_error ---
+
+
+class RateLimitError(Exception):
+    """Stands in for openai / anthropic RateLimitError."""
+
+
+class StatusError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def test_rate_limit_detected_by_type_and_status():
+    assert is_rate_limit_error(RateLimitError("slow down"))
+    assert is_rate_limit_error(StatusError("Too Many Requests", 429))
+
+
+def test_rate_limit_detected_through_wrapped_cause():
+    try:
+        try:
+            raise StatusError("Too Many Requests", 429)
+        except StatusError as e:
+            raise ValueError("Error calling model") from e
+    except ValueError as wrapped:
+        assert is_rate_limit_error(wrapped)
+
+
+def test_message_text_does_not_count_as_rate_limit():
+    assert not is_rate_limit_error(StatusError("request req_429abc: quota field invalid", 400))
+    assert not is_rate_limit_error(ValueError("prompt used 14290 tokens, rate limit docs"))
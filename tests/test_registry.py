@@ -0,0 +1,138 @@
+"""Tests for BoundedRegistry eviction."""
+import asyncio
+
+import pytest
+
+from src import registry as registry_module
+from src.registry import BoundedRegistry
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    monkeypatch.setattr(registry_module, "time", fake_clock)
+    return fake_clock
+
+
+def make_locks(max_size: int = 2, idle_ttl_seconds: float = 60.0) -> BoundedRegistry:
+    return BoundedRegistry(
+        name="test_locks",
+        max_size=max_size,
+        idle_ttl_seconds=idle_ttl_seconds,
+        factory=lambda key: asyncio.Lock(),
+        can_evict=lambda lock: not lock.locked(),
+    )
+
+
+def test_lru_eviction_over_max_size(clock):
+    locks = make_locks(max_size=2)
+    locks.get_or_create("a")
+    locks.get_or_create("b")
+    locks.get_or_create("a")  # b is now least recently used
+    locks.get_or_create("c")
+
+    assert "a" in locks and "c" in locks
+    assert "b" not in locks
+    assert locks.get_stats()["evictions"] == 1
+
+
+def test_idle_entries_evicted(clock):
+    locks = make_locks(max_size=10, idle_ttl_seconds=60)
+    locks.get_or_create("a")
+    clock.advance(61)
+    locks.get_or_create("b")
+
+    assert "a" not in locks
+    assert "b" in locks
+
+
+def test_never_evicts_held_lock_over_max_size(clock):
+    async def run():
+        locks = make_locks(max_size=1)
+        held = locks.get_or_create("held")
+        await held.acquire()
+        locks.get_or_create("b")
+        locks.get_or_create("c")
+
+        # The held lock stays (the registry may exceed its soft limit)
+        assert locks.get("held") is held
+        assert "b" not in locks
+        held.release()
+
+    asyncio.run(run())
+
+
+def test_never_evicts_held_lock_when_idle(clock):
+    async def run():
+        locks = make_locks(max_size=10, idle_ttl_seconds=60)
+        held = locks.get_or_create("held")
+        await held.acquire()
+        clock.advance(61)
+        locks.get_or_create("b")
+
+        assert locks.get("held") is held
+        # Same key must keep mapping to the same lock, or two holders could coexist
+        assert locks.get_or_create("held") is held
+        held.release()
+
+    asyncio.run(run())
+
+
+def test_remove_skips_held_lock(clock):
+    async def run():
+        locks = make_locks()
+        held = locks.get_or_create("held")
+        await held.acquire()
+        assert locks.remove("held") is False
+        held.release()
+        assert locks.remove("held") is True
+
+    asyncio.run(run())
+
+
+def test_hit_rate_stats(clock):
+    locks = make_locks()
+    locks.get_or_create("a")
+    locks.get_or_create("a")
+    stats = locks.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_never_evicts_new_entry_when_all_old_entries_are_held(clock):
+    async def run():
+        locks = make_locks(max_size=2)
+        held = [locks.get_or_create(key) for key in ("a", "b")]
+        for lock in held:
+            await lock.acquire()
+
+        new = locks.get_or_create("c")
+        # The new lock is registered: a second caller gets the same one
+        assert locks.get_or_create("c") is new
+        assert len(locks) == 3
+        assert locks.get_stats()["evictions"] == 0
+
+        for lock in held:
+            lock.release()
+        locks.get_or_create("d")
+        assert "a" not in locks and "b" not in locks
+        assert "c" in locks and "d" in locks
+
+    asyncio.run(run())
+
+
+def test_on_evict_sees_evicted_entries(clock):
+    evicted = []
+    values = BoundedRegistry(
+        name="test_values",
+        max_size=1,
+        idle_ttl_seconds=60.0,
+        factory=lambda key: key.upper(),
+        on_evict=lambda key, value: evicted.append((key, value)),
+    )
+    values.get_or_create("a")
+    values.get_or_create("b")
+    values.remove("b")
+
+    # Explicit removal is not an eviction
+    assert evicted == [("a", "A")]
@@ -0,0 +1,67 @@
+"""Tests for the runner registry's active-thread check."""
+import asyncio
+
+import pytest
+
+from src.slack import handlers  # noqa: F401  (import order: src.slack before src.graph)
+from src.graph import runner
+from src.slack.session import SessionIdentity
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Fake checkpoint lookups: thread_id -> has checkpoint, recording calls."""
+    from src.db import checkpointer
+
+    calls = []
+    existing = {"T1:C1:1.0"}
+
+    async def thread_has_checkpoint(thread_id: str) -> bool:
+        calls.append(thread_id)
+        return thread_id in existing
+
+    monkeypatch.setattr(checkpointer, "thread_has_checkpoint", thread_has_checkpoint)
+    monkeypatch.setattr(runner, "_runners", None)
+    monkeypatch.setattr(runner, "_presence", None)
+    return calls
+
+
+def test_evicted_thread_with_checkpoint_is_active(lookups):
+    identity = SessionIdentity(team_id="T1", channel_id="C1", thread_ts="1.0")
+    assert asyncio.run(runner.is_active_session(identity)) is True
+
+
+def test_thread_without_checkpoint_is_inactive(lookups):
+    identity = SessionIdentity(team_id="T1", channel_id="C1", thread_ts="2.0")
+    assert asyncio.run(runner.is_active_session(identity)) is False
+
+
+def test_lookups_are_cached(lookups):
+    identity = SessionIdentity(team_id="T1", channel_id="C1", thread_ts="2.0")
+
+    async def run():
+        for _ in range(5):
+            await runner.is_active_session(identity)
+
+    asyncio.run(run())
+    assert lookups == [identity.session_id]
+
+
+def test_cached_answer_expires(lookups, monkeypatch, fake_clock):
+    monkeypatch.setattr(runner, "time", fake_clock)
+    identity = SessionIdentity(team_id="T1", channel_id="C1", thread_ts="2.0")
+    ttl = runner.get_settings().session_presence_cache_seconds
+
+    asyncio.run(runner.is_active_session(identity))
+    fake_clock.advance(ttl + 1)
+    asyncio.run(runner.is_active_session(identity))
+
+    assert len(lookups) == 2
+
+
+def test_live_runner_needs_no_lookup(lookups):
+    identity = SessionIdentity(team_id="T1", channel_id="C1", thread_ts="3.0")
+    runner._get_runner_registry().get_or_create(identity.session_id, lambda: object())
+
+    assert asyncio.run(runner.is_active_session(identity)) is True
+    assert lookups == []
@@ -0,0 +1,76 @@
+"""Tests for GraphRunner turn reentrancy."""
+import asyncio
+
+import pytest
+
+from src.slack import handlers  # noqa: F401  (import order: src.slack before src.graph)
+from src.graph.runner import GraphRunner
+from src.slack import session
+from src.slack.session import SessionIdentity
+
+
+class FakeGraph:
+    """Records checkpoint updates."""
+
+    def __init__(self):
+        self.updates = []
+
+    async def aupdate_state(self, config, values):
+        self.updates.append(dict(values))
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    # Fresh locks: asyncio locks bind to the event loop of each test
+    monkeypatch.setattr(session, "_session_locks", None)
+    runner = GraphRunner(SessionIdentity(team_id="T1", channel_id="C1", thread_ts="1.0"))
+    runner.graph = FakeGraph()
+
+    async def get_current_state():
+        return {"pending_questions": None}
+
+    monkeypatch.setattr(runner, "_get_current_state", get_current_state)
+    return runner
+
+
+def test_nested_turn_joins_outer_turn(runner):
+    async def run():
+        async with runner.turn() as turn:
+            turn.update(persona="security")
+            # Would deadlock on the session lock if turns were not reentrant
+            await runner.store_pending_questions({"question_id": "q1"})
+            assert turn.state["pending_questions"] == {"question_id": "q1"}
+
+    asyncio.run(run())
+    # One write for the whole turn, nested changes included
+    assert runner.graph.updates == [
+        {"persona": "security", "pending_questions": {"question_id": "q1"}}
+    ]
+
+
+def test_other_task_waits_for_the_turn(runner):
+    async def run():
+        order = []
+
+        async def other():
+            async with runner.turn():
+                order.append("other")
+
+        async with runner.turn():
+            task = asyncio.create_task(other())
+            await asyncio.sleep(0.01)
+            order.append("outer")
+        await task
+        return order
+
+    assert asyncio.run(run()) == ["outer", "other"]
+
+
+def test_sequential_turns_take_the_lock_again(runner):
+    async def run():
+        async with runner.turn() as first:
+            first.update(persona="pm")
+        async with runner.turn() as second:
+            assert second is not first
+
+    asyncio.run(run())
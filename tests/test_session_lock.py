@@ -0,0 +1,48 @@
+"""Tests for session lock leases and the checkpoint write guard."""
+import asyncio
+
+import pytest
+
+from src.db import session_lock
+from src.db.checkpointer import TracedPostgresSaver
+from src.db.session_lock import SessionLease, SessionLockLost, check_current_lease
+
+
+@pytest.fixture
+def lease():
+    lease = SessionLease("T1:C1:1.0", max_hold_seconds=60)
+    token = session_lock._current_lease.set(lease)
+    yield lease
+    session_lock._current_lease.reset(token)
+
+
+def test_no_lease_outside_distributed_lock():
+    check_current_lease()
+
+
+def test_valid_lease_passes(lease):
+    assert lease.valid
+    check_current_lease()
+
+
+def test_lost_lease_raises(lease):
+    lease.lost = True
+    with pytest.raises(SessionLockLost):
+        check_current_lease()
+
+
+def test_lease_past_max_hold_raises(lease):
+    lease.deadline -= 61
+    assert not lease.valid
+    with pytest.raises(SessionLockLost):
+        check_current_lease()
+
+
+def test_checkpointer_refuses_writes_after_lease_lost(lease):
+    saver = TracedPostgresSaver.__new__(TracedPostgresSaver)
+    lease.lost = True
+
+    with pytest.raises(SessionLockLost):
+        asyncio.run(saver.aput({}, {}, {}, {}))
+    with pytest.raises(SessionLockLost):
+        asyncio.run(saver.aput_writes({}, [], "task"))
@@ -0,0 +1,52 @@
+"""Tests for trace recording and the JSONL export writer."""
+import json
+import threading
+
+from src import tracing
+from src.tracing import Span, TraceRecorder
+
+
+def make_root(duration: float = 0.01) -> Span:
+    root = Span(name="turn", kind="turn")
+    root.end = root.start + duration
+    return root
+
+
+def test_export_runs_off_the_calling_thread(tmp_path, monkeypatch):
+    path = tmp_path / "traces.jsonl"
+    recorder = TraceRecorder(slowest_size=5, max_sessions=5, export_path=str(path))
+    writers = []
+    real_open = open
+
+    def recording_open(*args, **kwargs):
+        writers.append(threading.current_thread())
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(tracing, "open", recording_open, raising=False)
+    recorder.record("T1:C1:1.0", make_root())
+    recorder.record("T1:C1:2.0", make_root())
+    recorder.flush()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [t["session_id"] for t in lines] == ["T1:C1:1.0", "T1:C1:2.0"]
+    assert writers and threading.current_thread() not in writers
+
+
+def test_export_errors_are_counted(tmp_path):
+    recorder = TraceRecorder(slowest_size=5, max_sessions=5, export_path=str(tmp_path))
+    recorder.record("T1:C1:1.0", make_root())
+    recorder.flush()
+    assert recorder.get_stats()["export_errors"] == 1
+
+
+def test_full_export_queue_drops_traces(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "EXPORT_QUEUE_SIZE", 1)
+    recorder = TraceRecorder(slowest_size=5, max_sessions=5, export_path=str(tmp_path / "t.jsonl"))
+    # Stand-in for a busy writer: nothing drains the queue
+    recorder._export_thread = threading.current_thread()
+
+    recorder.record("T1:C1:1.0", make_root())
+    recorder.record("T1:C1:2.0", make_root())
+
+    assert recorder.get_stats()["export_dropped"] == 1
+    assert len(recorder.get_slowest_turns()) == 2
@@ -0,0 +1,74 @@
+"""Tests for validation reuse on unchanged drafts."""
+import asyncio
+
+import pytest
+
+from src.slack import handlers  # noqa: F401  (import order: src.slack before src.graph)
+from src.graph.nodes import validation
+from src.personas.types import ValidationFindings
+from src.schemas.draft import TicketDraft
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Fake LLM validation and persona validators, recording calls."""
+    calls = {"llm": 0, "validators": []}
+    outcome = {"llm_ok": True, "timed_out": []}
+
+    async def llm_validation(draft):
+        calls["llm"] += 1
+        return validation.ValidationReport(is_valid=True, quality_score=90), outcome["llm_ok"]
+
+    async def run_persona_validators(draft, persona, context=None, changed_fields=None, previous=None):
+        calls["validators"].append(changed_fields)
+        return ValidationFindings(validators_run=["scope"], timed_out=list(outcome["timed_out"]))
+
+    monkeypatch.setattr(validation, "_llm_validation", llm_validation)
+    monkeypatch.setattr(validation, "run_persona_validators", run_persona_validators)
+    calls["outcome"] = outcome
+    return calls
+
+
+def run_twice(calls) -> dict:
+    draft = TicketDraft(title="Export", problem="Users cannot export reports")
+    state = {"draft": draft, "persona": "pm", "step_count": 0}
+    state.update(asyncio.run(validation.validation_node(state)))
+    calls["outcome"].update(llm_ok=True, timed_out=[])
+    return asyncio.run(validation.validation_node(state))
+
+
+def test_complete_run_is_reused(calls):
+    result = run_twice(calls)
+    assert calls["llm"] == 1
+    assert len(calls["validators"]) == 1
+    assert "validation_report" not in result
+
+
+def test_timed_out_validators_are_rerun(calls):
+    calls["outcome"]["timed_out"] = ["scope_check"]
+    result = run_twice(calls)
+
+    # The LLM report is kept; only the validators run again
+    assert calls["llm"] == 1
+    assert calls["validators"][1] == set()
+    assert result["validated_draft"]["validators_complete"] is True
+
+
+def test_rule_based_fallback_is_retried(calls):
+    calls["outcome"]["llm_ok"] = False
+    result = run_twice(calls)
+
+    assert calls["llm"] == 2
+    assert result["validated_draft"]["report_complete"] is True
+
+
+def test_can_reuse_skips_timed_out_validator():
+    class Validator:
+        name = "scope"
+        depends_on = ("title",)
+
+    previous = ValidationFindings(validators_run=["scope"], timed_out=["scope"])
+    assert not validation._can_reuse(Validator(), set(), previous)
+    previous = ValidationFindings(validators_run=["scope"])
+    assert validation._can_reuse(Validator(), set(), previous)
+    assert not validation._can_reuse(Validator(), {"title"}, previous)